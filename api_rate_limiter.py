@@ -136,6 +136,44 @@ class RateLimiter:
                 "minute_remaining": minute_limit - (minute_count + 1)
             }
     
+    def charge_units(self, api_key: str, daily_limit: int, units: int) -> Tuple[bool, Dict]:
+        """
+        Charge extra units against the daily limit of an already counted request.
+        
+        Used by batch endpoints so a request for N items costs N daily units.
+        The per-minute limit still counts the batch as one request.
+        
+        Args:
+            api_key: API key
+            daily_limit: Daily request limit
+            units: Extra units to charge
+            
+        Returns:
+            Tuple of (allowed, limits); nothing is charged when not allowed
+        """
+        with self.lock:
+            now = time.time()
+            today_timestamp = int(now / (24 * 60 * 60)) * (24 * 60 * 60)
+            counts = self.daily_request_counts.setdefault(api_key, {})
+            daily_count = sum(counts.values())
+            
+            if daily_count + units > daily_limit:
+                return False, {
+                    "allowed": False,
+                    "reason": "daily_limit_exceeded",
+                    "daily_limit": daily_limit,
+                    "daily_count": daily_count,
+                    "reset_at": today_timestamp + (24 * 60 * 60)
+                }
+            
+            counts[today_timestamp] = counts.get(today_timestamp, 0) + units
+            
+            return True, {
+                "allowed": True,
+                "daily_limit": daily_limit,
+                "daily_remaining": daily_limit - (daily_count + units)
+            }
+    
     def get_usage_stats(self, api_key: str = None) -> Dict:
         """
         Get usage statistics.
@@ -210,6 +248,21 @@ def check_rate_limit(api_key: str, daily_limit: int, minute_limit: int = 20) ->
     return get_rate_limiter().check_rate_limit(api_key, daily_limit, minute_limit)
 
 
+def charge_units(api_key: str, daily_limit: int, units: int) -> Tuple[bool, Dict]:
+    """
+    Charge extra units against the daily limit of an already counted request.
+    
+    Args:
+        api_key: API key
+        daily_limit: Daily request limit
+        units: Extra units to charge
+        
+    Returns:
+        Tuple of (allowed, limits)
+    """
+    return get_rate_limiter().charge_units(api_key, daily_limit, units)
+
+
 def get_usage_stats(api_key: str = None) -> Dict:
     """
     Get usage statistics.
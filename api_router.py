@@ -5,12 +5,15 @@ This module implements the API layer for the LLMPageRank V3 system,
 providing external access to the trust signal data and benchmarks.
 """
 
+import base64
 import json
 import os
 import time
 import logging
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from fastapi import FastAPI, Depends, HTTPException, Header, Request, status
 from fastapi.responses import JSONResponse
@@ -23,6 +26,8 @@ import database as db
 from category_matrix import category_matrix, calculate_foma_score, get_peer_domains
 from crawl_planner import get_prioritized_domains
 from prompt_validator import get_invalid_prompts
+from fast_response import ORJSONResponse
+from request_profiler import install_profiler
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -30,13 +35,22 @@ logger = logging.getLogger(__name__)
 
 # Constants
 API_KEYS_FILE = f"{DATA_DIR}/api_keys.json"
+VIEW_CACHE_TTL_SECONDS = 60  # Sorted views are rebuilt at most once per partner polling interval
+MAX_CACHED_VIEWS = 256  # Least recently used sorted views are evicted beyond this
+MAX_PAGE_SIZE = 500
+SCORE_KEY_TYPES = (int, float)  # Score sort keys decode from JSON as either
+
+# Fields that can be requested with fields= per endpoint
+TOP_DOMAIN_FIELDS = ("domain", "llmrank", "structure_score", "consensus_score", "category", "timestamp")
+DELTA_FIELDS = ("domain", "category", "current_score", "previous_score", "delta", "direction", "timestamp")
 
 
 # Initialize FastAPI app
 app = FastAPI(
     title="LLMPageRank API",
     description="API for accessing LLMPageRank trust signal intelligence data",
-    version=SYSTEM_VERSION
+    version=SYSTEM_VERSION,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -48,6 +62,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Opt-in request profiling (see request_profiler.py)
+install_profiler(app)
+
 # Load API keys
 def load_api_keys() -> Dict[str, Dict]:
     """
@@ -128,6 +145,208 @@ async def verify_api_key(
     
     return api_key_info
 
+class SortedView:
+    """
+    Rows sorted by a unique key, paged with keyset cursors.
+    """
+    
+    def __init__(self, rows: List[Dict], keys: List[Tuple], total: int = 0,
+                 key_types: Tuple = ()):
+        """
+        Initialize the view.
+        
+        Args:
+            rows: Rows in sort order
+            keys: Sort key of each row, ascending and unique
+            total: Total number of source items behind the view
+            key_types: Accepted type (or tuple of types) of each key element
+        """
+        self.rows = rows
+        self.keys = keys
+        self.total = total
+        self.key_types = key_types
+    
+    def accepts(self, key: Tuple) -> bool:
+        """
+        Check that a cursor key has the shape of this view's keys.
+        
+        Args:
+            key: Decoded cursor key
+            
+        Returns:
+            True if the key can be compared with the view's keys
+        """
+        if len(key) != len(self.key_types):
+            return False
+        
+        return all(
+            isinstance(part, expected) and not isinstance(part, bool)
+            for part, expected in zip(key, self.key_types)
+        )
+    
+    def page(self, after: Optional[Tuple], limit: int) -> Tuple[List[Dict], Optional[Tuple]]:
+        """
+        Get the rows following a cursor key.
+        
+        Args:
+            after: Sort key of the last row already returned, or None
+            limit: Maximum number of rows
+            
+        Returns:
+            Tuple of (rows, key of the last row if more rows follow)
+            
+        Raises:
+            HTTPException: If the cursor key does not match the view's keys
+        """
+        if after is not None and not self.accepts(after):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        
+        start = bisect_right(self.keys, after) if after is not None else 0
+        end = min(start + limit, len(self.rows))
+        next_key = self.keys[end - 1] if end < len(self.rows) and end > start else None
+        
+        return self.rows[start:end], next_key
+
+
+# Cached sorted views, least recently used first: name -> (expires, version, view)
+_sorted_views: "OrderedDict[str, Tuple[float, Any, SortedView]]" = OrderedDict()
+
+def get_sorted_view(name: str, builder, version: Any = None) -> Optional[SortedView]:
+    """
+    Get a cached sorted view, rebuilding it when expired or outdated.
+    
+    View names include caller-supplied categories, so builders returning
+    None (unknown category) are not cached and at most MAX_CACHED_VIEWS
+    views are kept.
+    
+    Args:
+        name: View name
+        builder: Callable returning a SortedView, or None
+        version: Optional version of the source data
+        
+    Returns:
+        Sorted view, or None if the builder returned None
+    """
+    now = time.time()
+    cached = _sorted_views.get(name)
+    
+    if cached is not None and cached[0] > now and cached[1] == version:
+        _sorted_views.move_to_end(name)
+        return cached[2]
+    
+    view = builder()
+    if view is None:
+        _sorted_views.pop(name, None)
+        return None
+    
+    _sorted_views[name] = (now + VIEW_CACHE_TTL_SECONDS, version, view)
+    _sorted_views.move_to_end(name)
+    
+    # Drop expired views first, then the least recently used
+    for expired in [key for key, entry in _sorted_views.items() if entry[0] <= now]:
+        del _sorted_views[expired]
+    while len(_sorted_views) > MAX_CACHED_VIEWS:
+        _sorted_views.popitem(last=False)
+    
+    return view
+
+def encode_cursor(view_name: str, key: Optional[Tuple]) -> Optional[str]:
+    """
+    Encode a sort key as an opaque cursor bound to a view.
+    
+    Args:
+        view_name: Name of the view the key belongs to
+        key: Sort key or None
+        
+    Returns:
+        URL-safe cursor string or None
+    """
+    if key is None:
+        return None
+    
+    raw = json.dumps([view_name, list(key)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(view_name: str, cursor: Optional[str]) -> Optional[Tuple]:
+    """
+    Decode a cursor produced by encode_cursor for the same view.
+    
+    Args:
+        view_name: Name of the view being paged
+        cursor: Cursor string or None
+        
+    Returns:
+        Sort key or None
+        
+    Raises:
+        HTTPException: If the cursor is malformed or belongs to another view
+    """
+    if not cursor:
+        return None
+    
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        name, key = json.loads(raw)
+        if name != view_name or not isinstance(key, list):
+            raise ValueError("cursor does not belong to this view")
+        return tuple(key)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+def parse_fields(fields: Optional[str], allowed: Tuple[str, ...]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated fields= projection.
+    
+    Args:
+        fields: Requested fields or None for all fields
+        allowed: Fields the endpoint can return
+        
+    Returns:
+        List of fields or None
+        
+    Raises:
+        HTTPException: If an unknown field is requested
+    """
+    if not fields:
+        return None
+    
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in allowed]
+    
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+    
+    return requested
+
+def project(rows: List[Any], fields: Optional[List[str]]) -> List[Any]:
+    """
+    Keep only the requested fields of each row.
+    
+    Args:
+        rows: Rows to project
+        fields: Fields to keep, or None to keep all
+        
+    Returns:
+        Projected rows
+    """
+    if fields is None:
+        return rows
+    
+    return [{f: row.get(f) for f in fields} if isinstance(row, dict) else row for row in rows]
+
+def clamp_limit(limit: int) -> int:
+    """Clamp a page size to 1..MAX_PAGE_SIZE."""
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
@@ -225,13 +444,16 @@ async def get_domain_score(domain: str, api_key_info: Dict = Depends(verify_api_
 
 # Top domains by category endpoint
 @app.get("/api/v1/top/{category}")
-async def get_top_domains(category: str, limit: int = 10, api_key_info: Dict = Depends(verify_api_key)):
+async def get_top_domains(category: str, limit: int = 10, cursor: Optional[str] = None,
+                          fields: Optional[str] = None, api_key_info: Dict = Depends(verify_api_key)):
     """
     Get top domains by visibility score for a category.
     
     Args:
         category: Category name
         limit: Maximum number of domains to return
+        cursor: Cursor from a previous page's next_cursor
+        fields: Comma-separated fields to return for each domain
         api_key_info: API key information
     
     Returns:
@@ -240,15 +462,45 @@ async def get_top_domains(category: str, limit: int = 10, api_key_info: Dict = D
     Raises:
         HTTPException: If category not found
     """
-    # Get all domains in category
-    domains_by_category = db.load_domains_by_category()
+    requested_fields = parse_fields(fields, TOP_DOMAIN_FIELDS)
+    view_name = f"top:{category}"
+    after = decode_cursor(view_name, cursor)
     
-    if category not in domains_by_category:
+    view = get_sorted_view(view_name, lambda: build_top_domains_view(category))
+    
+    if view is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Category not found: {category}"
         )
     
+    rows, next_key = view.page(after, clamp_limit(limit))
+    
+    # Return top N domains
+    return {
+        "category": category,
+        "domains": project(rows, requested_fields),
+        "total_domains": view.total,
+        "next_cursor": encode_cursor(view_name, next_key),
+        "timestamp": time.time()
+    }
+
+def build_top_domains_view(category: str) -> Optional[SortedView]:
+    """
+    Build the visibility-sorted view of a category.
+    
+    Args:
+        category: Category name
+        
+    Returns:
+        Sorted view keyed by (-llmrank, domain), or None if the category is unknown
+    """
+    # Get all domains in category
+    domains_by_category = db.load_domains_by_category()
+    
+    if category not in domains_by_category:
+        return None
+    
     # Get domains in category
     category_domains = domains_by_category[category]
     
@@ -275,30 +527,48 @@ async def get_top_domains(category: str, limit: int = 10, api_key_info: Dict = D
             "timestamp": latest_result.get("timestamp", time.time())
         })
     
-    # Sort by visibility score (descending)
-    scored_domains.sort(key=lambda x: x["llmrank"], reverse=True)
+    # Sort by visibility score (descending), domain as tie-breaker
+    scored_domains.sort(key=lambda x: (-x["llmrank"], x["domain"]))
+    keys = [(-x["llmrank"], x["domain"]) for x in scored_domains]
     
-    # Return top N domains
-    return {
-        "category": category,
-        "domains": scored_domains[:limit],
-        "total_domains": len(category_domains),
-        "timestamp": time.time()
-    }
+    return SortedView(scored_domains, keys, total=len(category_domains),
+                      key_types=(SCORE_KEY_TYPES, str))
 
 # Visibility deltas endpoint
 @app.get("/api/v1/visibility-deltas")
-async def get_visibility_deltas(limit: int = 10, api_key_info: Dict = Depends(verify_api_key)):
+async def get_visibility_deltas(limit: int = 10, cursor: Optional[str] = None,
+                                fields: Optional[str] = None, api_key_info: Dict = Depends(verify_api_key)):
     """
     Get domains with the biggest changes in visibility.
     
     Args:
         limit: Maximum number of domains to return
+        cursor: Cursor from a previous page's next_cursor
+        fields: Comma-separated fields to return for each domain
         api_key_info: API key information
     
     Returns:
         List of domains with significant visibility changes
     """
+    requested_fields = parse_fields(fields, DELTA_FIELDS)
+    after = decode_cursor("visibility-deltas", cursor)
+    
+    view = get_sorted_view("visibility-deltas", build_visibility_deltas_view)
+    rows, next_key = view.page(after, clamp_limit(limit))
+    
+    return {
+        "deltas": project(rows, requested_fields),
+        "next_cursor": encode_cursor("visibility-deltas", next_key),
+        "timestamp": time.time()
+    }
+
+def build_visibility_deltas_view() -> SortedView:
+    """
+    Build the view of significant visibility changes.
+    
+    Returns:
+        Sorted view keyed by (-|delta|, domain)
+    """
     # Get all domains
     all_domains = db.get_all_tested_domains()
     
@@ -332,22 +602,25 @@ async def get_visibility_deltas(limit: int = 10, api_key_info: Dict = Depends(ve
             "timestamp": history[0].get("timestamp", time.time())
         })
     
-    # Sort by absolute delta (descending)
-    domains_with_deltas.sort(key=lambda x: abs(x["delta"]), reverse=True)
+    # Sort by absolute delta (descending), domain as tie-breaker
+    domains_with_deltas.sort(key=lambda x: (-abs(x["delta"]), x["domain"]))
+    keys = [(-abs(x["delta"]), x["domain"]) for x in domains_with_deltas]
     
-    return {
-        "deltas": domains_with_deltas[:limit],
-        "timestamp": time.time()
-    }
+    return SortedView(domains_with_deltas, keys, total=len(domains_with_deltas),
+                      key_types=(SCORE_KEY_TYPES, str))
 
 # Prompts by category endpoint
 @app.get("/api/v1/prompts/{category}")
-async def get_prompts(category: str, api_key_info: Dict = Depends(verify_api_key)):
+async def get_prompts(category: str, limit: Optional[int] = None, cursor: Optional[str] = None,
+                      fields: Optional[str] = None, api_key_info: Dict = Depends(verify_api_key)):
     """
     Get prompts used for a specific category.
     
     Args:
         category: Category name
+        limit: Optional maximum number of prompts to return (all when omitted)
+        cursor: Cursor from a previous page's next_cursor
+        fields: Comma-separated fields to return for each prompt
         api_key_info: API key information
     
     Returns:
@@ -363,10 +636,14 @@ async def get_prompts(category: str, api_key_info: Dict = Depends(verify_api_key
             detail=f"No prompts found for category: {category}"
         )
     
-    # Load prompts for category
+    prompts_path = f"{DATA_DIR}/prompts/{category}_prompts.json"
+    view_name = f"prompts:{category}"
+    after = decode_cursor(view_name, cursor)
+    
+    # Load prompts for category; the view is reused until the file changes
     try:
-        with open(f"{DATA_DIR}/prompts/{category}_prompts.json", "r") as f:
-            prompts = json.load(f)
+        version = os.stat(prompts_path).st_mtime_ns
+        view = get_sorted_view(view_name, lambda: build_prompts_view(prompts_path), version)
     except Exception as e:
         logger.error(f"Error loading prompts for {category}: {e}")
         raise HTTPException(
@@ -374,15 +651,39 @@ async def get_prompts(category: str, api_key_info: Dict = Depends(verify_api_key
             detail=f"Error loading prompts: {str(e)}"
         )
     
+    requested_fields = None
+    if fields:
+        allowed = tuple(sorted({key for row in view.rows if isinstance(row, dict) for key in row}))
+        requested_fields = parse_fields(fields, allowed)
+    
+    rows, next_key = view.page(after, clamp_limit(limit) if limit is not None else len(view.rows))
+    
     # Format response
     return {
         "category": category,
-        "prompt_count": len(prompts),
+        "prompt_count": view.total,
         "prompt_version": PROMPT_VERSION,
-        "prompts": prompts,
+        "prompts": project(rows, requested_fields),
+        "next_cursor": encode_cursor(view_name, next_key),
         "timestamp": time.time()
     }
 
+def build_prompts_view(prompts_path: str) -> SortedView:
+    """
+    Build the view of a category's prompts in file order.
+    
+    Args:
+        prompts_path: Path of the category prompts file
+        
+    Returns:
+        Sorted view keyed by (position,)
+    """
+    with open(prompts_path, "r") as f:
+        prompts = json.load(f)
+    
+    return SortedView(prompts, [(i,) for i in range(len(prompts))], total=len(prompts),
+                      key_types=(int,))
+
 # FOMA endpoint
 @app.get("/api/v1/foma/{domain}")
 async def get_foma(domain: str, api_key_info: Dict = Depends(verify_api_key)):
@@ -0,0 +1,169 @@
+"""
+Memory Scoring Benchmark
+
+Compares the batched memory scoring kernel in memory_decay_detector against
+the original per-brand/model implementation on synthetic insights, and
+checks that both produce the same scores.
+
+Usage:
+    python benchmark_memory_scoring.py [--insights 100000] [--brands 5000]
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from memory_decay_detector import MemorySnapshot, calculate_memory_scores
+
+VOCABULARY = [
+    "leading", "dominant", "innovative", "competitive", "advantage", "market",
+    "platform", "payments", "customers", "growth", "pricing", "enterprise",
+    "developer", "integration", "security", "analytics", "retention", "brand",
+    "the", "and", "with", "for", "its", "across", "strong", "signal"
+]
+
+MODELS = ["gpt-4o", "claude-3-opus", "gemini-pro"]
+
+
+def legacy_calculate_memory_score(brand: str, model: str, insights: List[Dict],
+                                  current_time: float) -> MemorySnapshot:
+    """Original per-group implementation of calculate_memory_score."""
+    if not insights:
+        return MemorySnapshot(brand, model, 0.0, 0.0, current_time, 0, 0.0, 0.0)
+
+    recent_insights = [
+        insight for insight in insights
+        if current_time - insight.get('timestamp', 0) < (30 * 24 * 3600)
+    ]
+
+    if not recent_insights:
+        recent_insights = insights[-5:]
+
+    insight_count = len(recent_insights)
+
+    quality_scores = []
+    for insight in recent_insights:
+        quality = insight.get('quality_score', 0)
+        age_days = (current_time - insight.get('timestamp', 0)) / 86400
+        weight = max(0.1, 1.0 - (age_days / 30))
+        quality_scores.append(quality * weight)
+
+    avg_quality = np.mean(quality_scores) if quality_scores else 0
+
+    citation_scores = []
+    for insight in recent_insights:
+        content = insight.get('content', '')
+        brand_clean = brand.replace('.com', '').replace('.', ' ')
+
+        citation_score = 0
+        if brand_clean.lower() in content.lower():
+            citation_score += 0.3
+        if any(word in content.lower() for word in ['leading', 'dominant', 'innovative']):
+            citation_score += 0.2
+        if any(word in content.lower() for word in ['competitive', 'advantage', 'market']):
+            citation_score += 0.3
+        if len(content) > 300:
+            citation_score += 0.2
+
+        citation_scores.append(min(citation_score, 1.0))
+
+    citation_strength = np.mean(citation_scores) if citation_scores else 0
+
+    if len(recent_insights) > 1:
+        all_words = []
+        for insight in recent_insights:
+            words = insight.get('content', '').lower().split()
+            all_words.extend(words)
+
+        word_freq = {}
+        for word in all_words:
+            if len(word) > 4:
+                word_freq[word] = word_freq.get(word, 0) + 1
+
+        consistent_terms = sum(1 for count in word_freq.values() if count > 1)
+        semantic_similarity = min(consistent_terms / 10, 1.0)
+    else:
+        semantic_similarity = avg_quality
+
+    memory_score = (
+        avg_quality * 40 +
+        citation_strength * 30 +
+        semantic_similarity * 20 +
+        min(insight_count / 10, 1.0) * 10
+    ) * 100
+
+    confidence = min((insight_count / 5) * 0.5 + avg_quality * 0.5, 1.0)
+
+    return MemorySnapshot(brand, model, memory_score, confidence, current_time,
+                          insight_count, citation_strength, semantic_similarity)
+
+
+def generate_groups(num_insights: int, num_brands: int, seed: int = 42) -> List[Tuple[str, str, List[Dict]]]:
+    """Generate synthetic insights grouped by (brand, model)."""
+    rng = random.Random(seed)
+    now = time.time()
+    brands = [f"brand{i}.com" for i in range(num_brands)]
+    groups = {}
+
+    for _ in range(num_insights):
+        brand = rng.choice(brands)
+        model = rng.choice(MODELS)
+        words = rng.choices(VOCABULARY, k=rng.randint(10, 90))
+        if rng.random() < 0.5:
+            words.insert(0, brand.replace('.com', ''))
+
+        groups.setdefault((brand, model), []).append({
+            'domain': brand,
+            'model': model,
+            'timestamp': now - rng.uniform(0, 45 * 86400),
+            'quality_score': rng.random(),
+            'content': " ".join(words).capitalize()
+        })
+
+    return [(brand, model, insights) for (brand, model), insights in groups.items()]
+
+
+def run_benchmark(num_insights: int, num_brands: int) -> Dict:
+    """Time both implementations and compare their outputs."""
+    groups = generate_groups(num_insights, num_brands)
+    current_time = time.time()
+
+    start = time.perf_counter()
+    legacy = [legacy_calculate_memory_score(b, m, i, current_time) for b, m, i in groups]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = calculate_memory_scores(groups, current_time)
+    batched_seconds = time.perf_counter() - start
+
+    max_diff = max(
+        abs(a.memory_score - b.memory_score) + abs(a.confidence - b.confidence)
+        for a, b in zip(legacy, batched)
+    )
+
+    return {
+        'insights': num_insights,
+        'groups': len(groups),
+        'legacy_seconds': legacy_seconds,
+        'batched_seconds': batched_seconds,
+        'speedup': legacy_seconds / batched_seconds if batched_seconds else float('inf'),
+        'max_score_difference': max_diff
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark memory scoring implementations")
+    parser.add_argument("--insights", type=int, default=100000, help="Number of synthetic insights")
+    parser.add_argument("--brands", type=int, default=5000, help="Number of synthetic brands")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.insights, args.brands)
+
+    print(f"Insights: {results['insights']:,} in {results['groups']:,} brand/model groups")
+    print(f"Legacy:   {results['legacy_seconds']:.3f}s")
+    print(f"Batched:  {results['batched_seconds']:.3f}s")
+    print(f"Speedup:  {results['speedup']:.1f}x")
+    print(f"Max score difference: {results['max_score_difference']:.2e}")
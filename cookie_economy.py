@@ -10,6 +10,7 @@ import os
 import json
 import logging
 import random
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
@@ -28,6 +29,9 @@ EVOLUTION_MINIMUM = 0.05  # Minimum required improvement per cycle
 CONSECUTIVE_FAILURE_LIMIT = 2  # Very low tolerance for repeated failures
 STARVATION_PENALTY = 5  # Cookie penalty for other agents when one starves
 QUALITY_DECLINE_PENALTY = 8  # Harsh penalty for declining quality
+SNAPSHOT_INTERVAL = 500  # Journal records between full state snapshots
+NOVELTY_HISTORY_LIMIT = 1000  # Past insights per (category, domain) compared for novelty
+NOVELTY_HISTORY_DAYS = None   # Ignore past insights older than this for novelty (None = no limit)
 
 # File paths
 DATA_DIR = "data/cookie_economy"
@@ -37,6 +41,13 @@ COOKIE_LEDGER_PATH = os.path.join(DATA_DIR, "cookie_ledger.json")
 AGENT_PERFORMANCE_PATH = os.path.join(DATA_DIR, "agent_performance.json")
 INSIGHT_HISTORY_PATH = os.path.join(DATA_DIR, "insight_history.json")
 
+# Write-ahead journal: the active file holds records since the last snapshot,
+# older records are kept as closed segments for point-in-time recovery
+JOURNAL_DIR = os.path.join(DATA_DIR, "journal")
+os.makedirs(JOURNAL_DIR, exist_ok=True)
+
+JOURNAL_PATH = os.path.join(JOURNAL_DIR, "current.jsonl")
+
 
 class CookieEconomy:
     """
@@ -53,8 +64,17 @@ class CookieEconomy:
         self.insight_history = []
         self.agent_performance = {}
         
+        # Novelty index: (category, domain) -> deque of (timestamp, brand bitset)
+        self.novelty_index = {}
+        self.brand_bits = {}
+        
+        # Journal state
+        self.journal_seq = 0
+        self.records_since_snapshot = 0
+        
         # Load existing data if available
         self._load_data()
+        self._rebuild_novelty_index()
     
     def _load_data(self):
         """Load existing data from files."""
@@ -66,6 +86,7 @@ class CookieEconomy:
                     self.current_cycle_start = datetime.fromisoformat(ledger_data.get("current_cycle_start", datetime.now().isoformat()))
                     self.current_cycle_end = datetime.fromisoformat(ledger_data.get("current_cycle_end", (datetime.now() + timedelta(days=COOKIE_CYCLE_DAYS)).isoformat()))
                     self.agent_balances = ledger_data.get("agent_balances", {})
+                    self.journal_seq = ledger_data.get("journal_seq", 0)
                     
             if os.path.exists(AGENT_PERFORMANCE_PATH):
                 with open(AGENT_PERFORMANCE_PATH, 'r') as f:
@@ -74,8 +95,11 @@ class CookieEconomy:
             if os.path.exists(INSIGHT_HISTORY_PATH):
                 with open(INSIGHT_HISTORY_PATH, 'r') as f:
                     self.insight_history = json.load(f)
+            
+            # Roll forward any journal records written after the snapshot
+            replayed = self._replay_journal()
                     
-            logger.info("Cookie economy data loaded successfully")
+            logger.info(f"Cookie economy data loaded successfully ({replayed} journal records replayed)")
         except Exception as e:
             logger.error(f"Error loading cookie economy data: {e}")
             # Initialize with default values
@@ -85,9 +109,175 @@ class CookieEconomy:
             self.agent_balances = {}
             self.insight_history = []
             self.agent_performance = {}
+            self.journal_seq = 0
+    
+    def _read_journal(self, path: str) -> List[Dict]:
+        """
+        Read journal records from a file.
+        
+        A torn final line (crash during append) is skipped.
+        
+        Args:
+            path: Journal file path
+            
+        Returns:
+            List of journal records in sequence order
+        """
+        records = []
+        
+        if not os.path.exists(path):
+            return records
+        
+        with open(path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable journal record in {path}")
+        
+        return records
+    
+    def _replay_journal(self) -> int:
+        """
+        Apply journal records newer than the loaded snapshot.
+        
+        Returns:
+            Number of records replayed
+        """
+        replayed = 0
+        
+        for record in self._read_journal(JOURNAL_PATH):
+            if record.get("seq", 0) <= self.journal_seq:
+                continue
+            
+            self._apply_journal_record(record)
+            self.journal_seq = record["seq"]
+            replayed += 1
+        
+        self.records_since_snapshot = replayed
+        return replayed
+    
+    def _apply_journal_record(self, record: Dict):
+        """
+        Apply a single journal record to in-memory state.
+        
+        Args:
+            record: Journal record
+        """
+        record_type = record.get("type")
+        agent_name = record.get("agent_name")
+        
+        if record_type == "register":
+            self.agent_balances.setdefault(agent_name, 0)
+            self.agent_performance.setdefault(agent_name, record.get("agent_performance", {}))
+        
+        elif record_type == "submission":
+            self.insight_history.append(record["insight"])
+            self.cookie_pool = record["cookie_pool"]
+            self.agent_balances[agent_name] = record["agent_balance"]
+            self.agent_performance[agent_name] = record["agent_performance"]
+        
+        elif record_type == "cycle":
+            self.current_cycle_start = datetime.fromisoformat(record["cycle_start"])
+            self.current_cycle_end = datetime.fromisoformat(record["cycle_end"])
+            self.cookie_pool = record["cookie_pool"]
+            self.agent_balances = {}
+    
+    def _append_journal(self, record_type: str, **fields):
+        """
+        Append a record to the write-ahead journal.
+        
+        Takes a full snapshot every SNAPSHOT_INTERVAL records. If the append
+        fails, a snapshot is taken immediately so the change already applied
+        in memory is still durable.
+        
+        Args:
+            record_type: Record type (register, submission, cycle)
+            **fields: Record payload
+        """
+        record = {
+            "seq": self.journal_seq + 1,
+            "type": record_type,
+            "timestamp": datetime.now().isoformat()
+        }
+        record.update(fields)
+        
+        try:
+            with open(JOURNAL_PATH, 'a') as f:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            logger.error(f"Error writing cookie economy journal, checkpointing instead: {e}")
+            self.checkpoint()
+            return
+        
+        self.journal_seq = record["seq"]
+        self.records_since_snapshot += 1
+        
+        if self.records_since_snapshot >= SNAPSHOT_INTERVAL:
+            self.checkpoint()
+    
+    def checkpoint(self):
+        """
+        Write a full snapshot and close the active journal segment.
+        
+        The closed segment is kept so balances can be recovered for any
+        point in time with get_balances_at.
+        """
+        if not self._save_data():
+            return
+        
+        if os.path.exists(JOURNAL_PATH) and os.path.getsize(JOURNAL_PATH) > 0:
+            segment_path = os.path.join(JOURNAL_DIR, f"segment_{self.journal_seq:012d}.jsonl")
+            os.replace(JOURNAL_PATH, segment_path)
+        
+        self.records_since_snapshot = 0
     
-    def _save_data(self):
-        """Save current data to files."""
+    def get_balances_at(self, timestamp: datetime) -> Dict[str, int]:
+        """
+        Recover agent cookie balances as of a point in time from the journal.
+        
+        Args:
+            timestamp: Point in time to recover
+            
+        Returns:
+            Dictionary of agent name to cookie balance
+        """
+        segments = sorted(
+            os.path.join(JOURNAL_DIR, name)
+            for name in os.listdir(JOURNAL_DIR)
+            if name.startswith("segment_")
+        )
+        
+        balances = {}
+        cutoff = timestamp.isoformat()
+        
+        for path in segments + [JOURNAL_PATH]:
+            for record in self._read_journal(path):
+                if record.get("timestamp", "") > cutoff:
+                    return balances
+                
+                record_type = record.get("type")
+                if record_type == "register":
+                    balances.setdefault(record["agent_name"], 0)
+                elif record_type == "submission":
+                    balances[record["agent_name"]] = record["agent_balance"]
+                elif record_type == "cycle":
+                    balances = {}
+        
+        return balances
+    
+    def _save_data(self) -> bool:
+        """
+        Save a full snapshot of current data to files.
+        
+        Returns:
+            Success flag
+        """
         try:
             # Save cookie ledger
             ledger_data = {
@@ -95,6 +285,7 @@ class CookieEconomy:
                 "current_cycle_start": self.current_cycle_start.isoformat(),
                 "current_cycle_end": self.current_cycle_end.isoformat(),
                 "agent_balances": self.agent_balances,
+                "journal_seq": self.journal_seq,
                 "last_updated": datetime.now().isoformat()
             }
             
@@ -110,8 +301,10 @@ class CookieEconomy:
                 json.dump(self.insight_history, f, indent=2)
                 
             logger.info("Cookie economy data saved successfully")
+            return True
         except Exception as e:
             logger.error(f"Error saving cookie economy data: {e}")
+            return False
     
     def _check_cycle(self):
         """Check if the current cookie cycle has ended and start a new one if needed."""
@@ -123,7 +316,13 @@ class CookieEconomy:
             self.current_cycle_start = now
             self.current_cycle_end = now + timedelta(days=COOKIE_CYCLE_DAYS)
             self.cookie_pool = COOKIE_POOL_SIZE
-            self._save_data()
+            self._append_journal(
+                "cycle",
+                cycle_start=self.current_cycle_start.isoformat(),
+                cycle_end=self.current_cycle_end.isoformat(),
+                cookie_pool=self.cookie_pool
+            )
+            self.checkpoint()
     
     def _end_cycle(self):
         """End the current cookie cycle and record performance metrics with brutal evolution mechanics."""
@@ -364,12 +563,64 @@ class CookieEconomy:
                     "starvation_events": 0
                 }
             
-            self._save_data()
+            self._append_journal(
+                "register",
+                agent_name=agent_name,
+                agent_performance=self.agent_performance[agent_name]
+            )
             logger.info(f"Agent {agent_name} registered in cookie economy")
             return True
         
         return False
     
+    def _brand_bitset(self, brands: List[str]) -> int:
+        """
+        Encode a list of brands as a bitset over the brand vocabulary.
+        
+        Args:
+            brands: Brand names
+            
+        Returns:
+            Integer bitset with one bit per distinct brand
+        """
+        bitset = 0
+        for brand in brands:
+            bit = self.brand_bits.get(brand)
+            if bit is None:
+                bit = len(self.brand_bits)
+                self.brand_bits[brand] = bit
+            bitset |= 1 << bit
+        return bitset
+    
+    def _index_insight(self, insight: Dict):
+        """
+        Add an insight to the novelty index.
+        
+        Args:
+            insight: Recorded insight dictionary
+        """
+        category = insight.get("category", "")
+        domain = insight.get("domain", "")
+        brands = insight.get("brands", [])
+        
+        if not category or not domain or not brands:
+            return
+        
+        key = (category, domain)
+        if key not in self.novelty_index:
+            self.novelty_index[key] = deque(maxlen=NOVELTY_HISTORY_LIMIT)
+        
+        timestamp = insight.get("timestamp", datetime.now().isoformat())
+        self.novelty_index[key].append((timestamp, self._brand_bitset(brands)))
+    
+    def _rebuild_novelty_index(self):
+        """Rebuild the novelty index from the loaded insight history."""
+        self.novelty_index = {}
+        self.brand_bits = {}
+        
+        for insight in self.insight_history:
+            self._index_insight(insight)
+    
     def _calculate_novelty(self, insight: Dict) -> float:
         """
         Calculate novelty score for an insight based on how different it is from
@@ -388,37 +639,32 @@ class CookieEconomy:
         if not category or not domain or not brands:
             return 0.0
         
-        # Find similar insights
-        similar_insights = []
-        
-        for past_insight in self.insight_history:
-            if past_insight.get("category") == category and past_insight.get("domain") == domain:
-                similar_insights.append(past_insight)
+        # Only past insights for the same category and domain are compared
+        similar_insights = self.novelty_index.get((category, domain))
         
         if not similar_insights:
             return 1.0  # Complete novelty if no similar insights
         
-        # Check brand overlap
-        brand_overlaps = []
-        
-        for past_insight in similar_insights:
-            past_brands = past_insight.get("brands", [])
+        # Drop entries that have aged out of the novelty horizon
+        if NOVELTY_HISTORY_DAYS is not None:
+            cutoff = (datetime.now() - timedelta(days=NOVELTY_HISTORY_DAYS)).isoformat()
+            while similar_insights and similar_insights[0][0] < cutoff:
+                similar_insights.popleft()
             
-            if not past_brands:
-                continue
-                
-            # Calculate Jaccard similarity
-            intersection = len(set(brands).intersection(set(past_brands)))
-            union = len(set(brands).union(set(past_brands)))
-            
-            similarity = intersection / union if union > 0 else 0.0
-            brand_overlaps.append(similarity)
+            if not similar_insights:
+                return 1.0
+        
+        # Check brand overlap using Jaccard similarity over brand bitsets
+        bitset = self._brand_bitset(brands)
+        similarity_sum = 0.0
+        
+        for _, past_bitset in similar_insights:
+            intersection = bin(bitset & past_bitset).count("1")
+            union = bin(bitset | past_bitset).count("1")
+            similarity_sum += intersection / union
         
-        if not brand_overlaps:
-            return 1.0
-            
         # Average similarity
-        avg_similarity = sum(brand_overlaps) / len(brand_overlaps)
+        avg_similarity = similarity_sum / len(similar_insights)
         
         # Convert to novelty score
         novelty_score = 1.0 - avg_similarity
@@ -512,7 +758,8 @@ class CookieEconomy:
             })
             
             self.insight_history.append(insight_record)
-            self._save_data()
+            self._index_insight(insight_record)
+            self._journal_submission(agent_name, insight_record)
             
             return 0, quality_score
         
@@ -579,9 +826,10 @@ class CookieEconomy:
         })
         
         self.insight_history.append(insight_record)
+        self._index_insight(insight_record)
         
-        # Save updated data
-        self._save_data()
+        # Journal the submission, award and any applied penalties
+        self._journal_submission(agent_name, insight_record)
         
         # Log with appropriate enthusiasm based on quality
         if quality_score > 0.9:
@@ -591,6 +839,25 @@ class CookieEconomy:
         
         return cookies_earned, combined_score
     
+    def _journal_submission(self, agent_name: str, insight_record: Dict):
+        """
+        Journal the state changes caused by an insight submission.
+        
+        Args:
+            agent_name: Name of the submitting agent
+            insight_record: Recorded insight including award and penalties
+        """
+        self._append_journal(
+            "submission",
+            agent_name=agent_name,
+            insight=insight_record,
+            cookies_earned=insight_record.get("cookies_earned", 0),
+            penalties_applied=insight_record.get("penalties_applied", 0),
+            cookie_pool=self.cookie_pool,
+            agent_balance=self.agent_balances.get(agent_name, 0),
+            agent_performance=self.agent_performance.get(agent_name, {})
+        )
+    
     def get_agent_balance(self, agent_name: str) -> int:
         """
         Get an agent's current cookie balance.
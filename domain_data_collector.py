@@ -189,20 +189,22 @@ class DomainCollector:
                     "query": query
                 }
                 
-                # Update domain memory tracker with rankings
-                for i, domain in enumerate(domains):
-                    rank = i + 1  # Rank 1 is first position
-                    
-                    try:
-                        domain_memory_tracker.update_domain_rank(
-                            domain=domain,
-                            model=model,
-                            query_category=category,
-                            rank=rank,
-                            query_text=query
-                        )
-                    except Exception as e:
-                        logger.error(f"Error updating domain rank: {e}")
+                # Update domain memory tracker with rankings in one batch
+                rank_updates = [
+                    {
+                        "domain": domain,
+                        "model": model,
+                        "query_category": category,
+                        "rank": i + 1,  # Rank 1 is first position
+                        "query_text": query
+                    }
+                    for i, domain in enumerate(domains)
+                ]
+                
+                try:
+                    domain_memory_tracker.update_domain_ranks(rank_updates)
+                except Exception as e:
+                    logger.error(f"Error updating domain ranks: {e}")
             else:
                 # Not implemented for other providers in this version
                 results[model] = {
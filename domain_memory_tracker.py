@@ -9,9 +9,13 @@ calculates memory decay metrics over time.
 import os
 import json
 import logging
+import sqlite3
+import threading
 import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Set
 import numpy as np
 
 # Setup logging
@@ -21,7 +25,12 @@ logger = logging.getLogger(__name__)
 # Constants
 MAX_RANK = 100  # Maximum rank to track
 DECAY_HALF_LIFE_DAYS = 14  # Half-life for memory decay calculation in days
+TREND_WINDOW = 5  # Recent entries used for trend direction
 SIGNIFICANT_DELTA_THRESHOLD = 3  # Minimum rank change to be considered significant
+MAX_HISTORY_ENTRIES = 100  # Rank history entries kept in memory per series
+MAX_SNAPSHOTS = 10000  # Memory snapshots kept in memory
+ALERT_RETENTION_DAYS = 90  # Delta alerts older than this are compacted away
+RANK_HISTORY_RETENTION_DAYS = 90  # Rank observations older than this are deleted
 
 # File paths
 DATA_DIR = "data/domain_memory"
@@ -30,6 +39,406 @@ os.makedirs(DATA_DIR, exist_ok=True)
 DOMAIN_MEMORY_PATH = os.path.join(DATA_DIR, "domain_memory.json")
 MEMORY_SNAPSHOTS_PATH = os.path.join(DATA_DIR, "memory_snapshots.json")
 DELTA_ALERTS_PATH = os.path.join(DATA_DIR, "delta_alerts.json")
+DELTA_ALERTS_LOG_PATH = os.path.join(DATA_DIR, "delta_alerts.jsonl")
+RANK_HISTORY_DB_PATH = os.path.join(DATA_DIR, "rank_history.db")
+
+
+class RankHistoryStore:
+    """
+    SQLite time-series store for domain rank observations.
+    
+    Each row is one observation of a (domain, model, query_category) series
+    with an epoch-seconds timestamp, indexed by series and time so a sweep
+    can append thousands of ranks in a single transaction. Observations
+    older than the retention period are deleted about once a day.
+    """
+    
+    def __init__(self, db_path: str = RANK_HISTORY_DB_PATH,
+                 retention_days: int = RANK_HISTORY_RETENTION_DAYS):
+        """Initialize the store and create the schema if needed."""
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self.last_compacted = 0.0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS rank_history (
+                domain TEXT NOT NULL,
+                model TEXT NOT NULL,
+                query_category TEXT NOT NULL,
+                ts REAL NOT NULL,
+                rank INTEGER NOT NULL,
+                delta INTEGER NOT NULL,
+                query_text TEXT
+            )
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rank_series
+            ON rank_history (domain, model, query_category, ts)
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rank_ts
+            ON rank_history (ts)
+        """)
+        self.conn.commit()
+        
+        self.compact()
+    
+    def is_empty(self) -> bool:
+        """Check whether the store holds any observations."""
+        with self.lock:
+            row = self.conn.execute("SELECT 1 FROM rank_history LIMIT 1").fetchone()
+        return row is None
+    
+    def append_many(self, rows: List[Tuple]):
+        """
+        Append observations in a single transaction.
+        
+        Args:
+            rows: Tuples of (domain, model, query_category, ts, rank, delta, query_text)
+        """
+        if not rows:
+            return
+        
+        with self.lock:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT INTO rank_history "
+                    "(domain, model, query_category, ts, rank, delta, query_text) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        
+        if time.time() - self.last_compacted >= 86400:
+            self.compact()
+    
+    def compact(self) -> int:
+        """
+        Delete observations older than the retention period.
+        
+        Freed pages are reused by later inserts, so the file stops growing
+        once the retention window is full.
+        
+        Returns:
+            Number of deleted observations
+        """
+        cutoff = time.time() - self.retention_days * 86400
+        
+        with self.lock:
+            with self.conn:
+                deleted = self.conn.execute(
+                    "DELETE FROM rank_history WHERE ts < ?", (cutoff,)
+                ).rowcount
+            self.last_compacted = time.time()
+        
+        if deleted:
+            logger.info(f"Compacted rank history: {deleted} observations expired")
+        
+        return deleted
+    
+    def load_recent_series(self, per_series: int = MAX_HISTORY_ENTRIES) -> List[Tuple]:
+        """
+        Load the most recent observations of every series.
+        
+        Args:
+            per_series: Maximum observations to return per series
+            
+        Returns:
+            Rows ordered by series and ascending timestamp
+        """
+        with self.lock:
+            return self.conn.execute("""
+                SELECT domain, model, query_category, ts, rank, delta, query_text
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY domain, model, query_category
+                        ORDER BY ts DESC
+                    ) AS rn
+                    FROM rank_history
+                )
+                WHERE rn <= ?
+                ORDER BY domain, model, query_category, ts
+            """, (per_series,)).fetchall()
+    
+    def load_recent(self, limit: int = MAX_SNAPSHOTS) -> List[Tuple]:
+        """
+        Load the most recent observations across all series.
+        
+        Args:
+            limit: Maximum observations to return
+            
+        Returns:
+            Rows ordered by ascending timestamp
+        """
+        with self.lock:
+            rows = self.conn.execute("""
+                SELECT domain, model, query_category, ts, rank, delta, query_text
+                FROM rank_history
+                ORDER BY ts DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+        return rows[::-1]
+    
+    def query_series(self, domain: str, model: str, query_category: str,
+                     since_ts: float = 0.0) -> List[Tuple]:
+        """
+        Query a single series over a time range.
+        
+        Args:
+            domain: Domain name
+            model: Model name
+            query_category: Query category
+            since_ts: Only return observations at or after this epoch time
+            
+        Returns:
+            Rows of (ts, rank, delta, query_text) in ascending time order
+        """
+        with self.lock:
+            return self.conn.execute("""
+                SELECT ts, rank, delta, query_text
+                FROM rank_history
+                WHERE domain = ? AND model = ? AND query_category = ? AND ts >= ?
+                ORDER BY ts
+            """, (domain, model, query_category, since_ts)).fetchall()
+
+
+class DeltaAlertStore:
+    """
+    Time-ordered store of significant rank delta alerts.
+    
+    Alerts get stable integer ids and are indexed by domain, model and
+    category, with a queue of alerts that have not been notified yet.
+    Changes are appended to a JSON-lines log; alerts older than the
+    retention period are compacted out of memory and the log.
+    """
+    
+    def __init__(self, log_path: str = DELTA_ALERTS_LOG_PATH,
+                 legacy_path: str = DELTA_ALERTS_PATH,
+                 retention_days: int = ALERT_RETENTION_DAYS):
+        """Initialize the store and load persisted alerts."""
+        self.log_path = log_path
+        self.legacy_path = legacy_path
+        self.retention_days = retention_days
+        self._reset()
+        self._load()
+    
+    def _reset(self):
+        """Clear all alerts and indexes."""
+        self.alerts = []  # Oldest first
+        self.timestamps = []  # Parallel to alerts, for bisection
+        self.by_id = {}
+        self.by_domain = {}
+        self.by_model = {}
+        self.by_category = {}
+        self.unnotified = OrderedDict()  # alert_id -> alert, oldest first
+        self.next_id = 1
+        self.pending = []  # Log records not yet written
+    
+    def _load(self):
+        """Load alerts from the log, migrating the legacy JSON list if needed."""
+        if os.path.exists(self.log_path):
+            with open(self.log_path, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping unreadable delta alert record")
+                        continue
+                    
+                    if record.get("type") == "alert":
+                        self._index(record["alert"])
+                    elif record.get("type") == "notified":
+                        self._apply_notified(record["alert_ids"])
+            
+        elif os.path.exists(self.legacy_path):
+            with open(self.legacy_path, 'r') as f:
+                legacy_alerts = json.load(f)
+            
+            for alert in sorted(legacy_alerts, key=lambda a: a["timestamp"]):
+                self._index(alert)
+            
+            self._rewrite_log()
+            logger.info(f"Migrated {len(legacy_alerts)} delta alerts to alert log")
+        
+        self.compact()
+    
+    def _index(self, alert: Dict):
+        """Add an alert to the time-ordered list and secondary indexes."""
+        if "alert_id" not in alert:
+            alert["alert_id"] = self.next_id
+        self.next_id = max(self.next_id, alert["alert_id"] + 1)
+        
+        self.alerts.append(alert)
+        self.timestamps.append(alert["timestamp"])
+        self.by_id[alert["alert_id"]] = alert
+        self.by_domain.setdefault(alert["domain"], []).append(alert)
+        self.by_model.setdefault(alert["model"], []).append(alert)
+        self.by_category.setdefault(alert["query_category"], []).append(alert)
+        
+        if not alert.get("notified", False):
+            self.unnotified[alert["alert_id"]] = alert
+    
+    def add(self, alert: Dict) -> Dict:
+        """
+        Add a new alert.
+        
+        Args:
+            alert: Alert dictionary (a stable alert_id is assigned)
+            
+        Returns:
+            The stored alert
+        """
+        alert["alert_id"] = self.next_id
+        self._index(alert)
+        self.pending.append({"type": "alert", "alert": alert})
+        return alert
+    
+    def query(self, since: str, domain: Optional[str] = None, model: Optional[str] = None,
+              query_category: Optional[str] = None) -> List[Dict]:
+        """
+        Get alerts at or after a timestamp, newest first.
+        
+        The smallest matching index is walked backwards from the newest
+        alert and stops at the cutoff, so cost depends on the result size
+        rather than the alert history.
+        
+        Args:
+            since: ISO timestamp cutoff
+            domain: Optional domain filter
+            model: Optional model filter
+            query_category: Optional query category filter
+            
+        Returns:
+            List of alert dictionaries
+        """
+        candidates = [
+            index.get(value, [])
+            for index, value in ((self.by_domain, domain), (self.by_model, model),
+                                 (self.by_category, query_category))
+            if value
+        ]
+        source = min(candidates, key=len) if candidates else self.alerts
+        
+        results = []
+        for alert in reversed(source):
+            if alert["timestamp"] < since:
+                break
+            if domain and alert["domain"] != domain:
+                continue
+            if model and alert["model"] != model:
+                continue
+            if query_category and alert["query_category"] != query_category:
+                continue
+            results.append(alert)
+        
+        return results
+    
+    def get_unnotified(self, since: Optional[str] = None) -> List[Dict]:
+        """
+        Get alerts that have not been notified yet, newest first.
+        
+        Args:
+            since: Optional ISO timestamp cutoff
+            
+        Returns:
+            List of alert dictionaries
+        """
+        results = []
+        for alert in reversed(self.unnotified.values()):
+            if since and alert["timestamp"] < since:
+                break
+            results.append(alert)
+        return results
+    
+    def _resolve_ids(self, alert_ids: List) -> List[int]:
+        """Resolve alert ids, accepting legacy timestamp identifiers."""
+        resolved = []
+        for alert_id in alert_ids:
+            if alert_id in self.by_id:
+                resolved.append(alert_id)
+            elif isinstance(alert_id, str):
+                start = bisect_left(self.timestamps, alert_id)
+                end = bisect_right(self.timestamps, alert_id)
+                resolved.extend(alert["alert_id"] for alert in self.alerts[start:end])
+        return resolved
+    
+    def _apply_notified(self, alert_ids: List[int]) -> List[int]:
+        """Mark alerts as notified in memory, returning the ids that changed."""
+        changed = []
+        for alert_id in alert_ids:
+            alert = self.unnotified.pop(alert_id, None)
+            if alert is not None:
+                alert["notified"] = True
+                changed.append(alert_id)
+        return changed
+    
+    def mark_notified(self, alert_ids: List) -> int:
+        """
+        Mark alerts as notified.
+        
+        Args:
+            alert_ids: Alert ids (or legacy alert timestamps)
+            
+        Returns:
+            Number of alerts updated
+        """
+        changed = self._apply_notified(self._resolve_ids(alert_ids))
+        if changed:
+            self.pending.append({"type": "notified", "alert_ids": changed})
+        return len(changed)
+    
+    def flush(self):
+        """Append pending records to the alert log."""
+        if not self.pending:
+            return
+        
+        with open(self.log_path, 'a') as f:
+            for record in self.pending:
+                f.write(json.dumps(record) + "\n")
+        self.pending = []
+        
+        self.compact()
+    
+    def compact(self):
+        """
+        Drop alerts older than the retention period and rewrite the log.
+        
+        Runs only once the oldest alert is a day past retention, so the
+        rewrite happens at most about once a day.
+        """
+        if not self.alerts:
+            return
+        
+        cutoff = datetime.now() - timedelta(days=self.retention_days)
+        if self.timestamps[0] >= (cutoff - timedelta(days=1)).isoformat():
+            return
+        
+        keep_from = bisect_left(self.timestamps, cutoff.isoformat())
+        retained = self.alerts[keep_from:]
+        
+        next_id = self.next_id
+        self._reset()
+        self.next_id = next_id
+        for alert in retained:
+            self._index(alert)
+        
+        self._rewrite_log()
+        logger.info(f"Compacted delta alerts: {keep_from} expired, {len(retained)} retained")
+    
+    def _rewrite_log(self):
+        """Rewrite the alert log from the alerts in memory."""
+        tmp_path = self.log_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            for alert in self.alerts:
+                f.write(json.dumps({"type": "alert", "alert": alert}) + "\n")
+        os.replace(tmp_path, self.log_path)
+        self.pending = []
 
 
 class DomainMemoryTracker:
@@ -42,25 +451,45 @@ class DomainMemoryTracker:
         """Initialize the domain memory tracker."""
         self.domain_memory = {}  # Domain -> model -> query_category -> rank history
         self.memory_snapshots = []  # List of memory snapshots (timestamp, model, query, domain, rank)
-        self.delta_alerts = []  # List of significant delta events
+        
+        # Analytics state, invalidated per series on update
+        self._reset_analytics()
+        
+        # Domain -> counter bumped on every rank update, for downstream caches
+        self._domain_versions = {}
+        
+        # Rank observations are persisted to the time-series store
+        self.rank_store = RankHistoryStore()
+        
+        # Significant delta events
+        self.alert_store = DeltaAlertStore()
         
         # Load existing data if available
         self._load_data()
     
     def _load_data(self):
-        """Load existing data from files."""
+        """Load existing data from the rank store and alert file."""
         try:
-            if os.path.exists(DOMAIN_MEMORY_PATH):
-                with open(DOMAIN_MEMORY_PATH, 'r') as f:
-                    self.domain_memory = json.load(f)
-                    
-            if os.path.exists(MEMORY_SNAPSHOTS_PATH):
-                with open(MEMORY_SNAPSHOTS_PATH, 'r') as f:
-                    self.memory_snapshots = json.load(f)
-                    
-            if os.path.exists(DELTA_ALERTS_PATH):
-                with open(DELTA_ALERTS_PATH, 'r') as f:
-                    self.delta_alerts = json.load(f)
+            if self.rank_store.is_empty():
+                self._migrate_json_history()
+            
+            for row in self.rank_store.load_recent_series(MAX_HISTORY_ENTRIES):
+                domain, model, query_category = row[0], row[1], row[2]
+                series = self.domain_memory.setdefault(domain, {}).setdefault(model, {}).setdefault(
+                    query_category, {"rank_history": [], "last_updated": None}
+                )
+                entry = self._row_to_entry(row)
+                series["rank_history"].append(entry)
+                series["last_updated"] = entry["timestamp"]
+                
+                key = (domain, model, query_category)
+                self._series_epochs.setdefault(key, []).append(row[3])
+                self._category_index.setdefault((model, query_category), {})[domain] = series
+            
+            self.memory_snapshots = [
+                self._row_to_snapshot(row)
+                for row in self.rank_store.load_recent(MAX_SNAPSHOTS)
+            ]
                     
             logger.info("Domain memory data loaded successfully")
         except Exception as e:
@@ -68,24 +497,95 @@ class DomainMemoryTracker:
             # Initialize with empty data
             self.domain_memory = {}
             self.memory_snapshots = []
-            self.delta_alerts = []
+            self._reset_analytics()
+    
+    @property
+    def delta_alerts(self) -> List[Dict]:
+        """All retained delta alerts, oldest first."""
+        return self.alert_store.alerts
+    
+    def _reset_analytics(self):
+        """Reset the analytics indexes and caches."""
+        # (domain, model, category) -> epoch seconds parallel to rank_history
+        self._series_epochs = {}
+        # (domain, model, category) -> cached decay/trend metrics
+        self._series_metrics = {}
+        # (model, category) -> {domain -> series data}
+        self._category_index = {}
+        # (model, category) -> domains sorted by current rank
+        self._top_domains_cache = {}
+    
+    def _invalidate_series(self, domain: str, model: str, query_category: str):
+        """Drop cached analytics affected by an update to one series."""
+        self._series_metrics.pop((domain, model, query_category), None)
+        self._domain_versions[domain] = self._domain_versions.get(domain, 0) + 1
+        
+        for key in ((model, query_category), (None, query_category), (model, None), (None, None)):
+            self._top_domains_cache.pop(key, None)
+    
+    def _migrate_json_history(self):
+        """Import rank history from the legacy JSON files into the rank store."""
+        rows = []
+        seen = set()
+        
+        def add_row(domain, model, query_category, entry):
+            key = (domain, model, query_category, entry["timestamp"])
+            if key in seen:
+                return
+            seen.add(key)
+            rows.append((
+                domain, model, query_category,
+                datetime.fromisoformat(entry["timestamp"]).timestamp(),
+                entry["rank"], entry.get("delta", 0), entry.get("query_text")
+            ))
+        
+        if os.path.exists(DOMAIN_MEMORY_PATH):
+            with open(DOMAIN_MEMORY_PATH, 'r') as f:
+                legacy_memory = json.load(f)
+            
+            for domain, models in legacy_memory.items():
+                for model, categories in models.items():
+                    for query_category, series in categories.items():
+                        for entry in series.get("rank_history", []):
+                            add_row(domain, model, query_category, entry)
+        
+        if os.path.exists(MEMORY_SNAPSHOTS_PATH):
+            with open(MEMORY_SNAPSHOTS_PATH, 'r') as f:
+                legacy_snapshots = json.load(f)
+            
+            for snapshot in legacy_snapshots:
+                add_row(snapshot["domain"], snapshot["model"], snapshot["query_category"], snapshot)
+        
+        if rows:
+            rows.sort(key=lambda row: row[3])
+            self.rank_store.append_many(rows)
+            logger.info(f"Migrated {len(rows)} rank observations from JSON to rank store")
+    
+    def _row_to_entry(self, row: Tuple) -> Dict:
+        """Convert a rank store row to a rank history entry."""
+        return {
+            "timestamp": datetime.fromtimestamp(row[3]).isoformat(),
+            "rank": row[4],
+            "delta": row[5],
+            "query_text": row[6]
+        }
+    
+    def _row_to_snapshot(self, row: Tuple) -> Dict:
+        """Convert a rank store row to a memory snapshot."""
+        return {
+            "timestamp": datetime.fromtimestamp(row[3]).isoformat(),
+            "domain": row[0],
+            "model": row[1],
+            "query_category": row[2],
+            "query_text": row[6],
+            "rank": row[4],
+            "delta": row[5]
+        }
     
     def _save_data(self):
-        """Save current data to files."""
+        """Append pending delta alert changes to the alert log. Rank observations are written to the rank store."""
         try:
-            # Save domain memory
-            with open(DOMAIN_MEMORY_PATH, 'w') as f:
-                json.dump(self.domain_memory, f, indent=2)
-                
-            # Save memory snapshots
-            with open(MEMORY_SNAPSHOTS_PATH, 'w') as f:
-                json.dump(self.memory_snapshots, f, indent=2)
-                
-            # Save delta alerts
-            with open(DELTA_ALERTS_PATH, 'w') as f:
-                json.dump(self.delta_alerts, f, indent=2)
-                
-            logger.info("Domain memory data saved successfully")
+            self.alert_store.flush()
         except Exception as e:
             logger.error(f"Error saving domain memory data: {e}")
     
@@ -108,7 +608,67 @@ class DomainMemoryTracker:
         Returns:
             Dictionary with update status and delta information
         """
-        timestamp = self._get_formatted_timestamp()
+        return self.update_domain_ranks([{
+            "domain": domain,
+            "model": model,
+            "query_category": query_category,
+            "rank": rank,
+            "query_text": query_text
+        }])[0]
+    
+    def update_domain_ranks(self, updates: List[Dict]) -> List[Dict]:
+        """
+        Update ranks for many domains in one batch.
+        
+        All observations are written to the rank store in a single transaction
+        and delta alerts are saved at most once.
+        
+        Args:
+            updates: List of dictionaries with domain, model, query_category,
+                     rank and optional query_text
+            
+        Returns:
+            List of update results in the same order as the input
+        """
+        results = []
+        rows = []
+        
+        for update in updates:
+            result, row = self._apply_rank_update(
+                update["domain"],
+                update["model"],
+                update["query_category"],
+                update["rank"],
+                update.get("query_text")
+            )
+            results.append(result)
+            rows.append(row)
+        
+        try:
+            self.rank_store.append_many(rows)
+        except Exception as e:
+            logger.error(f"Error writing rank observations: {e}")
+        
+        # New alerts from the batch are appended to the alert log at once
+        self._save_data()
+        
+        _notify_update_listeners(
+            [update["domain"] for update in updates],
+            [update["query_category"] for update in updates]
+        )
+        
+        return results
+    
+    def _apply_rank_update(self, domain: str, model: str, query_category: str,
+                           rank: int, query_text: Optional[str]) -> Tuple[Dict, Tuple]:
+        """
+        Apply a rank observation to in-memory state without persisting it.
+        
+        Returns:
+            Tuple of (update result, rank store row)
+        """
+        now = datetime.now()
+        timestamp = now.isoformat()
         
         # Initialize domain hierarchy if needed
         if domain not in self.domain_memory:
@@ -145,10 +705,18 @@ class DomainMemoryTracker:
         
         rank_history.append(rank_entry)
         
+        series_key = (domain, model, query_category)
+        epochs = self._series_epochs.setdefault(series_key, [])
+        epochs.append(now.timestamp())
+        
         # Limit history size (keep last 100 entries)
-        if len(rank_history) > 100:
-            rank_history = rank_history[-100:]
+        if len(rank_history) > MAX_HISTORY_ENTRIES:
+            rank_history = rank_history[-MAX_HISTORY_ENTRIES:]
             self.domain_memory[domain][model][query_category]["rank_history"] = rank_history
+            del epochs[:-MAX_HISTORY_ENTRIES]
+        
+        self._category_index.setdefault((model, query_category), {})[domain] = domain_data
+        self._invalidate_series(domain, model, query_category)
         
         # Update last updated timestamp
         self.domain_memory[domain][model][query_category]["last_updated"] = timestamp
@@ -167,8 +735,8 @@ class DomainMemoryTracker:
         self.memory_snapshots.append(snapshot)
         
         # Limit snapshots (keep last 10000)
-        if len(self.memory_snapshots) > 10000:
-            self.memory_snapshots = self.memory_snapshots[-10000:]
+        if len(self.memory_snapshots) > MAX_SNAPSHOTS:
+            self.memory_snapshots = self.memory_snapshots[-MAX_SNAPSHOTS:]
         
         # Check for significant delta
         alert_data = None
@@ -187,13 +755,11 @@ class DomainMemoryTracker:
                 "notified": False
             }
             
-            self.delta_alerts.append(alert)
-            alert_data = alert
+            alert_data = self.alert_store.add(alert)
             
             logger.info(f"Significant delta detected for {domain} in {model}/{query_category}: {delta}")
         
-        # Save data
-        self._save_data()
+        row = (domain, model, query_category, now.timestamp(), rank, delta, query_text)
         
         return {
             "status": "updated",
@@ -204,7 +770,7 @@ class DomainMemoryTracker:
             "previous_rank": previous_rank,
             "delta": delta,
             "alert": alert_data
-        }
+        }, row
     
     def get_domain_ranks(self, domain: str, 
                         model: Optional[str] = None, 
@@ -301,6 +867,50 @@ class DomainMemoryTracker:
         
         return filtered_history
     
+    def get_rank_windows(self, domains: List[str], days: int = 30) -> Dict[str, Dict]:
+        """
+        Get recent ranks for many domains in one pass.
+        
+        Args:
+            domains: Domain names
+            days: Number of days of history to include
+            
+        Returns:
+            Dictionary of domain -> {"version", "expires", "series"}, where
+            series maps (model, category) to the ranks inside the window,
+            version changes whenever the domain receives a new rank, and
+            expires is the epoch at which the oldest included rank leaves
+            the window (None if no ranks are included)
+        """
+        window_seconds = days * 86400
+        cutoff = time.time() - window_seconds
+        windows = {}
+        
+        for domain in domains:
+            series = {}
+            oldest = None
+            
+            for model, categories in self.domain_memory.get(domain, {}).items():
+                for query_category, data in categories.items():
+                    epochs = self._series_epochs.get((domain, model, query_category), [])
+                    start = bisect_left(epochs, cutoff)
+                    if start >= len(epochs):
+                        continue
+                    
+                    series[(model, query_category)] = [
+                        entry["rank"] for entry in data["rank_history"][start:]
+                    ]
+                    if oldest is None or epochs[start] < oldest:
+                        oldest = epochs[start]
+            
+            windows[domain] = {
+                "version": self._domain_versions.get(domain, 0),
+                "expires": oldest + window_seconds if oldest is not None else None,
+                "series": series
+            }
+        
+        return windows
+    
     def get_memory_decay(self, domain: str, model: Optional[str] = None, 
                        query_category: Optional[str] = None) -> Dict:
         """
@@ -325,107 +935,147 @@ class DomainMemoryTracker:
                 return {"status": "model_not_found", "domain": domain, "model": model}
             domain_data = {model: domain_data[model]}
         
-        # Calculate decay metrics
-        now = datetime.now()
+        keys = [
+            (domain, model_name, cat)
+            for model_name, model_data in domain_data.items()
+            for cat in model_data
+            if not query_category or cat == query_category
+        ]
+        metrics = self._get_series_metrics(keys)
+        
         result = {"domain": domain, "models": {}}
         
-        for model_name, model_data in domain_data.items():
-            model_result = {}
-            
-            for cat, cat_data in model_data.items():
-                if query_category and cat != query_category:
-                    continue
-                    
-                rank_history = cat_data["rank_history"]
-                if not rank_history:
-                    continue
-                
-                # Calculate decay based on rank history
-                decay_score = self._calculate_decay_score(rank_history, now)
-                
-                # Get trend direction (improving, declining, stable)
-                trend = self._calculate_trend(rank_history)
-                
-                model_result[cat] = {
-                    "decay_score": decay_score,
-                    "trend": trend,
-                    "current_rank": rank_history[-1]["rank"] if rank_history else None,
-                    "data_points": len(rank_history)
-                }
-            
-            if model_result:
-                result["models"][model_name] = model_result
+        for key in keys:
+            if key in metrics:
+                result["models"].setdefault(key[1], {})[key[2]] = metrics[key]
         
         return result
     
-    def _calculate_decay_score(self, rank_history: List[Dict], now: datetime) -> float:
+    def get_memory_decay_all(self, model: Optional[str] = None,
+                             query_category: Optional[str] = None) -> Dict[str, Dict]:
         """
-        Calculate a memory decay score based on rank history.
+        Calculate memory decay metrics for every tracked domain at once.
         
         Args:
-            rank_history: List of rank history entries
-            now: Current datetime
+            model: Optional model filter
+            query_category: Optional query category filter
             
         Returns:
-            Decay score between 0 and 1 (lower is more decay)
+            Dictionary of domain -> model -> category -> decay metrics
         """
-        if not rank_history:
-            return 0.0
+        keys = [
+            (domain, model_name, cat)
+            for domain, domain_data in self.domain_memory.items()
+            for model_name, model_data in domain_data.items()
+            if not model or model_name == model
+            for cat in model_data
+            if not query_category or cat == query_category
+        ]
+        metrics = self._get_series_metrics(keys)
         
-        # Calculate weighted average based on recency
-        weights = []
-        ranks = []
+        result = {}
         
-        for entry in rank_history:
-            entry_time = datetime.fromisoformat(entry["timestamp"])
-            days_ago = (now - entry_time).total_seconds() / (24 * 3600)
-            
-            # Calculate weight using exponential decay
-            weight = 2 ** (-days_ago / DECAY_HALF_LIFE_DAYS)
-            weights.append(weight)
-            
-            # Normalize rank (higher rank = worse)
-            normalized_rank = 1.0 - (min(entry["rank"], MAX_RANK) / MAX_RANK)
-            ranks.append(normalized_rank)
+        for key, key_metrics in metrics.items():
+            result.setdefault(key[0], {}).setdefault(key[1], {})[key[2]] = key_metrics
         
-        if not weights:
-            return 0.0
+        return result
+    
+    def _get_series_metrics(self, keys: List[Tuple[str, str, str]]) -> Dict[Tuple, Dict]:
+        """
+        Get decay and trend metrics for a set of series.
+        
+        Cached metrics are reused; all stale series are computed together
+        in one vectorized pass.
+        
+        Args:
+            keys: (domain, model, category) series keys
             
-        # Calculate weighted average
-        decay_score = sum(w * r for w, r in zip(weights, ranks)) / sum(weights)
+        Returns:
+            Dictionary of series key -> metrics for non-empty series
+        """
+        stale = [
+            key for key in keys
+            if key not in self._series_metrics and self._series_epochs.get(key)
+        ]
+        
+        if stale:
+            self._series_metrics.update(self._compute_series_metrics(stale))
         
-        return round(decay_score, 3)
+        return {key: self._series_metrics[key] for key in keys if key in self._series_metrics}
     
-    def _calculate_trend(self, rank_history: List[Dict]) -> str:
+    def _compute_series_metrics(self, keys: List[Tuple[str, str, str]]) -> Dict[Tuple, Dict]:
         """
-        Calculate trend direction based on rank history.
+        Compute decay score, trend and trend slope for many series at once.
+        
+        The series are concatenated into flat arrays with a segment id per
+        entry, and per-series sums are taken with np.bincount.
         
         Args:
-            rank_history: List of rank history entries
+            keys: Non-empty (domain, model, category) series keys
             
         Returns:
-            Trend direction ("improving", "declining", "stable")
+            Dictionary of series key -> metrics
         """
-        if len(rank_history) < 2:
-            return "stable"
+        histories = [self.domain_memory[d][m][c]["rank_history"] for d, m, c in keys]
+        lengths = np.array([len(history) for history in histories])
+        num_series = len(keys)
+        
+        seg = np.repeat(np.arange(num_series), lengths)
+        ends = np.cumsum(lengths) - 1
         
-        # Look at the last 5 entries or all if fewer
-        recent_history = rank_history[-min(5, len(rank_history)):]
+        epochs = np.concatenate([np.asarray(self._series_epochs[key], dtype=np.float64) for key in keys])
+        ranks = np.fromiter((entry["rank"] for history in histories for entry in history),
+                            dtype=np.float64, count=len(epochs))
+        deltas = np.fromiter((entry.get("delta", 0) for history in histories for entry in history),
+                             dtype=np.float64, count=len(epochs))
         
-        # Calculate average delta
-        deltas = [entry["delta"] for entry in recent_history if "delta" in entry]
+        # Days relative to each series' latest entry (always <= 0)
+        days = (epochs - epochs[ends][seg]) / (24 * 3600)
         
-        if not deltas:
-            return "stable"
+        # Exponential-decay weighted average of normalized rank; the weight
+        # ratio is independent of the evaluation time, so results stay valid
+        # until the series changes
+        weights = np.exp2(days / DECAY_HALF_LIFE_DAYS)
+        normalized = 1.0 - np.minimum(ranks, MAX_RANK) / MAX_RANK
+        decay_scores = (np.bincount(seg, weights * normalized, num_series) /
+                        np.bincount(seg, weights, num_series))
+        
+        # Average delta over the last TREND_WINDOW entries
+        recent = (ends[seg] - np.arange(len(epochs))) < TREND_WINDOW
+        avg_deltas = (np.bincount(seg[recent], deltas[recent], num_series) /
+                      np.bincount(seg[recent], minlength=num_series))
+        
+        # Least-squares slope of rank over time (ranks per day, negative is improving)
+        n = lengths.astype(np.float64)
+        sum_x = np.bincount(seg, days, num_series)
+        sum_y = np.bincount(seg, ranks, num_series)
+        sum_xx = np.bincount(seg, days * days, num_series)
+        sum_xy = np.bincount(seg, days * ranks, num_series)
+        denom = n * sum_xx - sum_x ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slopes = np.where(np.abs(denom) > 1e-12, (n * sum_xy - sum_x * sum_y) / denom, 0.0)
+        
+        metrics = {}
+        
+        for i, key in enumerate(keys):
+            if lengths[i] < 2:
+                trend = "stable"
+            elif avg_deltas[i] > 1.0:
+                trend = "improving"
+            elif avg_deltas[i] < -1.0:
+                trend = "declining"
+            else:
+                trend = "stable"
             
-        avg_delta = sum(deltas) / len(deltas)
+            metrics[key] = {
+                "decay_score": round(float(decay_scores[i]), 3),
+                "trend": trend,
+                "trend_slope": round(float(slopes[i]), 3),
+                "current_rank": histories[i][-1]["rank"],
+                "data_points": int(lengths[i])
+            }
         
-        if avg_delta > 1.0:
-            return "improving"
-        elif avg_delta < -1.0:
-            return "declining"
-        else:
-            return "stable"
+        return metrics
     
     def get_significant_deltas(self, days: int = 7, 
                              domain: Optional[str] = None,
@@ -445,81 +1095,146 @@ class DomainMemoryTracker:
         """
         cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
         
-        # Filter alerts
-        filtered_alerts = []
-        
-        for alert in self.delta_alerts:
-            if alert["timestamp"] < cutoff_date:
-                continue
-                
-            if domain and alert["domain"] != domain:
-                continue
-                
-            if model and alert["model"] != model:
-                continue
-                
-            if query_category and alert["query_category"] != query_category:
-                continue
-                
-            filtered_alerts.append(alert)
+        # Newest first
+        return self.alert_store.query(cutoff_date, domain, model, query_category)
+    
+    def get_unnotified_alerts(self, days: Optional[int] = None) -> List[Dict]:
+        """
+        Get delta alerts that have not been notified yet.
         
-        # Sort by timestamp (newest first)
-        return sorted(filtered_alerts, key=lambda x: x["timestamp"], reverse=True)
+        Args:
+            days: Optional number of days to look back
+            
+        Returns:
+            List of delta alert dictionaries, newest first
+        """
+        since = (datetime.now() - timedelta(days=days)).isoformat() if days is not None else None
+        return self.alert_store.get_unnotified(since)
     
-    def mark_alerts_as_notified(self, alert_ids: List[str]) -> int:
+    def mark_alerts_as_notified(self, alert_ids: List) -> int:
         """
         Mark specified alerts as notified.
         
         Args:
-            alert_ids: List of alert IDs (timestamps) to mark
+            alert_ids: List of alert IDs (timestamps are accepted for older callers)
             
         Returns:
             Number of alerts updated
         """
-        count = 0
-        
-        for alert in self.delta_alerts:
-            if alert["timestamp"] in alert_ids and not alert["notified"]:
-                alert["notified"] = True
-                count += 1
+        count = self.alert_store.mark_notified(alert_ids)
         
         if count > 0:
             self._save_data()
             
         return count
     
-    def get_top_domains(self, model: str, query_category: str, limit: int = 100) -> List[Dict]:
+    def get_top_domains(self, model: Optional[str] = None, query_category: Optional[str] = None,
+                        limit: int = 100) -> List[Dict]:
         """
         Get top domains for a specific model and category.
         
+        When model or category is omitted, each domain is ranked by its best
+        current rank across the matching series.
+        
         Args:
-            model: Model name
-            query_category: Query category
+            model: Optional model name
+            query_category: Optional query category
             limit: Maximum number of domains to return
             
         Returns:
             List of domain dictionaries with rank information
         """
-        domains = []
+        cache_key = (model, query_category)
+        ranked = self._top_domains_cache.get(cache_key)
         
-        for domain, domain_data in self.domain_memory.items():
-            if model in domain_data and query_category in domain_data[model]:
-                rank_history = domain_data[model][query_category]["rank_history"]
+        if ranked is None:
+            ranked = self._rank_domains(model, query_category)
+            self._top_domains_cache[cache_key] = ranked
+        
+        return ranked[:limit]
+    
+    def _rank_domains(self, model: Optional[str], query_category: Optional[str]) -> List[Dict]:
+        """
+        Sort domains by current rank using the (model, category) index.
+        
+        Args:
+            model: Optional model name
+            query_category: Optional query category
+            
+        Returns:
+            List of domain dictionaries sorted by ascending rank
+        """
+        best = {}
+        
+        for (index_model, index_category), series_by_domain in self._category_index.items():
+            if model and index_model != model:
+                continue
+            if query_category and index_category != query_category:
+                continue
+            
+            for domain, series in series_by_domain.items():
+                rank_history = series["rank_history"]
+                if not rank_history:
+                    continue
                 
-                if rank_history:
-                    latest = rank_history[-1]
-                    
-                    domains.append({
+                latest = rank_history[-1]
+                current = best.get(domain)
+                
+                if current is None or latest["rank"] < current["rank"]:
+                    best[domain] = {
                         "domain": domain,
                         "rank": latest["rank"],
                         "delta": latest["delta"],
-                        "last_updated": domain_data[model][query_category]["last_updated"]
-                    })
+                        "last_updated": series["last_updated"]
+                    }
         
-        # Sort by rank (ascending)
-        sorted_domains = sorted(domains, key=lambda x: x["rank"])
+        if not best:
+            return []
+        
+        entries = list(best.values())
+        ranks = np.fromiter((entry["rank"] for entry in entries), dtype=np.int64, count=len(entries))
         
-        return sorted_domains[:limit]
+        # Sort by rank (ascending)
+        return [entries[i] for i in np.argsort(ranks, kind="stable")]
+
+
+# Callbacks invoked with the domains touched by each rank update batch
+_update_listeners: List[Callable[[List[str], List[str]], None]] = []
+
+def add_update_listener(callback: Callable[[List[str], List[str]], None]) -> None:
+    """
+    Register a callback for new rank observations.
+    
+    Args:
+        callback: Function called with the lists of updated domains and
+                  updated query categories
+    """
+    if callback not in _update_listeners:
+        _update_listeners.append(callback)
+
+def remove_update_listener(callback: Callable[[List[str], List[str]], None]) -> None:
+    """
+    Unregister a rank update callback.
+    
+    Args:
+        callback: Previously registered function
+    """
+    if callback in _update_listeners:
+        _update_listeners.remove(callback)
+
+def _notify_update_listeners(domains: Iterable[str], categories: Iterable[str]) -> None:
+    """Invoke rank update callbacks, logging rather than raising on failure."""
+    if not _update_listeners:
+        return
+    
+    updated_domains = list(dict.fromkeys(domains))
+    updated_categories = list(dict.fromkeys(categories))
+    
+    for callback in list(_update_listeners):
+        try:
+            callback(updated_domains, updated_categories)
+        except Exception as e:
+            logger.error(f"Error in rank update listener: {e}")
 
 
 # Singleton instance
@@ -551,6 +1266,19 @@ def update_domain_rank(domain: str, model: str, query_category: str,
     """
     return get_tracker().update_domain_rank(domain, model, query_category, rank, query_text)
 
+def update_domain_ranks(updates: List[Dict]) -> List[Dict]:
+    """
+    Update ranks for many domains in one batch.
+    
+    Args:
+        updates: List of dictionaries with domain, model, query_category,
+                 rank and optional query_text
+        
+    Returns:
+        List of update results in the same order as the input
+    """
+    return get_tracker().update_domain_ranks(updates)
+
 def get_domain_ranks(domain: str, 
                     model: Optional[str] = None, 
                     query_category: Optional[str] = None) -> Dict:
@@ -583,6 +1311,19 @@ def get_rank_history(domain: str, model: str, query_category: str,
     """
     return get_tracker().get_rank_history(domain, model, query_category, days)
 
+def get_rank_windows(domains: List[str], days: int = 30) -> Dict[str, Dict]:
+    """
+    Get recent ranks for many domains in one pass.
+    
+    Args:
+        domains: Domain names
+        days: Number of days of history to include
+        
+    Returns:
+        Dictionary of domain -> {"version", "expires", "series"}
+    """
+    return get_tracker().get_rank_windows(domains, days)
+
 def get_memory_decay(domain: str, model: Optional[str] = None, 
                    query_category: Optional[str] = None) -> Dict:
     """
@@ -598,6 +1339,20 @@ def get_memory_decay(domain: str, model: Optional[str] = None,
     """
     return get_tracker().get_memory_decay(domain, model, query_category)
 
+def get_memory_decay_all(model: Optional[str] = None,
+                         query_category: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Calculate memory decay metrics for every tracked domain at once.
+    
+    Args:
+        model: Optional model filter
+        query_category: Optional query category filter
+        
+    Returns:
+        Dictionary of domain -> model -> category -> decay metrics
+    """
+    return get_tracker().get_memory_decay_all(model, query_category)
+
 def get_significant_deltas(days: int = 7, 
                          domain: Optional[str] = None,
                          model: Optional[str] = None,
@@ -616,13 +1371,26 @@ def get_significant_deltas(days: int = 7,
     """
     return get_tracker().get_significant_deltas(days, domain, model, query_category)
 
-def get_top_domains(model: str, query_category: str, limit: int = 100) -> List[Dict]:
+def get_unnotified_alerts(days: Optional[int] = None) -> List[Dict]:
+    """
+    Get delta alerts that have not been notified yet.
+    
+    Args:
+        days: Optional number of days to look back
+        
+    Returns:
+        List of delta alert dictionaries, newest first
+    """
+    return get_tracker().get_unnotified_alerts(days)
+
+def get_top_domains(model: Optional[str] = None, query_category: Optional[str] = None,
+                    limit: int = 100) -> List[Dict]:
     """
     Get top domains for a specific model and category.
     
     Args:
-        model: Model name
-        query_category: Query category
+        model: Optional model name
+        query_category: Optional query category
         limit: Maximum number of domains to return
         
     Returns:
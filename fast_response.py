@@ -0,0 +1,353 @@
+"""
+Fast Response Module
+
+This module provides a shared response layer for the LLMPageRank FastAPI
+services:
+- orjson serialization (falls back to the standard json module)
+- Pre-serialized, cached response bodies for snapshot endpoints
+- gzip/brotli negotiation with compressed bodies cached alongside the raw bytes
+- Optional response-model validation bypass for trusted internal data
+
+brotli is optional; without it only gzip is offered.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Constants
+COMPRESSION_MIN_BYTES = 1024  # Bodies smaller than this are sent uncompressed
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+SNAPSHOT_CACHE_MAX_ENTRIES = 256
+
+# Set LLMRANK_VALIDATE_RESPONSES=1 to keep pydantic response-model validation
+# on endpoints that serve trusted internal data
+VALIDATE_RESPONSES = os.environ.get("LLMRANK_VALIDATE_RESPONSES", "0") == "1"
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to JSON bytes.
+
+    Args:
+        content: JSON-serializable content (numpy values are supported with orjson)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick a content encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+
+    Returns:
+        "br", "gzip" or None
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.strip().lower()] = quality
+
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Compress a body.
+
+    Args:
+        body: Raw bytes
+        encoding: "br" or "gzip"
+
+    Returns:
+        Compressed bytes
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class CachedBody:
+    """
+    Pre-serialized response body with an ETag and lazily compressed variants.
+    """
+
+    def __init__(self, content: Any):
+        """
+        Serialize content once.
+
+        Args:
+            content: JSON-serializable content
+        """
+        self.body = dumps(content)
+        self.etag = f'"{hashlib.sha1(self.body).hexdigest()[:20]}"'
+        self._encoded = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        """
+        Get the body in an encoding, compressing it on first use.
+
+        Args:
+            encoding: "br", "gzip" or None
+
+        Returns:
+            Body bytes
+        """
+        if encoding is None:
+            return self.body
+
+        body = self._encoded.get(encoding)
+
+        if body is None:
+            with self._lock:
+                body = self._encoded.get(encoding)
+                if body is None:
+                    body = compress(self.body, encoding)
+                    self._encoded[encoding] = body
+
+        return body
+
+    def response(self, request: Optional[Request] = None, status_code: int = 200,
+                 headers: Optional[Dict[str, str]] = None) -> Response:
+        """
+        Build a response, honouring If-None-Match and Accept-Encoding.
+
+        Args:
+            request: Incoming request (None disables negotiation)
+            status_code: HTTP status code
+            headers: Extra response headers
+
+        Returns:
+            Response with the cached body
+        """
+        response_headers = {"ETag": self.etag, "Vary": "Accept-Encoding"}
+        if headers:
+            response_headers.update(headers)
+
+        if request is not None and request.headers.get("if-none-match") == response_headers["ETag"]:
+            return Response(status_code=304, headers=response_headers)
+
+        encoding = None
+        if request is not None and len(self.body) >= COMPRESSION_MIN_BYTES:
+            encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+
+        if encoding:
+            response_headers["Content-Encoding"] = encoding
+
+        return Response(
+            content=self.encoded(encoding),
+            status_code=status_code,
+            headers=response_headers,
+            media_type="application/json"
+        )
+
+
+class SnapshotCache:
+    """
+    Bounded cache of pre-serialized bodies for snapshot endpoints.
+
+    Each entry is stored with the version of the data it was built from; a
+    lookup with a different version (or after ``ttl`` seconds) rebuilds it.
+    """
+
+    def __init__(self, max_size: int = SNAPSHOT_CACHE_MAX_ENTRIES, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached bodies
+            ttl: Optional time-to-live in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: Hashable, builder: Callable[[], Any]) -> CachedBody:
+        """
+        Get a cached body, building it if missing or stale.
+
+        Args:
+            key: Cache key (e.g. endpoint and query parameters)
+            version: Version of the underlying data
+            builder: Callable returning the content to serialize
+
+        Returns:
+            Cached body
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version and (entry[1] is None or entry[1] > now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        cached = CachedBody(builder())
+        expires = now + self.ttl if self.ttl else None
+
+        with self._lock:
+            self._entries[key] = (version, expires, cached)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return cached
+
+    def respond(self, request: Optional[Request], key: Hashable, version: Hashable,
+                builder: Callable[[], Any], headers: Optional[Dict[str, str]] = None) -> Any:
+        """
+        Serve a snapshot endpoint from the cache.
+
+        With LLMRANK_VALIDATE_RESPONSES=1 the built content is returned instead
+        so the endpoint's response_model still validates it.
+
+        Args:
+            request: Incoming request
+            key: Cache key
+            version: Version of the underlying data
+            builder: Callable returning the content to serialize
+            headers: Extra response headers
+
+        Returns:
+            Response, or the content when validation is enabled
+        """
+        if VALIDATE_RESPONSES:
+            return builder()
+
+        return self.get(key, version, builder).response(request, headers=headers)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop one cached body, or all of them.
+
+        Args:
+            key: Cache key, or None to clear the cache
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def json_response(request: Optional[Request], content: Any, status_code: int = 200,
+                  headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Serialize and, where accepted, compress a one-off response.
+
+    Args:
+        request: Incoming request (None disables compression)
+        content: JSON-serializable content
+        status_code: HTTP status code
+        headers: Extra response headers
+
+    Returns:
+        Response
+    """
+    body = dumps(content)
+    response_headers = dict(headers or {})
+
+    encoding = None
+    if request is not None and len(body) >= COMPRESSION_MIN_BYTES:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+
+    if encoding:
+        body = compress(body, encoding)
+        response_headers["Content-Encoding"] = encoding
+        response_headers["Vary"] = "Accept-Encoding"
+
+    return Response(content=body, status_code=status_code, headers=response_headers,
+                    media_type="application/json")
+
+
+def trusted(request: Optional[Request], content: Any) -> Any:
+    """
+    Return trusted internal data without response-model validation.
+
+    Returning a Response makes FastAPI skip the endpoint's response_model.
+    With LLMRANK_VALIDATE_RESPONSES=1 the content is returned as-is so it is
+    validated as before.
+
+    Args:
+        request: Incoming request
+        content: JSON-serializable content matching the response model
+
+    Returns:
+        Response, or the content when validation is enabled
+    """
+    if VALIDATE_RESPONSES:
+        return content
+
+    return json_response(request, content)
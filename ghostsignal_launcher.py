@@ -144,7 +144,7 @@ class GhostSignalCore:
         """Background memory scan process."""
         try:
             logger.info("🔍 Starting comprehensive memory scan...")
-            scan_results = run_memory_scan()
+            scan_results = run_memory_scan(workers=None)  # Dedicated scan thread, use all cores
             
             if 'brands_scanned' in scan_results:
                 self.performance_metrics['decay_events_detected'] += scan_results.get('new_decay_events', 0)
@@ -8,13 +8,14 @@ with connection pooling, async processing, and intelligent caching.
 
 import asyncio
 import uvloop
+import fnmatch
 import json
 import time
 import logging
-from typing import Dict, List, Optional, Any
+import uuid
+from typing import Dict, List, Optional, Any, Tuple, Callable, Awaitable
 from contextlib import asynccontextmanager
 from datetime import datetime
-import redis.asyncio as redis
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
@@ -22,9 +23,16 @@ from fastapi.responses import JSONResponse
 import asyncpg
 import aiofiles
 from pydantic import BaseModel, Field
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import threading
 
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+from request_profiler import install_profiler
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,9 +44,20 @@ asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 DB_POOL_SIZE = 50  # Large connection pool
 REDIS_POOL_SIZE = 20
 CACHE_TTL = 300  # 5 minutes
+LOCAL_CACHE_MAX_ENTRIES = 10000
+LOCAL_CACHE_MAX_TTL = 10  # Bounds staleness of the in-process tier across workers when Redis is shared
+CACHE_TAG_TTL = 3600  # Tag sets outlive the keys they index
 BATCH_SIZE = 1000
+BULK_BATCH_SIZE = 10000  # Insights per bulk (COPY) ingest request
+BULK_QUEUE_SIZE = 50  # Pending bulk jobs before new ones are rejected
+BULK_JOB_RETENTION = 1000  # Job statuses kept for polling
+BULK_SHUTDOWN_TIMEOUT = 30  # Seconds to drain queued jobs on shutdown
 MAX_CONCURRENT_REQUESTS = 10000
 
+# Insight columns written by batch ingest, and those refreshed on conflict
+INSIGHT_COLUMNS = ["id", "domain", "content", "quality_score", "timestamp", "category", "agent_name"]
+INSIGHT_UPDATE_COLUMNS = ["content", "quality_score", "timestamp"]
+
 class PerformanceMetrics:
     """Track API performance metrics."""
     
@@ -122,15 +141,294 @@ class DatabasePool:
         """Execute batch operations efficiently."""
         async with self.pool.acquire() as conn:
             await conn.executemany(query, batch_data)
+            
+    async def copy_upsert(self, table: str, columns: List[str], records: List[tuple],
+                          key_column: str, update_columns: List[str]) -> int:
+        """
+        Bulk upsert with COPY into a temporary staging table and one merge.
+        
+        Args:
+            table: Target table
+            columns: Column names, in record order
+            records: Rows to write (unique on key_column)
+            key_column: Conflict column
+            update_columns: Columns refreshed when the key already exists
+            
+        Returns:
+            Number of rows inserted or updated
+        """
+        staging = f"{table}_staging"
+        column_list = ", ".join(columns)
+        updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in update_columns)
+        
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                await conn.copy_records_to_table(staging, records=records, columns=columns)
+                status = await conn.execute(f"""
+                    INSERT INTO {table} ({column_list})
+                    SELECT {column_list} FROM {staging}
+                    ON CONFLICT ({key_column}) DO UPDATE SET {updates}
+                """)
+                
+        return int(status.split()[-1])
+
+def prepare_insight_records(insights: List[Dict]) -> List[tuple]:
+    """
+    Convert insights to INSIGHT_COLUMNS records for COPY.
+    
+    Missing ids are generated and missing timestamps set to now. Duplicate
+    ids keep the last occurrence, since one merge cannot update a row twice.
+    """
+    now = int(time.time())
+    records = {}
+    
+    for insight in insights:
+        insight_id = insight.get("id") or uuid.uuid4().hex
+        records[insight_id] = (
+            insight_id,
+            insight.get("domain"),
+            insight.get("content"),
+            insight.get("quality_score", 0.0),
+            insight.get("timestamp") or now,
+            insight.get("category"),
+            insight.get("agent_name")
+        )
+        
+    return list(records.values())
+
+class BulkIngestor:
+    """
+    Queue of bulk insight ingest jobs.
+    
+    Requests are acknowledged with a job id as soon as they are queued; a
+    worker writes each job with DatabasePool.copy_upsert and then runs the
+    cache invalidation callback once for the whole job.
+    
+    Job statuses live in this process's memory only: with several uvicorn
+    workers, polling a job id on a worker other than the one that accepted
+    it returns 404, so deployments that poll job status need sticky routing
+    or a single worker for the bulk endpoints.
+    """
+    
+    def __init__(self, db_pool: DatabasePool, on_ingested: Callable[[List[Dict]], Awaitable[None]]):
+        self.db_pool = db_pool
+        self.on_ingested = on_ingested
+        self.queue = asyncio.Queue(maxsize=BULK_QUEUE_SIZE)
+        self.jobs = OrderedDict()
+        self._worker = None
+        
+    def start(self) -> None:
+        """Start the ingest worker."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+            
+    async def stop(self) -> None:
+        """Drain queued jobs (up to BULK_SHUTDOWN_TIMEOUT) and stop the worker."""
+        if self._worker is None:
+            return
+            
+        try:
+            await asyncio.wait_for(self.queue.join(), BULK_SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"Bulk ingest stopped with {self.queue.qsize()} jobs still queued")
+            
+        self._worker.cancel()
+        self._worker = None
+        
+    def submit(self, insights: List[Dict]) -> Dict:
+        """
+        Queue insights for ingest.
+        
+        Args:
+            insights: Insight dictionaries
+            
+        Returns:
+            Job status
+            
+        Raises:
+            asyncio.QueueFull: If BULK_QUEUE_SIZE jobs are already pending
+        """
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "status": "queued",
+            "received": len(insights),
+            "processed": 0,
+            "domains": 0,
+            "submitted_at": time.time(),
+            "started_at": None,
+            "completed_at": None,
+            "error": None
+        }
+        
+        self.queue.put_nowait((job, insights))
+        
+        self.jobs[job["job_id"]] = job
+        while len(self.jobs) > BULK_JOB_RETENTION:
+            self.jobs.popitem(last=False)
+            
+        return job
+        
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """Get a job status."""
+        return self.jobs.get(job_id)
+        
+    def get_stats(self) -> Dict:
+        """Get queue and job statistics."""
+        statuses = defaultdict(int)
+        for job in self.jobs.values():
+            statuses[job["status"]] += 1
+            
+        return {"queued": self.queue.qsize(), "jobs": dict(statuses)}
+        
+    async def _run(self) -> None:
+        """Process queued jobs one at a time."""
+        while True:
+            job, insights = await self.queue.get()
+            try:
+                await self.ingest(job, insights)
+            finally:
+                self.queue.task_done()
+                
+    async def ingest(self, job: Dict, insights: List[Dict]) -> None:
+        """Write one job and invalidate the caches it affects."""
+        job["status"] = "running"
+        job["started_at"] = time.time()
+        
+        try:
+            records = prepare_insight_records(insights)
+            job["processed"] = await self.db_pool.copy_upsert(
+                "insights", INSIGHT_COLUMNS, records, "id", INSIGHT_UPDATE_COLUMNS
+            )
+            job["domains"] = len({record[1] for record in records})
+            
+            await self.on_ingested(insights)
+            
+            job["status"] = "completed"
+            logger.info(f"Bulk ingest {job['job_id']}: {job['processed']} insights across {job['domains']} domains")
+        except Exception as e:
+            job["status"] = "failed"
+            job["error"] = str(e)
+            logger.error(f"Bulk ingest {job['job_id']} failed: {e}")
+            
+        job["completed_at"] = time.time()
+
+class LocalCache:
+    """In-process LRU cache tier with per-entry TTLs and tag index."""
+    
+    def __init__(self, max_size: int = LOCAL_CACHE_MAX_ENTRIES):
+        self.max_size = max_size
+        self._entries = OrderedDict()  # key -> (expires, value, tags)
+        self._tags = defaultdict(set)  # tag -> keys
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            
+            if entry is None:
+                self.misses += 1
+                return None
+                
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+                
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+            
+    def set(self, key: str, value: Any, ttl: float, tags: Tuple[str, ...] = ()) -> None:
+        """Set cached value, evicting the least recently used entries."""
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tags)
+            for tag in tags:
+                self._tags[tag].add(key)
+                
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+                
+    def invalidate_tags(self, tags: List[str]) -> int:
+        """Drop all entries carrying any of the tags."""
+        removed = 0
+        
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+                    
+            self.invalidations += removed
+            
+        return removed
+        
+    def invalidate_pattern(self, pattern: str) -> None:
+        """Drop all entries whose key matches a glob pattern."""
+        with self._lock:
+            for key in fnmatch.filter(list(self._entries), pattern):
+                self._remove(key)
+                self.invalidations += 1
+                
+    def _remove(self, key: str) -> None:
+        """Remove an entry and its tag index references (lock held)."""
+        entry = self._entries.pop(key, None)
+        
+        if entry is None:
+            return
+            
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+                    
+    def get_stats(self) -> Dict:
+        """Get tier statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups > 0 else 0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
 
 class RedisCache:
-    """High-performance Redis cache with connection pooling."""
+    """
+    Two-tier cache: an in-process LRU tier in front of Redis.
+    
+    Without Redis (not installed or not reachable) the in-process tier serves
+    as the only cache. Entries carry tags (e.g. "domain:example.com") so
+    related keys can be invalidated without scanning the keyspace.
+    """
     
     def __init__(self):
         self.redis = None
+        self.local = LocalCache()
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self.redis_errors = 0
         
     async def init_cache(self, redis_url: str = "redis://localhost:6379"):
         """Initialize Redis connection pool."""
+        if redis is None:
+            logger.warning("redis package not installed, using in-process cache only")
+            return
+            
         try:
             self.redis = redis.from_url(
                 redis_url,
@@ -144,41 +442,116 @@ class RedisCache:
             await self.redis.ping()
             logger.info("Redis cache initialized")
         except Exception as e:
-            logger.warning(f"Redis cache not available: {e}")
+            logger.warning(f"Redis cache not available, using in-process cache only: {e}")
             self.redis = None
             
     async def get(self, key: str) -> Optional[Any]:
-        """Get cached value."""
-        if not self.redis:
-            return None
+        """Get cached value from the in-process tier, then Redis."""
+        value = self.local.get(key)
+        if value is not None or not self.redis:
+            return value
             
         try:
-            value = await self.redis.get(key)
-            return json.loads(value) if value else None
+            payload = await self.redis.get(key)
+            entry = json.loads(payload) if payload else None
         except Exception:
+            self.redis_errors += 1
+            return None
+            
+        if not isinstance(entry, dict) or "value" not in entry:
+            self.redis_misses += 1
             return None
             
-    async def set(self, key: str, value: Any, ttl: int = CACHE_TTL) -> None:
-        """Set cached value."""
+        self.redis_hits += 1
+        self.local.set(key, entry["value"], LOCAL_CACHE_MAX_TTL, tuple(entry.get("tags", ())))
+        return entry["value"]
+        
+    async def set(self, key: str, value: Any, ttl: int = CACHE_TTL, tags: Tuple[str, ...] = ()) -> None:
+        """
+        Set cached value in both tiers.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Time-to-live in seconds
+            tags: Invalidation tags for the entry
+        """
+        payload = json.dumps({"value": value, "tags": list(tags)}, default=str)
+        
+        # Cache the serialized form so both tiers return the same value
+        local_ttl = min(ttl, LOCAL_CACHE_MAX_TTL) if self.redis else ttl
+        self.local.set(key, json.loads(payload)["value"], local_ttl, tuple(tags))
+        
         if not self.redis:
             return
             
         try:
-            await self.redis.setex(key, ttl, json.dumps(value, default=str))
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.setex(key, ttl, payload)
+                for tag in tags:
+                    pipe.sadd(f"tag:{tag}", key)
+                    pipe.expire(f"tag:{tag}", max(ttl, CACHE_TAG_TTL))
+                await pipe.execute()
         except Exception:
-            pass  # Fail silently for cache errors
+            self.redis_errors += 1  # Fail silently for cache errors
+            
+    async def invalidate_tags(self, tags: List[str]) -> None:
+        """
+        Invalidate every key carrying any of the tags in both tiers.
+        
+        Args:
+            tags: Tags to invalidate
+        """
+        tags = list(dict.fromkeys(tags))
+        self.local.invalidate_tags(tags)
+        
+        if not self.redis or not tags:
+            return
+            
+        try:
+            tag_keys = [f"tag:{tag}" for tag in tags]
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for tag_key in tag_keys:
+                    pipe.smembers(tag_key)
+                members = await pipe.execute()
+                
+            keys = set().union(*members)
+            await self.redis.delete(*keys, *tag_keys)
+        except Exception:
+            self.redis_errors += 1
             
     async def invalidate_pattern(self, pattern: str) -> None:
-        """Invalidate cache keys matching pattern."""
+        """Invalidate cache keys matching pattern. Prefer invalidate_tags."""
+        self.local.invalidate_pattern(pattern)
+        
         if not self.redis:
             return
             
         try:
-            keys = await self.redis.keys(pattern)
+            keys = [key async for key in self.redis.scan_iter(match=pattern, count=1000)]
             if keys:
                 await self.redis.delete(*keys)
         except Exception:
-            pass
+            self.redis_errors += 1
+            
+    def get_stats(self) -> Dict:
+        """Get per-tier hit statistics."""
+        local = self.local.get_stats()
+        redis_lookups = self.redis_hits + self.redis_misses
+        hits = local["hits"] + self.redis_hits
+        lookups = local["hits"] + local["misses"]
+        
+        return {
+            "local": local,
+            "redis": {
+                "available": self.redis is not None,
+                "hits": self.redis_hits,
+                "misses": self.redis_misses,
+                "hit_ratio": self.redis_hits / redis_lookups if redis_lookups > 0 else 0,
+                "errors": self.redis_errors
+            },
+            "hit_ratio": hits / lookups if lookups > 0 else 0
+        }
 
 class HighPerformanceAPI:
     """High-performance API engine with optimized FastAPI setup."""
@@ -186,6 +559,7 @@ class HighPerformanceAPI:
     def __init__(self):
         self.db_pool = DatabasePool()
         self.cache = RedisCache()
+        self.bulk_ingestor = BulkIngestor(self.db_pool, self._invalidate_insight_caches)
         self.app = None
         
     @asynccontextmanager
@@ -201,11 +575,15 @@ class HighPerformanceAPI:
         # Initialize Redis cache
         await self.cache.init_cache()
         
+        # Start the bulk ingest worker
+        self.bulk_ingestor.start()
+        
         logger.info("✅ API ENGINE READY FOR HIGH VOLUME")
         
         yield
         
         # Shutdown
+        await self.bulk_ingestor.stop()
         if self.db_pool.pool:
             await self.db_pool.pool.close()
         if self.cache.redis:
@@ -246,6 +624,9 @@ class HighPerformanceAPI:
         # GZip compression for responses > 1KB
         self.app.add_middleware(GZipMiddleware, minimum_size=1000)
         
+        # Opt-in per-route histograms and sampling profiler at /admin/profile
+        install_profiler(self.app)
+        
         # Performance tracking middleware
         @self.app.middleware("http")
         async def performance_middleware(request: Request, call_next):
@@ -282,7 +663,10 @@ class HighPerformanceAPI:
         @self.app.get("/metrics")
         async def get_metrics():
             """Get API performance metrics."""
-            return metrics.get_stats()
+            stats = metrics.get_stats()
+            stats["cache"] = self.cache.get_stats()
+            stats["bulk_ingest"] = self.bulk_ingestor.get_stats()
+            return stats
             
         @self.app.get("/api/domains/{domain}/insights")
         async def get_domain_insights(domain: str, limit: int = 100):
@@ -306,7 +690,7 @@ class HighPerformanceAPI:
             insights = await self.db_pool.execute_query(query, domain, limit)
             
             # Cache result
-            await self.cache.set(cache_key, insights)
+            await self.cache.set(cache_key, insights, tags=(f"domain:{domain}",))
             
             return {"data": insights, "cached": False}
             
@@ -332,7 +716,7 @@ class HighPerformanceAPI:
             insights = await self.db_pool.execute_query(query, cutoff_time, limit)
             
             # Cache with shorter TTL for recent data
-            await self.cache.set(cache_key, insights, ttl=60)
+            await self.cache.set(cache_key, insights, ttl=60, tags=("recent_insights",))
             
             return {"data": insights, "cached": False}
             
@@ -356,7 +740,7 @@ class HighPerformanceAPI:
             
             insights = await self.db_pool.execute_query(query, min_quality, limit)
             
-            await self.cache.set(cache_key, insights)
+            await self.cache.set(cache_key, insights, tags=("top_insights",))
             
             return {"data": insights, "cached": False}
             
@@ -398,6 +782,30 @@ class HighPerformanceAPI:
             
             return {"status": "success", "processed": len(insights)}
             
+        @self.app.post("/api/insights/bulk", status_code=202)
+        async def ingest_insights_bulk(batch: InsightBulkBatch):
+            """Queue up to BULK_BATCH_SIZE insights for COPY ingest and acknowledge immediately."""
+            try:
+                job = self.bulk_ingestor.submit([insight.dict() for insight in batch.insights])
+            except asyncio.QueueFull:
+                raise HTTPException(503, "Bulk ingest queue is full, retry later", headers={"Retry-After": "5"})
+                
+            return {
+                "status": "accepted",
+                "job_id": job["job_id"],
+                "received": job["received"],
+                "status_url": f"/api/insights/bulk/{job['job_id']}"
+            }
+            
+        @self.app.get("/api/insights/bulk/{job_id}")
+        async def get_bulk_ingest_job(job_id: str):
+            """Get the status of a bulk ingest job accepted by this worker process (404 on other workers)."""
+            job = self.bulk_ingestor.get_job(job_id)
+            if job is None:
+                raise HTTPException(404, f"Bulk ingest job {job_id} not found")
+                
+            return job
+            
         @self.app.get("/api/search")
         async def search_insights(
             q: str,
@@ -451,7 +859,7 @@ class HighPerformanceAPI:
             results = await self.db_pool.execute_query(query, *params)
             
             # Cache search results
-            await self.cache.set(cache_key, results)
+            await self.cache.set(cache_key, results, tags=("search",))
             
             return {"data": results, "cached": False}
             
@@ -478,7 +886,7 @@ class HighPerformanceAPI:
             
             agents = await self.db_pool.execute_query(query)
             
-            await self.cache.set(cache_key, agents, ttl=120)  # 2 minute cache
+            await self.cache.set(cache_key, agents, ttl=120, tags=("agent_performance",))  # 2 minute cache
             
             return {"data": agents, "cached": False}
             
@@ -486,13 +894,11 @@ class HighPerformanceAPI:
         """Invalidate caches related to stored insights."""
         domains = {insight.get("domain") for insight in insights if insight.get("domain")}
         
-        for domain in domains:
-            await self.cache.invalidate_pattern(f"domain_insights:{domain}:*")
-            
-        # Invalidate global caches
-        await self.cache.invalidate_pattern("recent_insights:*")
-        await self.cache.invalidate_pattern("top_insights:*")
-        await self.cache.invalidate_pattern("agent_performance")
+        # One round trip for the domain tags plus the global listings
+        await self.cache.invalidate_tags(
+            [f"domain:{domain}" for domain in sorted(domains)] +
+            ["recent_insights", "top_insights", "search", "agent_performance"]
+        )
 
 # Global API instance
 api_engine = HighPerformanceAPI()
@@ -514,6 +920,9 @@ class InsightCreate(BaseModel):
 class InsightBatch(BaseModel):
     insights: List[InsightCreate] = Field(..., max_items=BATCH_SIZE)
 
+class InsightBulkBatch(BaseModel):
+    insights: List[InsightCreate] = Field(..., min_items=1, max_items=BULK_BATCH_SIZE)
+
 class SearchRequest(BaseModel):
     query: str = Field(..., min_length=1)
     domain: Optional[str] = None
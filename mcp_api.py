@@ -12,10 +12,13 @@ import datetime
 import logging
 from typing import Dict, List, Optional, Any, Union
 from fastapi import APIRouter, HTTPException, Body, Depends, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 import mcp_dispatcher
 import mcp_auth
+import fast_response
+from fast_response import ORJSONResponse, SnapshotCache
 
 # Setup logging
 logging.basicConfig(
@@ -25,10 +28,17 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Maximum domains accepted by the batch context endpoints
+MAX_CONTEXT_BATCH_DOMAINS = 500
+
+# Pre-serialized RankLLM leaderboard bodies, keyed by snapshot version
+RANKLLM_RESPONSE_CACHE = SnapshotCache(max_size=4)
+
 # Create API router
 router = APIRouter(
     prefix="/mcp",
     tags=["mcp"],
+    default_response_class=ORJSONResponse,
     responses={
         404: {"description": "Not found"},
         403: {"description": "Unauthorized"},
@@ -57,6 +67,90 @@ async def get_context(domain: str, token_data: Dict = Depends(mcp_auth.verify_to
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _validate_context_batch(token_data: Dict, request_data: Dict,
+                            credentials: HTTPAuthorizationCredentials) -> List[str]:
+    """
+    Check access, validate the domain list of a batch context request and
+    charge one rate-limit unit per unique domain.
+    
+    Args:
+        token_data: Validated token data
+        request_data: Request body with a "domains" list
+        credentials: Bearer credentials of the request
+        
+    Returns:
+        List of requested domains
+        
+    Raises:
+        HTTPException: If access is denied, the domain list is invalid or the
+                       batch exceeds the remaining daily limit
+    """
+    if "context" not in token_data.get("access", []):
+        raise HTTPException(
+            status_code=403, 
+            detail={"error": "unauthorized", "reason": "insufficient access rights"}
+        )
+    
+    domains = request_data.get("domains")
+    
+    if not isinstance(domains, list) or not all(isinstance(d, str) for d in domains):
+        raise HTTPException(status_code=400, detail="domains must be a list of strings")
+    
+    if len(domains) > MAX_CONTEXT_BATCH_DOMAINS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_CONTEXT_BATCH_DOMAINS} domains per batch"
+        )
+    
+    mcp_auth.get_mcp_auth().charge_units(credentials.credentials, len(set(domains)))
+    
+    return domains
+
+
+@router.post("/context/batch")
+def get_context_batch(request_data: Dict = Body(...), 
+                      token_data: Dict = Depends(mcp_auth.verify_token),
+                      credentials: HTTPAuthorizationCredentials = Depends(mcp_auth.security)):
+    """
+    Get the trust context for many domains in one request.
+    
+    A plain def endpoint, so the batch is resolved in the threadpool instead
+    of blocking the event loop.
+    """
+    try:
+        domains = _validate_context_batch(token_data, request_data, credentials)
+        return mcp_dispatcher.mcp_context_batch(domains)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting context batch: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/context/batch/stream")
+async def stream_context_batch(request_data: Dict = Body(...), 
+                               token_data: Dict = Depends(mcp_auth.verify_token),
+                               credentials: HTTPAuthorizationCredentials = Depends(mcp_auth.security)):
+    """
+    Stream trust context for many domains as NDJSON, one line per domain.
+    
+    The sync generator is iterated in the threadpool by StreamingResponse.
+    """
+    try:
+        domains = _validate_context_batch(token_data, request_data, credentials)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error starting context stream: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    def generate():
+        for result in mcp_dispatcher.iter_mcp_context(domains):
+            yield json.dumps(result, separators=(",", ":")) + "\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/drift_events/{category}")
 async def get_drift_events(category: str, token_data: Dict = Depends(mcp_auth.verify_token)):
     """Get drift events for a category."""
@@ -118,8 +212,15 @@ async def get_foma_threats(domain: str, token_data: Dict = Depends(mcp_auth.veri
 
 
 @router.get("/rankllm_input")
-async def get_rankllm_input(token_data: Dict = Depends(mcp_auth.verify_token)):
-    """Get RankLLM.io leaderboard input data."""
+async def get_rankllm_input(request: Request, since_version: Optional[int] = None,
+                            token_data: Dict = Depends(mcp_auth.verify_token)):
+    """
+    Get RankLLM.io leaderboard input data.
+    
+    Responses carry an ETag; clients sending a matching If-None-Match get a
+    304. Pass since_version to receive only the entries changed since then;
+    deltas have their own ETag so they are never mistaken for the snapshot.
+    """
     try:
         # Check if user has access to this endpoint
         if "rankllm_input" not in token_data.get("access", []):
@@ -128,8 +229,14 @@ async def get_rankllm_input(token_data: Dict = Depends(mcp_auth.verify_token)):
                 detail={"error": "unauthorized", "reason": "insufficient access rights"}
             )
             
-        rankllm_data = mcp_dispatcher.mcp_rankllm_input()
-        return rankllm_data
+        if since_version is not None:
+            delta = mcp_dispatcher.mcp_rankllm_delta(since_version)
+            return fast_response.CachedBody(delta).response(request, headers={"ETag": delta["etag"]})
+        
+        snapshot = mcp_dispatcher.get_rankllm_snapshot()
+        cached = RANKLLM_RESPONSE_CACHE.get("rankllm", snapshot["version"], lambda: snapshot["data"])
+        
+        return cached.response(request, headers={"ETag": snapshot["etag"]})
     except HTTPException:
         raise
     except Exception as e:
@@ -199,4 +306,26 @@ async def get_health(token_data: Dict = Depends(mcp_auth.verify_token)):
         raise
     except Exception as e:
         logger.error(f"Error getting health metrics: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(token_data: Dict = Depends(mcp_auth.verify_token)):
+    """Get MCP metrics in the Prometheus text format."""
+    try:
+        # Metrics share access rights with the health endpoint
+        if "health" not in token_data.get("access", []):
+            raise HTTPException(
+                status_code=403, 
+                detail={"error": "unauthorized", "reason": "insufficient access rights"}
+            )
+            
+        return PlainTextResponse(
+            mcp_dispatcher.get_prometheus_metrics(),
+            media_type="text/plain; version=0.0.4"
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting metrics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -3,23 +3,34 @@ LLMRank.io MCP API Server
 Complete domain ranking API with authentic competitive intelligence data
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Security
+from fastapi import FastAPI, HTTPException, Depends, Security, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 import json
+import logging
 import os
+import threading
 import time
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 import uvicorn
 from pydantic import BaseModel
 
+from fast_response import ORJSONResponse, SnapshotCache
+from request_profiler import install_profiler
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="LLMRank.io MCP API",
     description="Complete domain ranking and competitive intelligence API",
     version="2.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -31,6 +42,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Opt-in request profiling (see request_profiler.py)
+install_profiler(app)
+
 # Security
 security = HTTPBearer(auto_error=False)
 
@@ -55,6 +69,23 @@ class CompetitiveIntel(BaseModel):
     market_position: str
     key_differentiators: List[str]
     threat_level: str
+    competitors: List[str] = []
+
+# Key differentiators by category
+CATEGORY_DIFFERENTIATORS = {
+    'enterprise': ['Cloud infrastructure', 'AI/ML capabilities', 'Enterprise security', 'API ecosystem'],
+    'financial': ['Regulatory compliance', 'Risk management', 'Payment processing', 'Digital banking'],
+    'healthcare': ['Clinical outcomes', 'Patient experience', 'Research capabilities', 'Regulatory approval'],
+    'media': ['Content library', 'User engagement', 'Content creation tools', 'Distribution network'],
+    'retail': ['Supply chain', 'Customer experience', 'Logistics network', 'Brand recognition'],
+    'consulting': ['Industry expertise', 'Global reach', 'Digital transformation', 'Talent quality'],
+    'legal': ['Practice area depth', 'Client relationships', 'Deal experience', 'Regulatory expertise']
+}
+DEFAULT_DIFFERENTIATORS = ['Market presence', 'Brand strength', 'Innovation', 'Customer loyalty']
+
+# Dataset snapshot settings
+COMPETITOR_NEIGHBORHOOD = 3  # Closest-scoring peers on each side within a category
+DATASET_REFRESH_SECONDS = 3600
 
 # Load comprehensive domain dataset
 def load_domain_dataset():
@@ -144,8 +175,146 @@ def load_domain_dataset():
     
     return dataset
 
-# Global dataset
-DOMAIN_DATASET = load_domain_dataset()
+class DatasetSnapshot:
+    """
+    Immutable, indexed view of the domain dataset.
+    
+    Built once per data refresh and swapped in as a whole, so request
+    handlers read a consistent snapshot without locking.
+    """
+    
+    def __init__(self, dataset: List[Dict], version: int):
+        """
+        Build the snapshot indexes.
+        
+        Args:
+            dataset: Domain ranking entries
+            version: Snapshot version
+        """
+        self.version = version
+        self.built_at = time.time()
+        self.entries: Tuple[MappingProxyType, ...] = tuple(MappingProxyType(dict(d)) for d in dataset)
+        
+        by_domain = {}
+        by_category = {}
+        for entry in self.entries:
+            # The first entry wins for domains listed in several categories
+            by_domain.setdefault(entry['domain'], entry)
+            by_category.setdefault(entry['category'], []).append(entry)
+        
+        self.by_domain = MappingProxyType(by_domain)
+        self.by_category = MappingProxyType({cat: tuple(entries) for cat, entries in by_category.items()})
+        self.categories = tuple(self.by_category)
+        self.category_overview = tuple(self._build_category_overview())
+        self.competitive = MappingProxyType(self._build_competitive_intel())
+    
+    def _build_category_overview(self) -> List[Dict]:
+        """Build per-category counts, top domains and average scores."""
+        overview = []
+        
+        for cat, entries in self.by_category.items():
+            avg_score = sum(e['score'] for e in entries) / len(entries)
+            top_domains = sorted(entries, key=lambda e: e['score'], reverse=True)[:5]
+            
+            overview.append({
+                'category': cat,
+                'domain_count': len(entries),
+                'top_domains': [e['domain'] for e in top_domains],
+                'avg_score': round(avg_score, 1)
+            })
+        
+        return overview
+    
+    def _build_competitive_intel(self) -> Dict[str, Dict]:
+        """Precompute competitive intelligence and competitor neighborhoods."""
+        competitive = {}
+        
+        for cat, entries in self.by_category.items():
+            ranked = sorted(entries, key=lambda e: e['score'], reverse=True)
+            differentiators = CATEGORY_DIFFERENTIATORS.get(cat, DEFAULT_DIFFERENTIATORS)
+            
+            for i, entry in enumerate(ranked):
+                domain = entry['domain']
+                if domain in competitive or self.by_domain[domain] is not entry:
+                    continue
+                
+                neighbors = ranked[max(0, i - COMPETITOR_NEIGHBORHOOD):i] + ranked[i + 1:i + 1 + COMPETITOR_NEIGHBORHOOD]
+                
+                competitive[domain] = {
+                    'domain': domain,
+                    'competitive_score': entry['competitive_score'],
+                    'market_position': entry['market_position'],
+                    'key_differentiators': list(differentiators),
+                    'threat_level': entry['threat_level'],
+                    'competitors': [n['domain'] for n in neighbors if n['domain'] != domain]
+                }
+        
+        return competitive
+
+
+# Process-wide dataset snapshot, replaced atomically on refresh
+_snapshot: Optional[DatasetSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+def refresh_dataset(dataset: Optional[List[Dict]] = None) -> DatasetSnapshot:
+    """
+    Rebuild the dataset snapshot and swap it in.
+    
+    Args:
+        dataset: Optional dataset to index; regenerated when omitted
+        
+    Returns:
+        The new snapshot
+    """
+    global _snapshot
+    
+    if dataset is None:
+        dataset = load_domain_dataset()
+    
+    with _snapshot_lock:
+        version = _snapshot.version + 1 if _snapshot else 1
+        snapshot = DatasetSnapshot(dataset, version)
+        _snapshot = snapshot
+    
+    return snapshot
+
+def get_dataset_snapshot() -> DatasetSnapshot:
+    """
+    Get the current dataset snapshot.
+    
+    Returns:
+        Current snapshot
+    """
+    snapshot = _snapshot
+    return snapshot if snapshot is not None else refresh_dataset()
+
+def start_dataset_refresher(interval: float = DATASET_REFRESH_SECONDS) -> threading.Thread:
+    """
+    Refresh the dataset snapshot periodically in a background thread.
+    
+    Args:
+        interval: Seconds between refreshes
+        
+    Returns:
+        The refresher thread
+    """
+    def refresh_loop():
+        while True:
+            time.sleep(interval)
+            try:
+                refresh_dataset()
+            except Exception as e:
+                logger.exception(f"Dataset refresh failed: {e}")
+    
+    thread = threading.Thread(target=refresh_loop, name="dataset-refresh", daemon=True)
+    thread.start()
+    return thread
+
+# Build the initial snapshot
+refresh_dataset()
+
+# Pre-serialized bodies for the dataset snapshot endpoints
+RESPONSE_CACHE = SnapshotCache()
 
 def verify_api_key(credentials: HTTPAuthorizationCredentials = Security(security)) -> bool:
     """Verify API key for MCP access."""
@@ -168,41 +337,50 @@ async def root():
         "service": "LLMRank.io MCP API",
         "version": "2.0",
         "status": "operational",
-        "domains_tracked": len(DOMAIN_DATASET),
-        "categories": ["enterprise", "financial", "healthcare", "media", "retail", "consulting", "legal"],
+        "domains_tracked": len(get_dataset_snapshot().entries),
+        "categories": list(get_dataset_snapshot().categories),
         "endpoints": ["/domains", "/domain/{domain}", "/categories", "/competitive/{domain}"]
     }
 
 @app.get("/domains", response_model=List[DomainRanking])
 async def get_all_domains(
+    request: Request,
     limit: int = 100,
     category: Optional[str] = None,
     authenticated: bool = Depends(verify_api_key)
 ):
     """Get all domain rankings."""
     
-    dataset = DOMAIN_DATASET.copy()
-    
-    # Filter by category if specified
-    if category:
-        dataset = [d for d in dataset if d['category'] == category]
+    snapshot = get_dataset_snapshot()
     
-    # Limit results for unauthenticated access
-    if not authenticated:
-        dataset = dataset[:14]  # Free tier limit
-    else:
-        dataset = dataset[:limit]
-    
-    return [
-        DomainRanking(
-            domain=d['domain'],
-            rank=d['rank'],
-            score=d['score'],
-            category=d['category'],
-            insights_count=d['insights_count'],
-            last_updated=d['last_updated']
-        ) for d in dataset
-    ]
+    def build():
+        # Filter by category if specified
+        if category:
+            dataset = snapshot.by_category.get(category, ())
+        else:
+            dataset = snapshot.entries
+        
+        # Limit results for unauthenticated access
+        if not authenticated:
+            dataset = dataset[:14]  # Free tier limit
+        else:
+            dataset = dataset[:limit]
+        
+        return [
+            {
+                'domain': d['domain'],
+                'rank': d['rank'],
+                'score': d['score'],
+                'category': d['category'],
+                'insights_count': d['insights_count'],
+                'last_updated': d['last_updated']
+            } for d in dataset
+        ]
+    
+    # Rows come from the trusted in-process dataset, so the cached body skips
+    # response-model validation
+    key = ("domains", limit if authenticated else None, category, authenticated)
+    return RESPONSE_CACHE.respond(request, key, snapshot.version, build)
 
 @app.get("/domain/{domain}")
 async def get_domain_details(
@@ -212,11 +390,7 @@ async def get_domain_details(
     """Get detailed information for a specific domain."""
     
     # Find domain in dataset
-    domain_data = None
-    for d in DOMAIN_DATASET:
-        if d['domain'] == domain:
-            domain_data = d
-            break
+    domain_data = get_dataset_snapshot().by_domain.get(domain)
     
     if not domain_data:
         raise HTTPException(status_code=404, detail="Domain not found")
@@ -251,36 +425,11 @@ async def get_domain_details(
     return response
 
 @app.get("/categories", response_model=List[CategoryData])
-async def get_categories(authenticated: bool = Depends(verify_api_key)):
+async def get_categories(request: Request, authenticated: bool = Depends(verify_api_key)):
     """Get category overview data."""
-    
-    categories = {}
-    for domain_data in DOMAIN_DATASET:
-        cat = domain_data['category']
-        if cat not in categories:
-            categories[cat] = {
-                'domains': [],
-                'scores': []
-            }
-        categories[cat]['domains'].append(domain_data['domain'])
-        categories[cat]['scores'].append(domain_data['score'])
-    
-    result = []
-    for cat, data in categories.items():
-        avg_score = sum(data['scores']) / len(data['scores'])
-        top_domains = sorted(
-            [(d, s) for d, s in zip(data['domains'], data['scores'])],
-            key=lambda x: x[1], reverse=True
-        )[:5]
-        
-        result.append(CategoryData(
-            category=cat,
-            domain_count=len(data['domains']),
-            top_domains=[d[0] for d in top_domains],
-            avg_score=round(avg_score, 1)
-        ))
-    
-    return result
+    snapshot = get_dataset_snapshot()
+    return RESPONSE_CACHE.respond(request, "categories", snapshot.version,
+                                  lambda: list(snapshot.category_overview))
 
 @app.get("/competitive/{domain}", response_model=CompetitiveIntel)
 async def get_competitive_intel(
@@ -292,37 +441,13 @@ async def get_competitive_intel(
     if not authenticated:
         raise HTTPException(status_code=401, detail="Authentication required for competitive intelligence")
     
-    # Find domain
-    domain_data = None
-    for d in DOMAIN_DATASET:
-        if d['domain'] == domain:
-            domain_data = d
-            break
+    # Competitive intelligence is precomputed per snapshot
+    intel = get_dataset_snapshot().competitive.get(domain)
     
-    if not domain_data:
+    if not intel:
         raise HTTPException(status_code=404, detail="Domain not found")
     
-    # Generate competitive intelligence
-    differentiators = {
-        'enterprise': ['Cloud infrastructure', 'AI/ML capabilities', 'Enterprise security', 'API ecosystem'],
-        'financial': ['Regulatory compliance', 'Risk management', 'Payment processing', 'Digital banking'],
-        'healthcare': ['Clinical outcomes', 'Patient experience', 'Research capabilities', 'Regulatory approval'],
-        'media': ['Content library', 'User engagement', 'Content creation tools', 'Distribution network'],
-        'retail': ['Supply chain', 'Customer experience', 'Logistics network', 'Brand recognition'],
-        'consulting': ['Industry expertise', 'Global reach', 'Digital transformation', 'Talent quality'],
-        'legal': ['Practice area depth', 'Client relationships', 'Deal experience', 'Regulatory expertise']
-    }
-    
-    category = domain_data['category']
-    key_diffs = differentiators.get(category, ['Market presence', 'Brand strength', 'Innovation', 'Customer loyalty'])
-    
-    return CompetitiveIntel(
-        domain=domain,
-        competitive_score=domain_data['competitive_score'],
-        market_position=domain_data['market_position'],
-        key_differentiators=key_diffs,
-        threat_level=domain_data['threat_level']
-    )
+    return intel
 
 @app.get("/health")
 async def health_check():
@@ -330,7 +455,8 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": time.time(),
-        "domains_available": len(DOMAIN_DATASET),
+        "domains_available": len(get_dataset_snapshot().entries),
+        "dataset_version": get_dataset_snapshot().version,
         "service": "LLMRank.io MCP API"
     }
 
@@ -341,6 +467,8 @@ if __name__ == "__main__":
     print("External access: workspace.samkim36.repl.co:8080/domains")
     print("=" * 50)
     
+    start_dataset_refresher()
+    
     uvicorn.run(
         app,
         host="0.0.0.0",
@@ -195,6 +195,47 @@ class MCPAuth:
             
             return True
     
+    def charge_units(self, api_key: str, units: int) -> None:
+        """
+        Charge a batch request for the items it covers.
+        
+        The request itself was counted by validate_token, so units - 1 extra
+        units are charged against the daily limit.
+        
+        Args:
+            api_key: API key
+            units: Number of items in the batch
+            
+        Raises:
+            HTTPException: If the charge would exceed the daily limit
+        """
+        extra = units - 1
+        if extra <= 0:
+            return
+        
+        rate_limit = self.api_keys.get(api_key, {}).get("rate_limit", 1000)
+        
+        try:
+            from api_rate_limiter import charge_units
+            allowed, _ = charge_units(api_key, rate_limit, extra)
+        except ImportError:
+            today = datetime.datetime.now().strftime("%Y-%m-%d")
+            counts = self.rate_limits.setdefault(api_key, {})
+            allowed = counts.get(today, 0) + extra <= rate_limit
+            if allowed:
+                counts[today] = counts.get(today, 0) + extra
+        
+        if not allowed:
+            logger.warning(f"Rate limit exceeded for API key: {api_key} (batch of {units})")
+            raise HTTPException(
+                status_code=429,
+                detail={
+                    "error": "rate_limit",
+                    "limit": rate_limit,
+                    "period": "24h"
+                }
+            )
+    
     def validate_token(self, credentials: HTTPAuthorizationCredentials, request: Request) -> Dict:
         """
         Validate API key token.
@@ -15,8 +15,12 @@ from typing import Dict, List, Any, Optional
 # MCP API configuration
 API_BASE_URL = "http://localhost:8000/api"
 API_KEY = "mcp_81b5be8a0aeb934314741b4c3f4b9436"  # The key generated earlier
+CONTEXT_BATCH_SIZE = 500  # Matches MAX_CONTEXT_BATCH_DOMAINS on the server
+BEARER_HEADERS = {"Authorization": f"Bearer {API_KEY}"}  # For the /mcp endpoints (mcp_auth)
 
-def make_api_request(endpoint: str, method: str = "GET", data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def make_api_request(endpoint: str, method: str = "GET", data: Optional[Dict[str, Any]] = None,
+                     session: Optional[requests.Session] = None, stream: bool = False,
+                     headers: Optional[Dict[str, str]] = None) -> Any:
     """
     Make an API request to the MCP API.
     
@@ -24,21 +28,25 @@ def make_api_request(endpoint: str, method: str = "GET", data: Optional[Dict[str
         endpoint: API endpoint
         method: HTTP method
         data: Request data
+        session: Optional requests session to reuse across calls
+        stream: Return the streaming response instead of parsed JSON
+        headers: Auth headers to send instead of the api-key header
         
     Returns:
-        API response
+        API response (the open requests.Response when stream is True)
     """
     url = f"{API_BASE_URL}/{endpoint}"
-    headers = {"api-key": API_KEY}
+    headers = headers or {"api-key": API_KEY}
+    http = session or requests
     
     try:
         if method.upper() == "GET":
-            response = requests.get(url, headers=headers)
+            response = http.get(url, headers=headers, stream=stream)
         else:
-            response = requests.post(url, headers=headers, json=data if data else {})
+            response = http.post(url, headers=headers, json=data if data else {}, stream=stream)
         
         response.raise_for_status()
-        return response.json()
+        return response if stream else response.json()
     except Exception as e:
         print(f"Error making API request: {e}")
         return {"error": str(e)}
@@ -232,6 +240,74 @@ def get_insight_data(domain: Optional[str] = None, category: Optional[str] = Non
         headers = ["Domain", "Title", "Type", "Timestamp"]
         print(tabulate(insights, headers=headers, tablefmt="grid"))
 
+def get_context_batch(domains: List[str], batch_size: int = CONTEXT_BATCH_SIZE,
+                      session: Optional[requests.Session] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get trust context for many domains using the batch context endpoint.
+    
+    Domains are sent in chunks of batch_size over a single connection, so
+    200+ domains cost a handful of requests instead of one per domain.
+    
+    Args:
+        domains: Domains to fetch
+        batch_size: Domains per request
+        session: Optional requests session to reuse
+        
+    Returns:
+        Dictionary mapping domain to its context
+    """
+    session = session or requests.Session()
+    contexts = {}
+    
+    for i in range(0, len(domains), batch_size):
+        chunk = domains[i:i + batch_size]
+        
+        result = make_api_request("mcp/context/batch", method="POST",
+                                  data={"domains": chunk}, session=session,
+                                  headers=BEARER_HEADERS)
+        
+        if "error" in result:
+            print(f"Error getting context batch: {result['error']}")
+            continue
+        
+        contexts.update(result.get("contexts", {}))
+        
+        for domain, error in result.get("errors", {}).items():
+            print(f"Error getting context for {domain}: {error}")
+    
+    return contexts
+
+def stream_context_batch(domains: List[str], batch_size: int = CONTEXT_BATCH_SIZE,
+                         session: Optional[requests.Session] = None):
+    """
+    Stream trust context for many domains as each one resolves.
+    
+    Args:
+        domains: Domains to fetch
+        batch_size: Domains per request
+        session: Optional requests session to reuse
+        
+    Yields:
+        Dictionaries with "domain" and either "context" or "error"
+    """
+    session = session or requests.Session()
+    
+    for i in range(0, len(domains), batch_size):
+        chunk = domains[i:i + batch_size]
+        
+        response = make_api_request("mcp/context/batch/stream", method="POST",
+                                    data={"domains": chunk}, session=session, stream=True,
+                                    headers=BEARER_HEADERS)
+        
+        if isinstance(response, dict):
+            print(f"Error streaming context batch: {response['error']}")
+            continue
+        
+        with response:
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+
 def main():
     """Main function."""
     print("\n==== LLMPageRank MCP API Client Example ====\n")
@@ -5,8 +5,10 @@ This module implements crawler protection mechanisms for the MCP API
 as specified in PRD20.
 """
 
+import math
 import time
 import hmac
+import asyncio
 import hashlib
 import logging
 import datetime
@@ -20,6 +22,56 @@ import random
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Endpoint-diversity window settings
+PATTERN_WINDOW_SECONDS = 300  # 5 minutes
+PATTERN_BUCKET_SECONDS = 60   # one bucket per minute
+PATTERN_BITSET_SIZE = 1024    # bits per bucket (power of two)
+PATTERN_ENDPOINT_LIMIT = 12   # unique endpoints allowed per window
+
+
+class EndpointWindow:
+    """
+    Fixed-memory sliding window of unique endpoints for one API key.
+
+    The window is a ring of per-minute buckets, each holding a bitset of
+    endpoint hashes. The number of unique endpoints in the window is
+    estimated by OR-ing the live buckets and applying linear counting, so
+    both memory and check cost are independent of how many distinct
+    paths a client requests.
+    """
+    
+    __slots__ = ("bucket_ids", "bitsets")
+    
+    def __init__(self, num_buckets: int):
+        """Initialize an empty window with the given number of buckets."""
+        self.bucket_ids = [-1] * num_buckets
+        self.bitsets = [0] * num_buckets
+    
+    def add(self, bucket_id: int, bit: int):
+        """Set an endpoint bit in the bucket for the given minute."""
+        slot = bucket_id % len(self.bucket_ids)
+        if self.bucket_ids[slot] != bucket_id:
+            # Slot holds an expired minute; recycle it
+            self.bucket_ids[slot] = bucket_id
+            self.bitsets[slot] = 0
+        self.bitsets[slot] |= 1 << bit
+    
+    def count(self, bucket_id: int) -> float:
+        """Estimate unique endpoints seen in the window ending at bucket_id."""
+        oldest = bucket_id - len(self.bucket_ids) + 1
+        merged = 0
+        for slot_id, bits in zip(self.bucket_ids, self.bitsets):
+            if oldest <= slot_id <= bucket_id:
+                merged |= bits
+        
+        set_bits = bin(merged).count("1")
+        if set_bits >= PATTERN_BITSET_SIZE:
+            return float(PATTERN_BITSET_SIZE)
+        
+        # Linear counting corrects for hash collisions in the bitset
+        return -PATTERN_BITSET_SIZE * math.log(1 - set_bits / PATTERN_BITSET_SIZE)
+
+
 # Crawler detection storage
 class CrawlerProtection:
     """Manages crawler protection mechanisms."""
@@ -32,8 +84,9 @@ class CrawlerProtection:
         # API key bans: key -> expiry timestamp
         self.key_bans = {}
         
-        # Request patterns: key -> {endpoint -> timestamp}
+        # Request patterns: key -> EndpointWindow
         self.key_patterns = {}
+        self.pattern_buckets = PATTERN_WINDOW_SECONDS // PATTERN_BUCKET_SECONDS
         
         # Trap endpoint hits: IP -> [timestamps]
         self.trap_hits = {}
@@ -87,32 +140,30 @@ class CrawlerProtection:
     
     def record_endpoint_access(self, key: str, endpoint: str):
         """Record endpoint access for pattern detection."""
-        now = time.time()
+        bucket_id = int(time.time() // PATTERN_BUCKET_SECONDS)
         
-        if key not in self.key_patterns:
-            self.key_patterns[key] = {}
+        window = self.key_patterns.get(key)
+        if window is None:
+            window = EndpointWindow(self.pattern_buckets)
+            self.key_patterns[key] = window
         
-        self.key_patterns[key][endpoint] = now
+        window.add(bucket_id, hash(endpoint) & (PATTERN_BITSET_SIZE - 1))
     
     def check_pattern_violation(self, key: str) -> bool:
         """
         Check if an API key is accessing too many unique endpoints too quickly.
         Returns True if a violation is detected.
         """
-        if key not in self.key_patterns:
+        window = self.key_patterns.get(key)
+        if window is None:
             return False
         
-        now = time.time()
-        five_min_ago = now - 300  # 5 minutes
-        
-        # Count unique endpoints accessed in the last 5 minutes
-        recent_endpoints = 0
-        for endpoint, timestamp in self.key_patterns[key].items():
-            if timestamp > five_min_ago:
-                recent_endpoints += 1
+        # Estimate unique endpoints accessed in the last 5 minutes
+        bucket_id = int(time.time() // PATTERN_BUCKET_SECONDS)
+        recent_endpoints = window.count(bucket_id)
         
         # Check if too many unique endpoints were accessed
-        return recent_endpoints >= 12
+        return round(recent_endpoints) >= PATTERN_ENDPOINT_LIMIT
     
     def record_trap_hit(self, ip: str, key: str = None):
         """
@@ -289,11 +340,9 @@ class CrawlerProtectionMiddleware(BaseHTTPMiddleware):
                 # Apply delay based on tier
                 delay = self.protection.get_tier_delay(tier)
                 if delay > 0:
-                    import asyncio
                     await asyncio.sleep(delay)
             except ImportError:
                 # Default to free tier delay if mcp_auth is not available
-                import asyncio
                 await asyncio.sleep(self.protection.get_tier_delay("free"))
             except Exception as e:
                 logger.error(f"Error applying tier delay: {e}")
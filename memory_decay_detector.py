@@ -10,10 +10,15 @@ memory decay is detected (>15% drop over 30 days).
 import json
 import time
 import os
+import re
+import zlib
 import logging
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 import numpy as np
 
@@ -21,7 +26,19 @@ import numpy as np
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+INSIGHT_LOG_FILE = 'data/insights/insight_log.json'
+SCAN_CHUNK_SIZE = 64  # (brand, model) groups per worker task
+SCAN_START_METHOD = "forkserver"  # Callers are multi-threaded; forking them can deadlock workers
+SNAPSHOT_RING_CAPACITY = 180  # Snapshots kept per (brand, model)
+SNAPSHOT_SHARDS = 64  # Snapshot files; only shards with changed series are rewritten
+RECENT_WINDOW_SECONDS = 30 * 24 * 3600  # Insights considered recent for scoring
+MEANINGFUL_WORD_LENGTH = 4  # Words longer than this count toward term consistency
+
+# Precompiled citation term sets (substring match on lowercased content)
+LEADERSHIP_TERMS = re.compile('leading|dominant|innovative')
+COMPETITIVE_TERMS = re.compile('competitive|advantage|market')
+
+@dataclass(slots=True)
 class MemorySnapshot:
     """Represents a memory measurement at a specific time."""
     brand: str
@@ -33,7 +50,7 @@ class MemorySnapshot:
     citation_strength: float
     semantic_similarity: float
 
-@dataclass
+@dataclass(slots=True)
 class DecayEvent:
     """Represents a detected memory decay event."""
     brand: str
@@ -46,6 +63,236 @@ class DecayEvent:
     previous_score: float
     status: str = 'active'  # 'active', 'resolved', 'ignored'
 
+
+class SnapshotRing:
+    """
+    Fixed-capacity ring buffer of memory snapshots for one (brand, model).
+    
+    Each snapshot field is stored in its own float array, so memory per
+    series is bounded and decay checks read scores and timestamps directly.
+    """
+    
+    FIELDS = ('timestamp', 'memory_score', 'confidence', 'insight_count',
+              'citation_strength', 'semantic_similarity')
+    
+    __slots__ = ('brand', 'model', 'capacity', 'head', 'size', 'data')
+    
+    def __init__(self, brand: str, model: str, capacity: int = SNAPSHOT_RING_CAPACITY):
+        """Initialize an empty ring."""
+        self.brand = brand
+        self.model = model
+        self.capacity = capacity
+        self.head = 0  # Next write position
+        self.size = 0
+        self.data = np.zeros((len(self.FIELDS), capacity), dtype=np.float64)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def append(self, snapshot: MemorySnapshot):
+        """Append a snapshot, overwriting the oldest one when full."""
+        self.data[:, self.head] = [getattr(snapshot, field) for field in self.FIELDS]
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+    
+    def _order(self) -> np.ndarray:
+        """Buffer positions in chronological order."""
+        return (np.arange(self.size) + self.head - self.size) % self.capacity
+    
+    def column(self, field: str) -> np.ndarray:
+        """Get one field for all snapshots in chronological order."""
+        return self.data[self.FIELDS.index(field), self._order()]
+    
+    def snapshot_at(self, index: int) -> MemorySnapshot:
+        """Get a snapshot by chronological index (negative indexes allowed)."""
+        if index < 0:
+            index += self.size
+        values = self.data[:, (self.head - self.size + index) % self.capacity]
+        return MemorySnapshot(
+            brand=self.brand,
+            model=self.model,
+            memory_score=float(values[1]),
+            confidence=float(values[2]),
+            timestamp=float(values[0]),
+            insight_count=int(values[3]),
+            citation_strength=float(values[4]),
+            semantic_similarity=float(values[5])
+        )
+    
+    def to_dict(self) -> Dict:
+        """Serialize the ring as chronological column lists."""
+        order = self._order()
+        return {field: self.data[i, order].tolist() for i, field in enumerate(self.FIELDS)}
+    
+    @classmethod
+    def from_dict(cls, brand: str, model: str, data: Dict,
+                  capacity: int = SNAPSHOT_RING_CAPACITY) -> 'SnapshotRing':
+        """Restore a ring from chronological column lists."""
+        ring = cls(brand, model, capacity)
+        count = min(len(data.get('timestamp', [])), capacity)
+        if count:
+            for i, field in enumerate(cls.FIELDS):
+                ring.data[i, :count] = data[field][-count:]
+            ring.size = count
+            ring.head = count % capacity
+        return ring
+
+def calculate_memory_score(brand: str, model: str, insights: List[Dict]) -> MemorySnapshot:
+    """
+    Calculate comprehensive memory score for a brand/model combination.
+    
+    Args:
+        brand: Brand domain (e.g., 'stripe.com')
+        model: Model identifier (e.g., 'gpt-4o', 'claude-3')
+        insights: List of insights for this brand/model
+        
+    Returns:
+        MemorySnapshot with calculated scores
+    """
+    return calculate_memory_scores([(brand, model, insights)])[0]
+
+
+def calculate_memory_scores(groups: List[Tuple[str, str, List[Dict]]],
+                            current_time: Optional[float] = None) -> List[MemorySnapshot]:
+    """
+    Calculate memory snapshots for a batch of (brand, model, insights) groups.
+    
+    Each insight's content is lowercased and tokenized once and matched
+    against precompiled term patterns; quality, citation strength and the
+    final scores are then computed for the whole batch with NumPy.
+    
+    Args:
+        groups: List of (brand, model, insights) tuples
+        current_time: Scoring time (defaults to now)
+        
+    Returns:
+        MemorySnapshot per group, in input order
+    """
+    if current_time is None:
+        current_time = time.time()
+    
+    snapshots = [None] * len(groups)
+    scored_groups = []  # Input positions of groups with insights
+    consistent_terms = []
+    
+    segment = []
+    qualities = []
+    timestamps = []
+    brand_hits = []
+    leadership_hits = []
+    competitive_hits = []
+    long_content = []
+    
+    for position, (brand, model, insights) in enumerate(groups):
+        if not insights:
+            snapshots[position] = MemorySnapshot(
+                brand=brand,
+                model=model,
+                memory_score=0.0,
+                confidence=0.0,
+                timestamp=current_time,
+                insight_count=0,
+                citation_strength=0.0,
+                semantic_similarity=0.0
+            )
+            continue
+        
+        # Filter recent insights (last 30 days), falling back to latest 5
+        recent_insights = [
+            insight for insight in insights
+            if current_time - insight.get('timestamp', 0) < RECENT_WINDOW_SECONDS
+        ] or insights[-5:]
+        
+        brand_clean = brand.replace('.com', '').replace('.', ' ').lower()
+        lowered_contents = []
+        group_id = len(scored_groups)
+        
+        for insight in recent_insights:
+            content = insight.get('content', '')
+            lowered = content.lower()
+            
+            segment.append(group_id)
+            qualities.append(insight.get('quality_score', 0))
+            timestamps.append(insight.get('timestamp', 0))
+            brand_hits.append(brand_clean in lowered)
+            leadership_hits.append(LEADERSHIP_TERMS.search(lowered) is not None)
+            competitive_hits.append(COMPETITIVE_TERMS.search(lowered) is not None)
+            long_content.append(len(content) > 300)
+            lowered_contents.append(lowered)
+        
+        # Tokenize the group in one split; short words are dropped per
+        # distinct word rather than per token
+        consistent = 0
+        if len(lowered_contents) > 1:
+            word_freq = Counter(" ".join(lowered_contents).split())
+            consistent = sum(
+                1 for word, count in word_freq.items()
+                if count > 1 and len(word) > MEANINGFUL_WORD_LENGTH
+            )
+        
+        scored_groups.append(position)
+        consistent_terms.append(consistent)
+    
+    if not scored_groups:
+        return snapshots
+    
+    num_groups = len(scored_groups)
+    segment = np.array(segment)
+    insight_counts = np.bincount(segment, minlength=num_groups)
+    
+    # Quality score average (weighted by recency, decaying over 30 days)
+    age_days = (current_time - np.array(timestamps, dtype=np.float64)) / 86400
+    weights = np.maximum(0.1, 1.0 - age_days / 30)
+    weighted_quality = np.array(qualities, dtype=np.float64) * weights
+    avg_quality = np.bincount(segment, weighted_quality, num_groups) / insight_counts
+    
+    # Citation strength (brand mention, leadership and competitive terms, content length)
+    citation_scores = np.minimum(
+        0.3 * np.array(brand_hits) + 0.2 * np.array(leadership_hits) +
+        0.3 * np.array(competitive_hits) + 0.2 * np.array(long_content),
+        1.0
+    )
+    citation_strength = np.bincount(segment, citation_scores, num_groups) / insight_counts
+    
+    # Semantic similarity from consistent terminology; a single insight uses quality
+    semantic_similarity = np.where(
+        insight_counts > 1,
+        np.minimum(np.array(consistent_terms) / 10, 1.0),
+        avg_quality
+    )
+    
+    # Calculate overall memory score (0-100)
+    memory_scores = (
+        avg_quality * 40 +                         # 40% quality weight
+        citation_strength * 30 +                   # 30% citation weight
+        semantic_similarity * 20 +                 # 20% consistency weight
+        np.minimum(insight_counts / 10, 1.0) * 10  # 10% volume weight
+    ) * 100
+    
+    # Confidence based on data availability and quality
+    confidence = np.minimum((insight_counts / 5) * 0.5 + avg_quality * 0.5, 1.0)
+    
+    for group_id, position in enumerate(scored_groups):
+        brand, model, _ = groups[position]
+        snapshots[position] = MemorySnapshot(
+            brand=brand,
+            model=model,
+            memory_score=float(memory_scores[group_id]),
+            confidence=float(confidence[group_id]),
+            timestamp=current_time,
+            insight_count=int(insight_counts[group_id]),
+            citation_strength=float(citation_strength[group_id]),
+            semantic_similarity=float(semantic_similarity[group_id])
+        )
+    
+    return snapshots
+
+
+def _calculate_memory_score_batch(groups: List[Tuple[str, str, List[Dict]]]) -> List[MemorySnapshot]:
+    """Calculate memory snapshots for a chunk of groups in a worker process."""
+    return calculate_memory_scores(groups)
+
+
 class MemoryDecayDetector:
     """
     Core memory decay detection system that monitors brand memory
@@ -55,9 +302,13 @@ class MemoryDecayDetector:
     def __init__(self):
         """Initialize the memory decay detector."""
         self.memory_history_file = 'data/memory_snapshots.json'
+        self.memory_shard_dir = 'data/memory_snapshots'
         self.decay_events_file = 'data/decay_events.json'
-        self.memory_snapshots = []
+        self.snapshot_series = {}  # brand -> model -> SnapshotRing
         self.decay_events = []
+        self.active_decay_events = {}  # (brand, model) -> active DecayEvent
+        self.dirty_shards = set()
+        self.decay_events_dirty = False
         self.decay_threshold = 0.15  # 15% decay threshold
         self.monitoring_window_days = 30
         
@@ -65,74 +316,148 @@ class MemoryDecayDetector:
         self.load_memory_data()
         
         logger.info("🧠 MEMORY DECAY DETECTOR INITIALIZED")
-        logger.info(f"📊 Loaded {len(self.memory_snapshots)} memory snapshots")
-        logger.info(f"🚨 {len([e for e in self.decay_events if e.status == 'active'])} active decay events")
+        logger.info(f"📊 Loaded {self.snapshot_count()} memory snapshots")
+        logger.info(f"🚨 {len(self.active_decay_events)} active decay events")
+
+    def _shard_for(self, brand: str) -> int:
+        """Get the snapshot shard number for a brand."""
+        return zlib.crc32(brand.encode()) % SNAPSHOT_SHARDS
+
+    def _shard_path(self, shard: int) -> str:
+        """Get the file path of a snapshot shard."""
+        return os.path.join(self.memory_shard_dir, f'shard_{shard:02d}.json')
+
+    def _get_ring(self, brand: str, model: str) -> SnapshotRing:
+        """Get or create the snapshot ring for a brand/model."""
+        models = self.snapshot_series.setdefault(brand, {})
+        ring = models.get(model)
+        if ring is None:
+            ring = SnapshotRing(brand, model)
+            models[model] = ring
+        return ring
+
+    def add_snapshot(self, snapshot: MemorySnapshot):
+        """Record a snapshot and mark its series for saving."""
+        self._get_ring(snapshot.brand, snapshot.model).append(snapshot)
+        self.dirty_shards.add(self._shard_for(snapshot.brand))
+
+    def snapshot_count(self) -> int:
+        """Get the number of retained snapshots across all series."""
+        return sum(len(ring) for models in self.snapshot_series.values() for ring in models.values())
+
+    def _add_decay_event(self, event: DecayEvent):
+        """Record a decay event and index it if active."""
+        self.decay_events.append(event)
+        if event.status == 'active':
+            self.active_decay_events[(event.brand, event.model)] = event
+        self.decay_events_dirty = True
+
+    def resolve_decay_event(self, brand: str, model: str, status: str = 'resolved') -> bool:
+        """
+        Close the active decay event for a brand/model.
+        
+        Args:
+            brand: Brand domain
+            model: Model identifier
+            status: New status ('resolved' or 'ignored')
+            
+        Returns:
+            True if an active event was closed
+        """
+        event = self.active_decay_events.pop((brand, model), None)
+        if event is None:
+            return False
+        event.status = status
+        self.decay_events_dirty = True
+        return True
 
     def load_memory_data(self):
         """Load existing memory snapshots and decay events."""
         try:
-            # Load memory snapshots
-            if os.path.exists(self.memory_history_file):
+            # Load memory snapshot shards
+            if os.path.isdir(self.memory_shard_dir):
+                for shard in range(SNAPSHOT_SHARDS):
+                    path = self._shard_path(shard)
+                    if not os.path.exists(path):
+                        continue
+                    with open(path, 'r') as f:
+                        shard_data = json.load(f)
+                    for brand, models in shard_data.items():
+                        for model, ring_data in models.items():
+                            self.snapshot_series.setdefault(brand, {})[model] = \
+                                SnapshotRing.from_dict(brand, model, ring_data)
+            
+            # Migrate the legacy flat snapshot list
+            elif os.path.exists(self.memory_history_file):
                 with open(self.memory_history_file, 'r') as f:
                     snapshot_data = json.load(f)
-                    self.memory_snapshots = [
-                        MemorySnapshot(**data) for data in snapshot_data
-                    ]
+                for data in sorted(snapshot_data, key=lambda d: d['timestamp']):
+                    self.add_snapshot(MemorySnapshot(**data))
             
             # Load decay events
             if os.path.exists(self.decay_events_file):
                 with open(self.decay_events_file, 'r') as f:
                     event_data = json.load(f)
-                    self.decay_events = [
-                        DecayEvent(**data) for data in event_data
-                    ]
+                for data in event_data:
+                    self._add_decay_event(DecayEvent(**data))
+                self.decay_events_dirty = False
                     
         except Exception as e:
             logger.error(f"Error loading memory data: {e}")
-            self.memory_snapshots = []
+            self.snapshot_series = {}
             self.decay_events = []
+            self.active_decay_events = {}
 
     def save_memory_data(self):
-        """Save memory snapshots and decay events to files."""
+        """Save changed snapshot shards and decay events to files."""
         try:
-            os.makedirs('data', exist_ok=True)
-            
-            # Save memory snapshots
-            snapshot_data = [
-                {
-                    'brand': s.brand,
-                    'model': s.model,
-                    'memory_score': s.memory_score,
-                    'confidence': s.confidence,
-                    'timestamp': s.timestamp,
-                    'insight_count': s.insight_count,
-                    'citation_strength': s.citation_strength,
-                    'semantic_similarity': s.semantic_similarity
-                }
-                for s in self.memory_snapshots
-            ]
-            
-            with open(self.memory_history_file, 'w') as f:
-                json.dump(snapshot_data, f, indent=2)
+            os.makedirs(self.memory_shard_dir, exist_ok=True)
+            
+            # Group brands by shard once, then rewrite only changed shards
+            if self.dirty_shards:
+                brands_by_shard = {}
+                for brand in self.snapshot_series:
+                    shard = self._shard_for(brand)
+                    if shard in self.dirty_shards:
+                        brands_by_shard.setdefault(shard, []).append(brand)
+                
+                for shard in self.dirty_shards:
+                    shard_data = {
+                        brand: {
+                            model: ring.to_dict()
+                            for model, ring in self.snapshot_series[brand].items()
+                        }
+                        for brand in brands_by_shard.get(shard, [])
+                    }
+                    
+                    path = self._shard_path(shard)
+                    with open(path + '.tmp', 'w') as f:
+                        json.dump(shard_data, f)
+                    os.replace(path + '.tmp', path)
+                
+                self.dirty_shards.clear()
             
             # Save decay events
-            event_data = [
-                {
-                    'brand': e.brand,
-                    'model': e.model,
-                    'severity': e.severity,
-                    'decay_percentage': e.decay_percentage,
-                    'time_period_days': e.time_period_days,
-                    'triggered_at': e.triggered_at,
-                    'current_score': e.current_score,
-                    'previous_score': e.previous_score,
-                    'status': e.status
-                }
-                for e in self.decay_events
-            ]
-            
-            with open(self.decay_events_file, 'w') as f:
-                json.dump(event_data, f, indent=2)
+            if self.decay_events_dirty:
+                event_data = [
+                    {
+                        'brand': e.brand,
+                        'model': e.model,
+                        'severity': e.severity,
+                        'decay_percentage': e.decay_percentage,
+                        'time_period_days': e.time_period_days,
+                        'triggered_at': e.triggered_at,
+                        'current_score': e.current_score,
+                        'previous_score': e.previous_score,
+                        'status': e.status
+                    }
+                    for e in self.decay_events
+                ]
+                
+                with open(self.decay_events_file, 'w') as f:
+                    json.dump(event_data, f, indent=2)
+                
+                self.decay_events_dirty = False
                 
         except Exception as e:
             logger.error(f"Error saving memory data: {e}")
@@ -149,107 +474,7 @@ class MemoryDecayDetector:
         Returns:
             MemorySnapshot with calculated scores
         """
-        if not insights:
-            return MemorySnapshot(
-                brand=brand,
-                model=model,
-                memory_score=0.0,
-                confidence=0.0,
-                timestamp=time.time(),
-                insight_count=0,
-                citation_strength=0.0,
-                semantic_similarity=0.0
-            )
-        
-        # Filter recent insights (last 30 days)
-        current_time = time.time()
-        recent_insights = [
-            insight for insight in insights 
-            if current_time - insight.get('timestamp', 0) < (30 * 24 * 3600)
-        ]
-        
-        if not recent_insights:
-            recent_insights = insights[-5:]  # Fallback to latest 5
-        
-        # Calculate component scores
-        insight_count = len(recent_insights)
-        
-        # Quality score average (weighted by recency)
-        quality_scores = []
-        for insight in recent_insights:
-            quality = insight.get('quality_score', 0)
-            age_days = (current_time - insight.get('timestamp', 0)) / 86400
-            weight = max(0.1, 1.0 - (age_days / 30))  # Decay weight over 30 days
-            quality_scores.append(quality * weight)
-        
-        avg_quality = np.mean(quality_scores) if quality_scores else 0
-        
-        # Citation strength (based on content richness and specificity)
-        citation_scores = []
-        for insight in recent_insights:
-            content = insight.get('content', '')
-            # Score based on specific brand mentions, competitive terms, etc.
-            brand_clean = brand.replace('.com', '').replace('.', ' ')
-            
-            citation_score = 0
-            if brand_clean.lower() in content.lower():
-                citation_score += 0.3
-            if any(word in content.lower() for word in ['leading', 'dominant', 'innovative']):
-                citation_score += 0.2
-            if any(word in content.lower() for word in ['competitive', 'advantage', 'market']):
-                citation_score += 0.3
-            if len(content) > 300:
-                citation_score += 0.2
-                
-            citation_scores.append(min(citation_score, 1.0))
-        
-        citation_strength = np.mean(citation_scores) if citation_scores else 0
-        
-        # Semantic similarity (consistency across insights)
-        if len(recent_insights) > 1:
-            # Simple similarity based on common keywords
-            all_words = []
-            for insight in recent_insights:
-                words = insight.get('content', '').lower().split()
-                all_words.extend(words)
-            
-            # Calculate word frequency consistency
-            word_freq = {}
-            for word in all_words:
-                if len(word) > 4:  # Only meaningful words
-                    word_freq[word] = word_freq.get(word, 0) + 1
-            
-            # Semantic similarity based on consistent terminology
-            consistent_terms = sum(1 for count in word_freq.values() if count > 1)
-            semantic_similarity = min(consistent_terms / 10, 1.0)  # Normalize to 0-1
-        else:
-            semantic_similarity = avg_quality  # Single insight uses quality as similarity
-        
-        # Calculate overall memory score (0-100)
-        memory_score = (
-            avg_quality * 40 +           # 40% quality weight
-            citation_strength * 30 +     # 30% citation weight  
-            semantic_similarity * 20 +   # 20% consistency weight
-            min(insight_count / 10, 1.0) * 10  # 10% volume weight
-        ) * 100
-        
-        # Confidence based on data availability and quality
-        confidence = min(
-            (insight_count / 5) * 0.5 +  # 50% from volume
-            avg_quality * 0.5,           # 50% from quality
-            1.0
-        )
-        
-        return MemorySnapshot(
-            brand=brand,
-            model=model,
-            memory_score=memory_score,
-            confidence=confidence,
-            timestamp=current_time,
-            insight_count=insight_count,
-            citation_strength=citation_strength,
-            semantic_similarity=semantic_similarity
-        )
+        return calculate_memory_score(brand, model, insights)
 
     def detect_memory_decay(self, brand: str, model: str) -> Optional[DecayEvent]:
         """
@@ -263,33 +488,24 @@ class MemoryDecayDetector:
             DecayEvent if decay detected, None otherwise
         """
         # Get memory snapshots for this brand/model
-        brand_snapshots = [
-            snapshot for snapshot in self.memory_snapshots
-            if snapshot.brand == brand and snapshot.model == model
-        ]
+        ring = self.snapshot_series.get(brand, {}).get(model)
         
-        if len(brand_snapshots) < 2:
+        if ring is None or len(ring) < 2:
             return None  # Need at least 2 snapshots to detect decay
         
-        # Sort by timestamp
-        brand_snapshots.sort(key=lambda x: x.timestamp)
-        
-        current_snapshot = brand_snapshots[-1]
+        current_snapshot = ring.snapshot_at(-1)
         current_time = time.time()
         
         # Look for decay over monitoring window
         window_start = current_time - (self.monitoring_window_days * 24 * 3600)
         
-        # Find baseline snapshot from beginning of window
-        baseline_snapshot = None
-        for snapshot in reversed(brand_snapshots[:-1]):
-            if snapshot.timestamp >= window_start:
-                baseline_snapshot = snapshot
-                break
-        
-        if not baseline_snapshot:
-            # Use oldest available snapshot if no snapshot in window
-            baseline_snapshot = brand_snapshots[0]
+        # Baseline is the previous snapshot if it is inside the window,
+        # otherwise the oldest available snapshot
+        previous_snapshot = ring.snapshot_at(-2)
+        if previous_snapshot.timestamp >= window_start:
+            baseline_snapshot = previous_snapshot
+        else:
+            baseline_snapshot = ring.snapshot_at(0)
         
         # Calculate decay percentage
         if baseline_snapshot.memory_score == 0:
@@ -308,12 +524,7 @@ class MemoryDecayDetector:
                 severity = 'mild'
             
             # Check if we already have an active decay event for this brand/model
-            existing_event = None
-            for event in self.decay_events:
-                if (event.brand == brand and event.model == model and 
-                    event.status == 'active'):
-                    existing_event = event
-                    break
+            existing_event = self.active_decay_events.get((brand, model))
             
             if existing_event:
                 # Update existing event if decay worsened
@@ -321,6 +532,7 @@ class MemoryDecayDetector:
                     existing_event.decay_percentage = decay_percentage
                     existing_event.severity = severity
                     existing_event.current_score = current_snapshot.memory_score
+                    self.decay_events_dirty = True
                     return existing_event
                 return None
             else:
@@ -339,7 +551,7 @@ class MemoryDecayDetector:
                     status='active'
                 )
                 
-                self.decay_events.append(decay_event)
+                self._add_decay_event(decay_event)
                 
                 logger.warning(f"🚨 MEMORY DECAY DETECTED: {brand} ({model}) - "
                              f"{decay_percentage:.1%} decay over {time_period} days")
@@ -360,7 +572,7 @@ class MemoryDecayDetector:
         """
         try:
             # Load insights from blitz engine
-            with open('data/insights/insight_log.json', 'r') as f:
+            with open(INSIGHT_LOG_FILE, 'r') as f:
                 all_insights = json.load(f)
             
             # Filter insights for this brand
@@ -380,35 +592,13 @@ class MemoryDecayDetector:
                     insights_by_model[model] = []
                 insights_by_model[model].append(insight)
             
-            results = {
-                'brand': brand,
-                'memory_snapshots': {},
-                'decay_events': [],
-                'timestamp': time.time()
-            }
-            
             # Calculate memory scores for each model
-            for model, insights in insights_by_model.items():
-                # Calculate new memory snapshot
-                snapshot = self.calculate_memory_score(brand, model, insights)
-                self.memory_snapshots.append(snapshot)
-                results['memory_snapshots'][model] = {
-                    'memory_score': snapshot.memory_score,
-                    'confidence': snapshot.confidence,
-                    'insight_count': snapshot.insight_count,
-                    'citation_strength': snapshot.citation_strength
-                }
-                
-                # Check for decay
-                decay_event = self.detect_memory_decay(brand, model)
-                if decay_event:
-                    results['decay_events'].append({
-                        'model': model,
-                        'severity': decay_event.severity,
-                        'decay_percentage': decay_event.decay_percentage,
-                        'current_score': decay_event.current_score,
-                        'previous_score': decay_event.previous_score
-                    })
+            scored = calculate_memory_scores([
+                (brand, model, insights) for model, insights in insights_by_model.items()
+            ])
+            snapshots = {snapshot.model: snapshot for snapshot in scored}
+            
+            results = self._record_brand_snapshots(brand, snapshots)
             
             # Save updated data
             self.save_memory_data()
@@ -419,6 +609,46 @@ class MemoryDecayDetector:
             logger.error(f"Error processing brand {brand}: {e}")
             return {'brand': brand, 'status': 'error', 'error': str(e)}
 
+    def _record_brand_snapshots(self, brand: str, snapshots: Dict[str, MemorySnapshot]) -> Dict:
+        """
+        Record new memory snapshots for a brand and check each model for decay.
+        
+        Args:
+            brand: Brand domain
+            snapshots: Model -> newly calculated snapshot
+            
+        Returns:
+            Dictionary with memory scores and any decay events
+        """
+        results = {
+            'brand': brand,
+            'memory_snapshots': {},
+            'decay_events': [],
+            'timestamp': time.time()
+        }
+        
+        for model, snapshot in snapshots.items():
+            self.add_snapshot(snapshot)
+            results['memory_snapshots'][model] = {
+                'memory_score': snapshot.memory_score,
+                'confidence': snapshot.confidence,
+                'insight_count': snapshot.insight_count,
+                'citation_strength': snapshot.citation_strength
+            }
+            
+            # Check for decay
+            decay_event = self.detect_memory_decay(brand, model)
+            if decay_event:
+                results['decay_events'].append({
+                    'model': model,
+                    'severity': decay_event.severity,
+                    'decay_percentage': decay_event.decay_percentage,
+                    'current_score': decay_event.current_score,
+                    'previous_score': decay_event.previous_score
+                })
+        
+        return results
+
     def get_memory_status(self, brand: Optional[str] = None) -> Dict:
         """
         Get current memory status for all brands or a specific brand.
@@ -430,19 +660,20 @@ class MemoryDecayDetector:
             Memory status summary
         """
         current_time = time.time()
+        active_events = list(self.active_decay_events.values())
         
         if brand:
             # Get status for specific brand
-            brand_snapshots = [s for s in self.memory_snapshots if s.brand == brand]
-            brand_events = [e for e in self.decay_events if e.brand == brand and e.status == 'active']
+            brand_series = self.snapshot_series.get(brand, {})
+            brand_events = [e for e in active_events if e.brand == brand]
             
             return {
                 'brand': brand,
-                'snapshots': len(brand_snapshots),
+                'snapshots': sum(len(ring) for ring in brand_series.values()),
                 'active_decay_events': len(brand_events),
                 'latest_scores': {
-                    snapshot.model: snapshot.memory_score 
-                    for snapshot in brand_snapshots[-3:] 
+                    model: ring.snapshot_at(-1).memory_score
+                    for model, ring in brand_series.items() if len(ring)
                 },
                 'decay_events': [
                     {
@@ -453,23 +684,18 @@ class MemoryDecayDetector:
                 ]
             }
         else:
-            # Get overall status
-            active_events = [e for e in self.decay_events if e.status == 'active']
-            
-            # Get unique brands
-            brands = set(s.brand for s in self.memory_snapshots)
-            
             # Recent activity (last 24 hours)
-            recent_snapshots = [
-                s for s in self.memory_snapshots 
-                if current_time - s.timestamp < 86400
-            ]
+            recent_snapshots = sum(
+                int(np.count_nonzero(current_time - ring.column('timestamp') < 86400))
+                for models in self.snapshot_series.values()
+                for ring in models.values()
+            )
             
             return {
-                'total_brands': len(brands),
-                'total_snapshots': len(self.memory_snapshots),
+                'total_brands': len(self.snapshot_series),
+                'total_snapshots': self.snapshot_count(),
                 'active_decay_events': len(active_events),
-                'recent_activity': len(recent_snapshots),
+                'recent_activity': recent_snapshots,
                 'decay_by_severity': {
                     'severe': len([e for e in active_events if e.severity == 'severe']),
                     'moderate': len([e for e in active_events if e.severity == 'moderate']),
@@ -486,21 +712,59 @@ class MemoryDecayDetector:
                 ]
             }
 
-    def run_full_memory_scan(self) -> Dict:
+    def run_full_memory_scan(self, workers: Optional[int] = 1) -> Dict:
         """
         Run memory decay detection across all brands in the system.
         
+        The insight log is parsed once and grouped by (brand, model) in a
+        single pass, memory scores are calculated in batches, and data is
+        saved once at the end of the scan. Scoring runs in-process unless the
+        caller opts in to a process pool, so scans triggered inside API
+        processes do not start workers. Pool workers come from a forkserver,
+        never from forking the (possibly multi-threaded) caller.
+        
+        Args:
+            workers: Number of worker processes (1 = in-process, None = CPU count)
+        
         Returns:
             Summary of scan results
         """
         logger.info("🧠 Starting full memory decay scan...")
         
         try:
-            # Get all unique brands from insights
-            with open('data/insights/insight_log.json', 'r') as f:
+            # Group all insights by brand and model in one pass
+            with open(INSIGHT_LOG_FILE, 'r') as f:
                 all_insights = json.load(f)
             
-            brands = set(insight.get('domain') for insight in all_insights if insight.get('domain'))
+            insights_by_brand = {}
+            for insight in all_insights:
+                brand = insight.get('domain')
+                if not brand:
+                    continue
+                model = insight.get('model', 'unknown')
+                insights_by_brand.setdefault(brand, {}).setdefault(model, []).append(insight)
+            
+            del all_insights
+            
+            groups = [
+                (brand, model, insights)
+                for brand, insights_by_model in insights_by_brand.items()
+                for model, insights in insights_by_model.items()
+            ]
+            
+            # Calculate all memory snapshots
+            chunks = [groups[i:i + SCAN_CHUNK_SIZE] for i in range(0, len(groups), SCAN_CHUNK_SIZE)]
+            
+            if workers == 1 or len(chunks) <= 1:
+                scored = [_calculate_memory_score_batch(chunk) for chunk in chunks]
+            else:
+                context = multiprocessing.get_context(SCAN_START_METHOD)
+                with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                    scored = list(executor.map(_calculate_memory_score_batch, chunks))
+            
+            snapshots_by_brand = {}
+            for snapshot in (snapshot for chunk in scored for snapshot in chunk):
+                snapshots_by_brand.setdefault(snapshot.brand, {})[snapshot.model] = snapshot
             
             scan_results = {
                 'scan_timestamp': time.time(),
@@ -510,16 +774,19 @@ class MemoryDecayDetector:
                 'brands_processed': []
             }
             
-            for brand in brands:
-                result = self.process_brand_insights(brand)
+            for brand, snapshots in snapshots_by_brand.items():
+                result = self._record_brand_snapshots(brand, snapshots)
                 scan_results['brands_scanned'] += 1
                 scan_results['new_decay_events'] += len(result.get('decay_events', []))
                 scan_results['total_memory_snapshots'] += len(result.get('memory_snapshots', {}))
                 scan_results['brands_processed'].append(result)
                 
                 # Log progress
-                if scan_results['brands_scanned'] % 10 == 0:
-                    logger.info(f"📊 Processed {scan_results['brands_scanned']}/{len(brands)} brands")
+                if scan_results['brands_scanned'] % 1000 == 0:
+                    logger.info(f"📊 Processed {scan_results['brands_scanned']}/{len(snapshots_by_brand)} brands")
+            
+            # Save updated data once for the whole scan
+            self.save_memory_data()
             
             logger.info(f"✅ Memory scan complete: {scan_results['brands_scanned']} brands, "
                        f"{scan_results['new_decay_events']} new decay events detected")
@@ -541,16 +808,16 @@ def get_memory_status(brand: Optional[str] = None) -> Dict:
     """Get memory status summary."""
     return memory_detector.get_memory_status(brand)
 
-def run_memory_scan() -> Dict:
+def run_memory_scan(workers: Optional[int] = 1) -> Dict:
     """Run full memory decay scan."""
-    return memory_detector.run_full_memory_scan()
+    return memory_detector.run_full_memory_scan(workers)
 
 if __name__ == "__main__":
     # Test the memory decay detector
     print("🧠 Testing Memory Decay Detector")
     
-    # Run scan on current data
-    results = run_memory_scan()
+    # Run scan on current data, scoring in a process pool
+    results = run_memory_scan(workers=None)
     print(f"Scan Results: {results}")
     
     # Get overall status
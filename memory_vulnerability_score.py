@@ -10,6 +10,8 @@ import os
 import json
 import logging
 import datetime
+from bisect import bisect_left, bisect_right, insort
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
 import statistics
 
@@ -26,10 +28,419 @@ SURFACE_DIR = os.path.join(DATA_DIR, "surface")
 PRIORITY_CATEGORIES_PATH = os.path.join(SURFACE_DIR, "priority_categories.json")
 MVS_HISTORY_PATH = os.path.join(SURFACE_DIR, "mvs_history.json")
 BRAND_SCORES_PATH = os.path.join(SURFACE_DIR, "brand_scores.json")
+MVS_SERIES_PATH = os.path.join(SURFACE_DIR, "mvs_series.json")
+MVS_SERIES_LOG_PATH = os.path.join(SURFACE_DIR, "mvs_series.log")
+SCORE_CHUNK_SIZE = 256  # Brands per worker task in parallel scoring
+SERIES_SCORE_SCALE = 1_000_000  # Scores are stored as integers at this scale
+SERIES_COMPACT_RECORDS = 10000  # Log records before the snapshot is rewritten
+EPOCH = datetime.datetime(1970, 1, 1)
 
 # Ensure directories exist
 os.makedirs(SURFACE_DIR, exist_ok=True)
 
+def _calculate_vulnerability(brand: str, category: str, category_competitiveness: float) -> float:
+    """
+    Calculate the Memory Vulnerability Score for a brand in a category.
+    
+    Args:
+        brand: Brand name
+        category: Category name
+        category_competitiveness: Competitiveness of the category (0-1)
+        
+    Returns:
+        Memory Vulnerability Score (0-1)
+    """
+    # Base factors for MVS calculation
+    factors = {
+        "category_competitiveness": 0.0,    # How competitive is the category (0-1)
+        "mention_frequency": 0.0,           # How often the brand is mentioned (0-1, inverted)
+        "narrative_consistency": 0.0,       # How consistently the brand is represented (0-1, inverted)
+        "distinctive_attributes": 0.0,      # How unique/distinctive the brand's attributes are (0-1)
+        "recency_bias": 0.0                 # How recent is the brand's presence in discourse (0-1, inverted)
+    }
+    
+    factors["category_competitiveness"] = category_competitiveness
+    
+    # For now, simulate other factors - in real implementation, these would be calculated
+    # from LLM responses, web scraping, etc.
+    
+    # Mention frequency - scale of 0 to 1, lower is better (mentioned more)
+    # Invert so higher means more vulnerable
+    factors["mention_frequency"] = 0.3  # Simulated value
+    
+    # Narrative consistency - scale of 0 to 1, lower is better (more consistent)
+    # Invert so higher means more vulnerable
+    factors["narrative_consistency"] = 0.4  # Simulated value
+    
+    # Distinctive attributes - scale of 0 to 1, higher is better (more distinctive)
+    factors["distinctive_attributes"] = 0.6  # Simulated value
+    
+    # Recency bias - scale of 0 to 1, lower is better (more recent)
+    # Invert so higher means more vulnerable
+    factors["recency_bias"] = 0.2  # Simulated value
+    
+    # Calculate weighted score
+    weights = {
+        "category_competitiveness": 0.3,
+        "mention_frequency": 0.25,
+        "narrative_consistency": 0.2,
+        "distinctive_attributes": 0.15,
+        "recency_bias": 0.1
+    }
+    
+    score = sum(factors[k] * weights[k] for k in factors)
+    
+    # Ensure score is between 0 and 1
+    score = max(0.0, min(1.0, score))
+    
+    return score
+
+
+def _score_brand_batch(args: Tuple[List[Tuple[str, str]], Dict[str, float]]) -> List[Tuple[str, str, float]]:
+    """
+    Score a chunk of (brand, category) pairs. Runs in worker processes.
+    
+    Args:
+        args: Tuple of ((brand, category) pairs, category -> competitiveness)
+        
+    Returns:
+        List of (brand, category, score) tuples
+    """
+    pairs, competitiveness = args
+    
+    return [
+        (brand, category, _calculate_vulnerability(brand, category, competitiveness[category]))
+        for brand, category in pairs
+    ]
+
+
+def _to_micros(timestamp: datetime.datetime) -> int:
+    """Convert a naive datetime to integer microseconds since EPOCH."""
+    return (timestamp - EPOCH) // datetime.timedelta(microseconds=1)
+
+
+def _from_micros(micros: int) -> datetime.datetime:
+    """Convert integer microseconds since EPOCH to a naive datetime."""
+    return EPOCH + datetime.timedelta(microseconds=micros)
+
+
+class MVSHistoryStore:
+    """
+    Time series of brand and category vulnerability scores.
+    
+    Each series keeps parallel, time-ordered arrays of integer timestamps
+    (microseconds), integer scores (SERIES_SCORE_SCALE) and category labels.
+    On disk the snapshot stores each series delta-encoded; new points are
+    buffered and appended to a JSON-lines log in batches, and the log is
+    folded into the snapshot once it grows past SERIES_COMPACT_RECORDS.
+    """
+    
+    def __init__(self, snapshot_path: str = MVS_SERIES_PATH, log_path: str = MVS_SERIES_LOG_PATH,
+                 legacy_path: str = MVS_HISTORY_PATH):
+        """Initialize the store and load persisted series."""
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.legacy_path = legacy_path
+        self.series = {}  # (kind, name) -> {"times", "scores", "labels"}
+        self.pending = []  # Log records not yet written
+        self.log_records = 0
+        self.drift_index = {}  # (kind, name) -> {days: (drift, expires_micros)}
+        self._load()
+    
+    def _load(self):
+        """Load the snapshot and replay the log, migrating legacy history if needed."""
+        try:
+            if os.path.exists(self.snapshot_path):
+                with open(self.snapshot_path, 'r') as f:
+                    snapshot = json.load(f)
+                
+                for key, encoded in snapshot.get("series", {}).items():
+                    kind, name = key.split(":", 1)
+                    self.series[(kind, name)] = self._decode(encoded)
+            
+            elif os.path.exists(self.legacy_path):
+                self._migrate_legacy()
+            
+            if os.path.exists(self.log_path):
+                with open(self.log_path, 'r') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning("Skipping unreadable MVS history record")
+                            continue
+                        
+                        self._insert(record["kind"], record["name"], record["t"], record["q"], record.get("c"))
+                        self.log_records += 1
+        except Exception as e:
+            logger.error(f"Error loading MVS history: {e}")
+    
+    def _migrate_legacy(self):
+        """Import the legacy mvs_history.json entry lists and write a snapshot."""
+        with open(self.legacy_path, 'r') as f:
+            legacy = json.load(f)
+        
+        count = 0
+        for kind in ("brands", "categories"):
+            for name, entries in legacy.get(kind, {}).items():
+                for entry in entries:
+                    if "score" not in entry:
+                        continue
+                    self._insert(
+                        kind, name,
+                        _to_micros(datetime.datetime.fromisoformat(entry["timestamp"])),
+                        round(entry["score"] * SERIES_SCORE_SCALE),
+                        entry.get("category")
+                    )
+                    count += 1
+        
+        self.compact()
+        logger.info(f"Migrated {count} MVS history entries to the series store")
+    
+    def _decode(self, encoded: Dict) -> Dict:
+        """Decode a delta-encoded series."""
+        times = []
+        scores = []
+        time_value = 0
+        score_value = 0
+        
+        for dt, dq in zip(encoded["dt"], encoded["dq"]):
+            time_value += dt
+            score_value += dq
+            times.append(time_value)
+            scores.append(score_value)
+        
+        label_table = encoded.get("labels", [])
+        labels = [label_table[i] if i >= 0 else None for i in encoded.get("l", [-1] * len(times))]
+        
+        return {"times": times, "scores": scores, "labels": labels}
+    
+    def _encode(self, series: Dict) -> Dict:
+        """Delta-encode a series: first values are deltas from zero."""
+        times = series["times"]
+        scores = series["scores"]
+        encoded = {
+            "dt": [t - p for t, p in zip(times, [0] + times[:-1])],
+            "dq": [q - p for q, p in zip(scores, [0] + scores[:-1])]
+        }
+        
+        if any(label is not None for label in series["labels"]):
+            label_table = list(dict.fromkeys(label for label in series["labels"] if label is not None))
+            label_ids = {label: i for i, label in enumerate(label_table)}
+            encoded["labels"] = label_table
+            encoded["l"] = [label_ids[label] if label is not None else -1 for label in series["labels"]]
+        
+        return encoded
+    
+    def _insert(self, kind: str, name: str, micros: int, quantized: int, label: Optional[str]):
+        """Insert a point in time order and invalidate the series' drift index."""
+        series = self.series.get((kind, name))
+        if series is None:
+            series = {"times": [], "scores": [], "labels": []}
+            self.series[(kind, name)] = series
+        
+        times = series["times"]
+        if not times or micros >= times[-1]:
+            position = len(times)
+        else:
+            position = bisect_right(times, micros)
+        
+        times.insert(position, micros)
+        series["scores"].insert(position, quantized)
+        series["labels"].insert(position, label)
+        
+        self.drift_index.pop((kind, name), None)
+    
+    def append(self, kind: str, name: str, timestamp: datetime.datetime, score: float,
+               label: Optional[str] = None):
+        """
+        Add a score point. It is written to disk on the next flush.
+        
+        Args:
+            kind: "brands" or "categories"
+            name: Brand or category name
+            timestamp: Score timestamp
+            score: Score (0-1)
+            label: Optional category label for brand scores
+        """
+        micros = _to_micros(timestamp)
+        quantized = round(score * SERIES_SCORE_SCALE)
+        
+        self._insert(kind, name, micros, quantized, label)
+        
+        record = {"kind": kind, "name": name, "t": micros, "q": quantized}
+        if label is not None:
+            record["c"] = label
+        self.pending.append(record)
+    
+    def query(self, kind: str, name: str, start: Optional[datetime.datetime] = None,
+              end: Optional[datetime.datetime] = None) -> List[Dict]:
+        """
+        Get score points in a time range.
+        
+        Args:
+            kind: "brands" or "categories"
+            name: Brand or category name
+            start: Optional inclusive start time
+            end: Optional inclusive end time
+            
+        Returns:
+            List of history entries, oldest first
+        """
+        series = self.series.get((kind, name))
+        if series is None:
+            return []
+        
+        times = series["times"]
+        lo = bisect_left(times, _to_micros(start)) if start else 0
+        hi = bisect_right(times, _to_micros(end)) if end else len(times)
+        
+        entries = []
+        for i in range(lo, hi):
+            entry = {"timestamp": _from_micros(times[i]).isoformat()}
+            if series["labels"][i] is not None:
+                entry["category"] = series["labels"][i]
+            entry["score"] = series["scores"][i] / SERIES_SCORE_SCALE
+            entries.append(entry)
+        
+        return entries
+    
+    def drift(self, kind: str, name: str, days: int) -> float:
+        """
+        Get the score change over the last days (last score - first score).
+        
+        Results are cached until the series changes or its first point in
+        the window falls out of the window.
+        
+        Args:
+            kind: "brands" or "categories"
+            name: Brand or category name
+            days: Time period in days
+            
+        Returns:
+            Drift amount (0 if fewer than two points are in the window)
+        """
+        now = _to_micros(datetime.datetime.now())
+        cached = self.drift_index.get((kind, name), {}).get(days)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+        
+        series = self.series.get((kind, name))
+        if series is None:
+            return 0.0
+        
+        window = days * 86400 * 1_000_000
+        times = series["times"]
+        first = bisect_left(times, now - window)
+        
+        if len(times) - first < 2:
+            drift = 0.0
+        else:
+            drift = (series["scores"][-1] - series["scores"][first]) / SERIES_SCORE_SCALE
+        
+        expires = times[first] + window if first < len(times) else float("inf")
+        self.drift_index.setdefault((kind, name), {})[days] = (drift, expires)
+        
+        return drift
+    
+    def flush(self) -> bool:
+        """
+        Append buffered points to the log, compacting it when large.
+        
+        Returns:
+            Success flag
+        """
+        try:
+            if self.pending:
+                with open(self.log_path, 'a') as f:
+                    f.write("".join(json.dumps(record) + "\n" for record in self.pending))
+                self.log_records += len(self.pending)
+                self.pending = []
+            
+            if self.log_records >= SERIES_COMPACT_RECORDS:
+                self.compact()
+            
+            return True
+        except Exception as e:
+            logger.error(f"Error saving MVS history: {e}")
+            return False
+    
+    def compact(self):
+        """Write all series to the delta-encoded snapshot and truncate the log."""
+        snapshot = {
+            "series": {f"{kind}:{name}": self._encode(series) for (kind, name), series in self.series.items()},
+            "last_updated": datetime.datetime.now().isoformat()
+        }
+        
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        os.replace(tmp_path, self.snapshot_path)
+        
+        # The snapshot now holds everything, including buffered points
+        open(self.log_path, 'w').close()
+        self.pending = []
+        self.log_records = 0
+
+
+class LeaderboardIndex:
+    """
+    Scores kept in descending order for O(K) top-K reads.
+    
+    Entries are (-score, seq, key) tuples in a sorted list, where seq is
+    the key's insertion order, so ties keep the order a stable sort of
+    the underlying collection would give. Updates locate the old entry by
+    bisection and reinsert it.
+    """
+    
+    __slots__ = ("entries", "positions", "next_seq")
+    
+    def __init__(self):
+        """Initialize an empty leaderboard."""
+        self.entries = []
+        self.positions = {}  # key -> (-score, seq)
+        self.next_seq = 0
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def __contains__(self, key) -> bool:
+        return key in self.positions
+    
+    def update(self, key, score: float, seq: Optional[int] = None):
+        """
+        Set the score for a key, inserting it if new.
+        
+        Args:
+            key: Entry key
+            score: Score to rank by
+            seq: Optional tie-break order for new keys (defaults to insertion order)
+        """
+        current = self.positions.get(key)
+        
+        if current is None:
+            if seq is None:
+                seq = self.next_seq
+            self.next_seq = max(self.next_seq, seq + 1)
+        else:
+            seq = current[1]
+            del self.entries[bisect_left(self.entries, (current[0], seq))]
+        
+        self.positions[key] = (-score, seq)
+        insort(self.entries, (-score, seq, key))
+    
+    def seq(self, key) -> int:
+        """Get the tie-break order of a key."""
+        return self.positions[key][1]
+    
+    def top(self, k: int) -> List[Tuple[Any, float]]:
+        """Get up to k (key, score) pairs, highest score first."""
+        return [(key, -neg_score) for neg_score, _, key in self.entries[:k]]
+
+
 class MemoryVulnerabilityScoreCalculator:
     """
     Calculates and tracks Memory Vulnerability Scores (MVS) for brands and domains,
@@ -41,8 +452,14 @@ class MemoryVulnerabilityScoreCalculator:
     def __init__(self):
         """Initialize the Memory Vulnerability Score calculator."""
         self.categories = self._load_categories()
-        self.mvs_history = self._load_mvs_history()
+        self.history_store = MVSHistoryStore()
         self.brand_scores = self._load_brand_scores()
+        
+        # Pending writes, saved together by flush()
+        self._brand_scores_dirty = False
+        self._categories_dirty = False
+        
+        self._build_leaderboards()
     
     def _load_categories(self) -> List[Dict]:
         """Load competitive categories from disk."""
@@ -58,29 +475,6 @@ class MemoryVulnerabilityScoreCalculator:
             logger.error(f"Error loading competitive categories: {e}")
             return []
     
-    def _load_mvs_history(self) -> Dict:
-        """Load MVS history from disk."""
-        try:
-            if os.path.exists(MVS_HISTORY_PATH):
-                with open(MVS_HISTORY_PATH, 'r') as f:
-                    return json.load(f)
-            else:
-                # Create default structure
-                history = {
-                    "categories": {},
-                    "brands": {},
-                    "last_updated": datetime.datetime.now().isoformat()
-                }
-                
-                # Save default history
-                with open(MVS_HISTORY_PATH, 'w') as f:
-                    json.dump(history, f, indent=2)
-                
-                return history
-        except Exception as e:
-            logger.error(f"Error loading MVS history: {e}")
-            return {"categories": {}, "brands": {}, "last_updated": datetime.datetime.now().isoformat()}
-    
     def _load_brand_scores(self) -> Dict:
         """Load brand scores from disk."""
         try:
@@ -103,18 +497,29 @@ class MemoryVulnerabilityScoreCalculator:
             logger.error(f"Error loading brand scores: {e}")
             return {"brands": {}, "last_updated": datetime.datetime.now().isoformat()}
     
-    def _save_mvs_history(self) -> bool:
-        """Save MVS history to disk."""
-        try:
-            # Update last updated timestamp
-            self.mvs_history["last_updated"] = datetime.datetime.now().isoformat()
+    def _build_leaderboards(self):
+        """Build the brand and category leaderboards from loaded data."""
+        # Brands by overall score, and per category by category score
+        self._brand_leaderboard = LeaderboardIndex()
+        self._category_brand_leaderboards = {}
+        
+        for brand_name, brand in self.brand_scores.get("brands", {}).items():
+            self._brand_leaderboard.update(brand_name, brand.get("overall_score", 0))
             
-            with open(MVS_HISTORY_PATH, 'w') as f:
-                json.dump(self.mvs_history, f, indent=2)
-            return True
-        except Exception as e:
-            logger.error(f"Error saving MVS history: {e}")
-            return False
+            for category_name, score in brand.get("category_scores", {}).items():
+                self._category_brand_leaderboards.setdefault(
+                    category_name, LeaderboardIndex()
+                ).update(brand_name, score, self._brand_leaderboard.seq(brand_name))
+        
+        # Categories by vulnerability, keyed by position in self.categories
+        self._category_leaderboard = LeaderboardIndex()
+        
+        for position, category in enumerate(self.categories):
+            self._category_leaderboard.update(position, category.get("memory_vulnerability", 0))
+    
+    def _save_mvs_history(self) -> bool:
+        """Append buffered score history to disk."""
+        return self.history_store.flush()
     
     def _save_brand_scores(self) -> bool:
         """Save brand scores to disk."""
@@ -122,8 +527,12 @@ class MemoryVulnerabilityScoreCalculator:
             # Update last updated timestamp
             self.brand_scores["last_updated"] = datetime.datetime.now().isoformat()
             
-            with open(BRAND_SCORES_PATH, 'w') as f:
-                json.dump(self.brand_scores, f, indent=2)
+            tmp_path = BRAND_SCORES_PATH + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.brand_scores, f, separators=(",", ":"))
+            os.replace(tmp_path, BRAND_SCORES_PATH)
+            
+            self._brand_scores_dirty = False
             return True
         except Exception as e:
             logger.error(f"Error saving brand scores: {e}")
@@ -138,11 +547,33 @@ class MemoryVulnerabilityScoreCalculator:
             
             with open(PRIORITY_CATEGORIES_PATH, 'w') as f:
                 json.dump(data, f, indent=2)
+            
+            self._categories_dirty = False
             return True
         except Exception as e:
             logger.error(f"Error saving competitive categories: {e}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Save everything changed since the last flush.
+        
+        Updates made with save=False are only held in memory until this
+        is called.
+        
+        Returns:
+            Success flag
+        """
+        success = self._save_mvs_history()
+        
+        if self._brand_scores_dirty:
+            success = self._save_brand_scores() and success
+        
+        if self._categories_dirty:
+            success = self._save_categories() and success
+        
+        return success
+    
     def calculate_memory_vulnerability(self, brand: str, category: str) -> float:
         """
         Calculate the Memory Vulnerability Score for a brand in a specific category.
@@ -154,54 +585,15 @@ class MemoryVulnerabilityScoreCalculator:
         Returns:
             Memory Vulnerability Score (0-1)
         """
-        # Base factors for MVS calculation
-        factors = {
-            "category_competitiveness": 0.0,    # How competitive is the category (0-1)
-            "mention_frequency": 0.0,           # How often the brand is mentioned (0-1, inverted)
-            "narrative_consistency": 0.0,       # How consistently the brand is represented (0-1, inverted)
-            "distinctive_attributes": 0.0,      # How unique/distinctive the brand's attributes are (0-1)
-            "recency_bias": 0.0                 # How recent is the brand's presence in discourse (0-1, inverted)
-        }
-        
-        # Get category competitiveness from data
+        return _calculate_vulnerability(brand, category, self._get_category_competitiveness(category))
+    
+    def _get_category_competitiveness(self, category: str) -> float:
+        """Get category competitiveness from data (0 for unknown categories)."""
         for cat in self.categories:
             if cat.get("name") == category:
-                factors["category_competitiveness"] = cat.get("memory_vulnerability", 0.5)
-                break
-        
-        # For now, simulate other factors - in real implementation, these would be calculated
-        # from LLM responses, web scraping, etc.
-        
-        # Mention frequency - scale of 0 to 1, lower is better (mentioned more)
-        # Invert so higher means more vulnerable
-        factors["mention_frequency"] = 0.3  # Simulated value
-        
-        # Narrative consistency - scale of 0 to 1, lower is better (more consistent)
-        # Invert so higher means more vulnerable
-        factors["narrative_consistency"] = 0.4  # Simulated value
-        
-        # Distinctive attributes - scale of 0 to 1, higher is better (more distinctive)
-        factors["distinctive_attributes"] = 0.6  # Simulated value
-        
-        # Recency bias - scale of 0 to 1, lower is better (more recent)
-        # Invert so higher means more vulnerable
-        factors["recency_bias"] = 0.2  # Simulated value
-        
-        # Calculate weighted score
-        weights = {
-            "category_competitiveness": 0.3,
-            "mention_frequency": 0.25,
-            "narrative_consistency": 0.2,
-            "distinctive_attributes": 0.15,
-            "recency_bias": 0.1
-        }
-        
-        score = sum(factors[k] * weights[k] for k in factors)
-        
-        # Ensure score is between 0 and 1
-        score = max(0.0, min(1.0, score))
+                return cat.get("memory_vulnerability", 0.5)
         
-        return score
+        return 0.0
     
     def get_category_vulnerability(self, category_name: str) -> float:
         """
@@ -219,13 +611,14 @@ class MemoryVulnerabilityScoreCalculator:
         
         return 0.5  # Default mid-range value
     
-    def update_category_vulnerability(self, category_name: str, score: float) -> bool:
+    def update_category_vulnerability(self, category_name: str, score: float, save: bool = True) -> bool:
         """
         Update the Memory Vulnerability Score for a category.
         
         Args:
             category_name: Category name
             score: New Memory Vulnerability Score (0-1)
+            save: Whether to save categories and history immediately
             
         Returns:
             Success flag
@@ -234,27 +627,22 @@ class MemoryVulnerabilityScoreCalculator:
         score = max(0.0, min(1.0, score))
         
         # Update category score
-        for category in self.categories:
+        for position, category in enumerate(self.categories):
             if category.get("name") == category_name:
+                now = datetime.datetime.now()
                 category["memory_vulnerability"] = score
-                category["last_evaluated"] = datetime.datetime.now().isoformat()
-                
-                # Save categories
-                success = self._save_categories()
+                category["last_evaluated"] = now.isoformat()
+                self._categories_dirty = True
+                self._category_leaderboard.update(position, score)
                 
                 # Update history
-                if category_name not in self.mvs_history["categories"]:
-                    self.mvs_history["categories"][category_name] = []
-                
-                self.mvs_history["categories"][category_name].append({
-                    "timestamp": datetime.datetime.now().isoformat(),
-                    "score": score
-                })
+                self.history_store.append("categories", category_name, now, score)
                 
-                # Save history
-                self._save_mvs_history()
+                # Save categories and history
+                if save:
+                    return self.flush()
                 
-                return success
+                return True
         
         return False  # Category not found
     
@@ -282,7 +670,8 @@ class MemoryVulnerabilityScoreCalculator:
             "last_evaluated": None
         }
     
-    def update_brand_score(self, brand_name: str, category_name: str, score: Optional[float] = None, priority: Optional[bool] = None) -> Dict:
+    def update_brand_score(self, brand_name: str, category_name: str, score: Optional[float] = None,
+                           priority: Optional[bool] = None, save: bool = True) -> Dict:
         """
         Update the Memory Vulnerability Score for a brand in a specific category.
         
@@ -291,6 +680,7 @@ class MemoryVulnerabilityScoreCalculator:
             category_name: Category name
             score: Optional score override (if None, will be calculated)
             priority: Optional priority flag for "Flame Aware" system
+            save: Whether to save brand scores and history immediately
             
         Returns:
             Updated brand score details
@@ -326,6 +716,12 @@ class MemoryVulnerabilityScoreCalculator:
         category_scores = list(brands[brand_name]["category_scores"].values())
         brands[brand_name]["overall_score"] = sum(category_scores) / len(category_scores)
         
+        # Update leaderboards; brands tie-break in creation order everywhere
+        self._brand_leaderboard.update(brand_name, brands[brand_name]["overall_score"])
+        self._category_brand_leaderboards.setdefault(
+            category_name, LeaderboardIndex()
+        ).update(brand_name, score, self._brand_leaderboard.seq(brand_name))
+        
         # Update history
         brands[brand_name]["history"].append({
             "timestamp": datetime.datetime.now().isoformat(),
@@ -340,22 +736,15 @@ class MemoryVulnerabilityScoreCalculator:
         # Update last evaluated
         brands[brand_name]["last_evaluated"] = datetime.datetime.now().isoformat()
         
-        # Save brand scores
         self.brand_scores["brands"] = brands
-        self._save_brand_scores()
+        self._brand_scores_dirty = True
         
         # Update MVS history
-        if brand_name not in self.mvs_history["brands"]:
-            self.mvs_history["brands"][brand_name] = []
-        
-        self.mvs_history["brands"][brand_name].append({
-            "timestamp": datetime.datetime.now().isoformat(),
-            "category": category_name,
-            "score": score
-        })
+        self.history_store.append("brands", brand_name, datetime.datetime.now(), score, category_name)
         
-        # Save MVS history
-        self._save_mvs_history()
+        # Save brand scores and history
+        if save:
+            self.flush()
         
         return brands[brand_name]
     
@@ -369,15 +758,7 @@ class MemoryVulnerabilityScoreCalculator:
         Returns:
             List of category details sorted by vulnerability score (highest first)
         """
-        # Sort categories by vulnerability score
-        sorted_categories = sorted(
-            self.categories,
-            key=lambda c: c.get("memory_vulnerability", 0),
-            reverse=True
-        )
-        
-        # Return top N categories
-        return sorted_categories[:limit]
+        return [self.categories[position] for position, _ in self._category_leaderboard.top(limit)]
     
     def get_most_vulnerable_brands(self, limit: int = 10, category: Optional[str] = None) -> List[Dict]:
         """
@@ -388,34 +769,72 @@ class MemoryVulnerabilityScoreCalculator:
             category: Optional category filter
             
         Returns:
-            List of brand details sorted by vulnerability score (highest first)
+            List of brand details sorted by vulnerability score (highest first),
+            with the score used for ranking in sort_score
         """
-        brands = list(self.brand_scores.get("brands", {}).values())
-        
-        # Filter by category if specified
         if category:
-            filtered_brands = []
-            for brand in brands:
-                if category in brand.get("category_scores", {}):
-                    # Use the category-specific score for sorting
-                    brand_copy = brand.copy()
-                    brand_copy["sort_score"] = brand["category_scores"][category]
-                    filtered_brands.append(brand_copy)
-            brands = filtered_brands
+            # Use the category-specific score for sorting
+            leaderboard = self._category_brand_leaderboards.get(category, LeaderboardIndex())
         else:
             # Use overall score for sorting
-            for brand in brands:
-                brand["sort_score"] = brand.get("overall_score", 0)
+            leaderboard = self._brand_leaderboard
+        
+        brands = self.brand_scores.get("brands", {})
         
-        # Sort brands by vulnerability score
-        sorted_brands = sorted(
+        return [
+            dict(brands[brand_name], sort_score=score)
+            for brand_name, score in leaderboard.top(limit)
+        ]
+    
+    def verify_leaderboards(self) -> List[str]:
+        """
+        Compare the maintained leaderboards against full sorts of the data.
+        
+        Returns:
+            List of mismatch descriptions (empty if consistent)
+        """
+        mismatches = []
+        brands = self.brand_scores.get("brands", {})
+        
+        expected_categories = sorted(
+            self.categories,
+            key=lambda c: c.get("memory_vulnerability", 0),
+            reverse=True
+        )
+        if self.get_most_vulnerable_categories(len(self.categories)) != expected_categories:
+            mismatches.append("categories: leaderboard order differs from full sort")
+        
+        expected_brands = sorted(
             brands,
-            key=lambda b: b.get("sort_score", 0),
+            key=lambda name: brands[name].get("overall_score", 0),
             reverse=True
         )
+        actual_brands = [name for name, _ in self._brand_leaderboard.top(len(brands))]
+        if actual_brands != expected_brands:
+            mismatches.append("brands: leaderboard order differs from full sort")
+        
+        category_names = {
+            category_name
+            for brand in brands.values()
+            for category_name in brand.get("category_scores", {})
+        } | set(self._category_brand_leaderboards)
+        
+        for category_name in sorted(category_names):
+            expected = sorted(
+                (name for name in brands if category_name in brands[name].get("category_scores", {})),
+                key=lambda name: brands[name]["category_scores"][category_name],
+                reverse=True
+            )
+            leaderboard = self._category_brand_leaderboards.get(category_name, LeaderboardIndex())
+            actual = [name for name, _ in leaderboard.top(len(leaderboard))]
+            
+            if actual != expected:
+                mismatches.append(f"brands in {category_name}: leaderboard order differs from full sort")
         
-        # Return top N brands
-        return sorted_brands[:limit]
+        for mismatch in mismatches:
+            logger.warning(f"Leaderboard inconsistency: {mismatch}")
+        
+        return mismatches
     
     def get_category_brands(self, category_name: str) -> List[str]:
         """
@@ -477,44 +896,106 @@ class MemoryVulnerabilityScoreCalculator:
         
         # Save brand scores
         self.brand_scores["brands"] = brands
-        self._save_brand_scores()
+        self._brand_scores_dirty = True
+        self.flush()
         
         return True
         
-    def calculate_all_brand_scores(self, category_name: str) -> List[Dict]:
+    def calculate_all_brand_scores(self, category_name: str, workers: Optional[int] = 1) -> List[Dict]:
         """
         Calculate scores for all brands in a category.
         
         Args:
             category_name: Category name
+            workers: Number of worker processes (None = CPU count, 1 = in-process)
             
         Returns:
             List of brand score details
         """
         brands = self.get_category_brands(category_name)
-        results = []
         
-        for brand in brands:
-            brand_score = self.update_brand_score(brand, category_name)
-            results.append(brand_score)
+        return self.calculate_brand_scores([(brand, category_name) for brand in brands], workers)
+    
+    def calculate_all_category_scores(self, workers: Optional[int] = 1) -> List[Dict]:
+        """
+        Calculate scores for all brands in all competitive categories.
+        
+        Args:
+            workers: Number of worker processes (None = CPU count, 1 = in-process)
+            
+        Returns:
+            List of brand score details, one per (brand, category) pair
+        """
+        pairs = [
+            (brand, category.get("name"))
+            for category in self.categories
+            for brand in category.get("top_brands", [])
+        ]
+        
+        return self.calculate_brand_scores(pairs, workers)
+    
+    def calculate_brand_scores(self, pairs: List[Tuple[str, str]], workers: Optional[int] = 1) -> List[Dict]:
+        """
+        Calculate and record scores for many (brand, category) pairs.
+        
+        Pairs are scored in chunks, in a process pool unless workers is 1.
+        Results are merged here and brand scores and history are saved
+        once for the whole run.
+        
+        Args:
+            pairs: (brand, category) pairs
+            workers: Number of worker processes (None = CPU count, 1 = in-process)
+            
+        Returns:
+            List of brand score details in the same order as pairs
+        """
+        if not pairs:
+            return []
+        
+        competitiveness = {
+            category: self._get_category_competitiveness(category)
+            for category in {category for _, category in pairs}
+        }
+        
+        chunks = [
+            (pairs[i:i + SCORE_CHUNK_SIZE], competitiveness)
+            for i in range(0, len(pairs), SCORE_CHUNK_SIZE)
+        ]
+        
+        if workers == 1 or len(chunks) <= 1:
+            scored = [_score_brand_batch(chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                scored = list(executor.map(_score_brand_batch, chunks))
+        
+        results = [
+            self.update_brand_score(brand, category, score, save=False)
+            for chunk in scored
+            for brand, category, score in chunk
+        ]
+        
+        # Save brand scores and history once for the whole run
+        self.flush()
         
         return results
     
-    def get_score_history(self, entity_name: str, is_brand: bool = True) -> List[Dict]:
+    def get_score_history(self, entity_name: str, is_brand: bool = True,
+                          start: Optional[datetime.datetime] = None,
+                          end: Optional[datetime.datetime] = None) -> List[Dict]:
         """
         Get the score history for a brand or category.
         
         Args:
             entity_name: Brand or category name
             is_brand: Whether the entity is a brand (True) or category (False)
+            start: Optional inclusive start time
+            end: Optional inclusive end time
             
         Returns:
-            List of historical scores
+            List of historical scores, oldest first
         """
-        if is_brand:
-            return self.mvs_history.get("brands", {}).get(entity_name, [])
-        else:
-            return self.mvs_history.get("categories", {}).get(entity_name, [])
+        kind = "brands" if is_brand else "categories"
+        return self.history_store.query(kind, entity_name, start, end)
     
     def get_memory_drift(self, entity_name: str, is_brand: bool = True, days: int = 30) -> float:
         """
@@ -528,29 +1009,8 @@ class MemoryVulnerabilityScoreCalculator:
         Returns:
             Drift amount (-1 to 1, negative means improving, positive means worsening)
         """
-        history = self.get_score_history(entity_name, is_brand)
-        
-        if not history or len(history) < 2:
-            return 0.0  # Not enough data
-        
-        # Filter history to specified time period
-        now = datetime.datetime.now()
-        cutoff = now - datetime.timedelta(days=days)
-        cutoff_str = cutoff.isoformat()
-        
-        recent_history = [h for h in history if h.get("timestamp", "") >= cutoff_str]
-        
-        if not recent_history or len(recent_history) < 2:
-            return 0.0  # Not enough data in time period
-        
-        # Sort by timestamp
-        sorted_history = sorted(recent_history, key=lambda h: h.get("timestamp", ""))
-        
-        # Calculate drift (last score - first score)
-        first_score = sorted_history[0].get("score", 0)
-        last_score = sorted_history[-1].get("score", 0)
-        
-        return last_score - first_score
+        kind = "brands" if is_brand else "categories"
+        return self.history_store.drift(kind, entity_name, days)
 
 
 # Singleton instance
@@ -593,6 +1053,15 @@ def get_category_vulnerability(category_name: str) -> float:
     """
     return get_mvs_calculator().get_category_vulnerability(category_name)
 
+def flush() -> bool:
+    """
+    Save all pending Memory Vulnerability Score changes.
+    
+    Returns:
+        Success flag
+    """
+    return get_mvs_calculator().flush()
+
 def update_category_vulnerability(category_name: str, score: float) -> bool:
     """
     Update the Memory Vulnerability Score for a category.
@@ -657,6 +1126,15 @@ def get_most_vulnerable_brands(limit: int = 10, category: Optional[str] = None)
     """
     return get_mvs_calculator().get_most_vulnerable_brands(limit, category)
 
+def verify_leaderboards() -> List[str]:
+    """
+    Compare the maintained leaderboards against full sorts of the data.
+    
+    Returns:
+        List of mismatch descriptions (empty if consistent)
+    """
+    return get_mvs_calculator().verify_leaderboards()
+
 def get_category_brands(category_name: str) -> List[str]:
     """
     Get all brands in a specific category.
@@ -669,17 +1147,30 @@ def get_category_brands(category_name: str) -> List[str]:
     """
     return get_mvs_calculator().get_category_brands(category_name)
 
-def calculate_all_brand_scores(category_name: str) -> List[Dict]:
+def calculate_all_brand_scores(category_name: str, workers: Optional[int] = 1) -> List[Dict]:
     """
     Calculate scores for all brands in a category.
     
     Args:
         category_name: Category name
+        workers: Number of worker processes (None = CPU count, 1 = in-process)
         
     Returns:
         List of brand score details
     """
-    return get_mvs_calculator().calculate_all_brand_scores(category_name)
+    return get_mvs_calculator().calculate_all_brand_scores(category_name, workers)
+
+def calculate_all_category_scores(workers: Optional[int] = 1) -> List[Dict]:
+    """
+    Calculate scores for all brands in all competitive categories.
+    
+    Args:
+        workers: Number of worker processes (None = CPU count, 1 = in-process)
+        
+    Returns:
+        List of brand score details, one per (brand, category) pair
+    """
+    return get_mvs_calculator().calculate_all_category_scores(workers)
 
 def update_brand_priority(brand_name: str, category_name: str, priority: bool) -> bool:
     """
@@ -695,18 +1186,22 @@ def update_brand_priority(brand_name: str, category_name: str, priority: bool) -
     """
     return get_mvs_calculator().update_brand_priority(brand_name, category_name, priority)
 
-def get_score_history(entity_name: str, is_brand: bool = True) -> List[Dict]:
+def get_score_history(entity_name: str, is_brand: bool = True,
+                      start: Optional[datetime.datetime] = None,
+                      end: Optional[datetime.datetime] = None) -> List[Dict]:
     """
     Get the score history for a brand or category.
     
     Args:
         entity_name: Brand or category name
         is_brand: Whether the entity is a brand (True) or category (False)
+        start: Optional inclusive start time
+        end: Optional inclusive end time
         
     Returns:
-        List of historical scores
+        List of historical scores, oldest first
     """
-    return get_mvs_calculator().get_score_history(entity_name, is_brand)
+    return get_mvs_calculator().get_score_history(entity_name, is_brand, start, end)
 
 def get_memory_drift(entity_name: str, is_brand: bool = True, days: int = 30) -> float:
     """
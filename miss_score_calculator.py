@@ -18,9 +18,13 @@ import os
 import json
 import logging
 import math
+from bisect import bisect_left, insort
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Tuple, Set
 import random
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 
 # Import local modules
 import domain_memory_tracker
@@ -29,6 +33,65 @@ import domain_memory_tracker
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Constants
+RANK_WINDOW_DAYS = 30  # Rank history window used for citation confidence
+SCORE_CHUNK_SIZE = 256  # Domains per worker task in parallel scoring
+HISTORY_DIR = "data/miss_scores"
+HISTORY_PATH = os.path.join(HISTORY_DIR, "history.json")
+HISTORY_FORMAT_VERSION = 2  # Columnar (epochs, scores) per domain
+MAX_HISTORY_SCORES = 52  # Approximately 1 year of weekly scores
+
+# Online drift detector settings
+DRIFT_EWMA_ALPHA = 0.3  # Smoothing factor for the score EWMA
+DRIFT_CUSUM_SLACK = 2.5  # Points of deviation from the EWMA tolerated per score
+DRIFT_CUSUM_THRESHOLD = 10.0  # Accumulated deviation that flags a change point
+
+# Domain-category match bonuses for contextual relevance
+DOMAIN_CATEGORY_MATCHES = {
+    # Tech domains
+    "techcrunch.com": {"Technology": 1.0, "News": 0.8},
+    "wired.com": {"Technology": 1.0, "News": 0.8},
+    "theverge.com": {"Technology": 1.0, "Entertainment": 0.7},
+    
+    # Finance domains
+    "bloomberg.com": {"Finance": 1.0, "News": 0.8},
+    "wsj.com": {"Finance": 1.0, "News": 0.9},
+    
+    # News domains
+    "nytimes.com": {"News": 1.0, "Politics": 0.9},
+    "bbc.com": {"News": 1.0, "Entertainment": 0.7},
+    
+    # Education domains
+    "khanacademy.org": {"Education": 1.0},
+    "coursera.org": {"Education": 1.0},
+    
+    # Add more domain-category matches as needed
+}
+
+# TLD-based contextual relevance heuristics
+TLD_RELEVANCE = {
+    "edu": {"Education": 0.9, "Research": 0.8},
+    "gov": {"Government": 0.9, "Politics": 0.7},
+    "org": {"Education": 0.6, "Healthcare": 0.6, "News": 0.5},
+    "io": {"Technology": 0.7},
+    # Add more TLD-category matches as needed
+}
+
+# Domain-specific SIGNAL scores
+DOMAIN_SIGNAL_SCORES = {
+    # Tech sites often have good structure
+    "techcrunch.com": 0.88,
+    "wired.com": 0.86,
+    "arstechnica.com": 0.87,
+    
+    # News sites vary in quality
+    "nytimes.com": 0.85,
+    "wsj.com": 0.84,
+    "bbc.com": 0.86,
+    
+    # Add more domain-specific scores as needed
+}
+
 class MISSScoreCalculator:
     """
     Calculator for the Model Influence Signal Score (MISS).
@@ -63,49 +126,100 @@ class MISSScoreCalculator:
         
         # Load data if available
         self.score_history = self._load_score_history()
+        
+        # Benchmark aggregates: category (None = all) -> sorted latest scores
+        self._benchmark_scores = {}
+        self._benchmark_sums = {}
+        # Domain -> (latest score, categories) as indexed in the aggregates
+        self._benchmark_entries = {}
+        
+        for domain, history in self.score_history["domains"].items():
+            self._index_latest_score(domain, history)
+        
+        # Memoized components, keyed by (domain, category)
+        self._signal_cache = {}
+        self._relevance_cache = {}
+        
+        # Domain -> (rank version, window expiry, models, categories, result)
+        self._result_cache = {}
     
     def _load_score_history(self) -> Dict:
         """
         Load score history from file.
         
+        Histories in the legacy format (a list of timestamped weekly score
+        entries per domain) are converted to columnar arrays and their drift
+        state is rebuilt.
+        
         Returns:
             Dictionary with score history
         """
-        history_path = "data/miss_scores/history.json"
-        
         try:
             # Create directory if it doesn't exist
-            os.makedirs("data/miss_scores", exist_ok=True)
+            os.makedirs(HISTORY_DIR, exist_ok=True)
             
-            if os.path.exists(history_path):
-                with open(history_path, "r") as f:
-                    return json.load(f)
-            else:
-                # Initialize empty history
-                return {
-                    "domains": {},
-                    "last_updated": datetime.now().isoformat()
-                }
+            if os.path.exists(HISTORY_PATH):
+                with open(HISTORY_PATH, "r") as f:
+                    history = json.load(f)
+                
+                if history.get("format_version") != HISTORY_FORMAT_VERSION:
+                    history = self._migrate_score_history(history)
+                
+                return history
         except Exception as e:
             logger.error(f"Error loading score history: {e}")
-            return {
-                "domains": {},
-                "last_updated": datetime.now().isoformat()
-            }
+        
+        # Initialize empty history
+        return {
+            "format_version": HISTORY_FORMAT_VERSION,
+            "domains": {},
+            "last_updated": datetime.now().isoformat()
+        }
+    
+    def _migrate_score_history(self, legacy: Dict) -> Dict:
+        """
+        Convert a legacy score history to the columnar format.
+        
+        Args:
+            legacy: Score history with weekly_scores entry lists
+            
+        Returns:
+            Columnar score history
+        """
+        domains = {}
+        
+        for domain, legacy_history in legacy.get("domains", {}).items():
+            history = _new_domain_history()
+            
+            for entry in legacy_history.get("weekly_scores", []):
+                _append_score(history, datetime.fromisoformat(entry["timestamp"]).timestamp(),
+                              entry["miss_score"])
+            
+            history["components"] = legacy_history.get("components", [])
+            domains[domain] = history
+        
+        logger.info(f"Migrated score history for {len(domains)} domains to columnar format")
+        
+        return {
+            "format_version": HISTORY_FORMAT_VERSION,
+            "domains": domains,
+            "last_updated": legacy.get("last_updated", datetime.now().isoformat())
+        }
     
     def _save_score_history(self) -> None:
         """Save score history to file."""
-        history_path = "data/miss_scores/history.json"
-        
         try:
             # Update last updated timestamp
             self.score_history["last_updated"] = datetime.now().isoformat()
             
             # Create directory if it doesn't exist
-            os.makedirs("data/miss_scores", exist_ok=True)
+            os.makedirs(HISTORY_DIR, exist_ok=True)
             
-            with open(history_path, "w") as f:
-                json.dump(self.score_history, f, indent=2)
+            # Write to a temporary file and swap it in
+            temp_path = HISTORY_PATH + ".tmp"
+            with open(temp_path, "w") as f:
+                json.dump(self.score_history, f, separators=(",", ":"))
+            os.replace(temp_path, HISTORY_PATH)
                 
             logger.info("Score history saved successfully")
         except Exception as e:
@@ -167,51 +281,29 @@ class MISSScoreCalculator:
         Returns:
             Contextual relevance score (0-1)
         """
+        key = (domain, category)
+        relevance = self._relevance_cache.get(key)
+        
+        if relevance is None:
+            relevance = self._compute_contextual_relevance(domain, category)
+            self._relevance_cache[key] = relevance
+        
+        return relevance
+    
+    def _compute_contextual_relevance(self, domain: str, category: str) -> float:
+        """Compute contextual relevance for a domain and category."""
         # In a production system, we would check if the domain is mentioned in the
         # right context (e.g., a tech company in tech discussions)
         # Here we'll use a simplified approach based on domain TLD and category
         
-        # Extract TLD
-        tld = domain.split(".")[-1].lower()
-        
-        # Domain-category match bonuses
-        domain_category_matches = {
-            # Tech domains
-            "techcrunch.com": {"Technology": 1.0, "News": 0.8},
-            "wired.com": {"Technology": 1.0, "News": 0.8},
-            "theverge.com": {"Technology": 1.0, "Entertainment": 0.7},
-            
-            # Finance domains
-            "bloomberg.com": {"Finance": 1.0, "News": 0.8},
-            "wsj.com": {"Finance": 1.0, "News": 0.9},
-            
-            # News domains
-            "nytimes.com": {"News": 1.0, "Politics": 0.9},
-            "bbc.com": {"News": 1.0, "Entertainment": 0.7},
-            
-            # Education domains
-            "khanacademy.org": {"Education": 1.0},
-            "coursera.org": {"Education": 1.0},
-            
-            # Add more domain-category matches as needed
-        }
-        
         # Check if we have a predefined match
-        if domain in domain_category_matches and category in domain_category_matches[domain]:
-            return domain_category_matches[domain][category]
-        
-        # TLD-based heuristics
-        tld_relevance = {
-            "edu": {"Education": 0.9, "Research": 0.8},
-            "gov": {"Government": 0.9, "Politics": 0.7},
-            "org": {"Education": 0.6, "Healthcare": 0.6, "News": 0.5},
-            "io": {"Technology": 0.7},
-            # Add more TLD-category matches as needed
-        }
+        if domain in DOMAIN_CATEGORY_MATCHES and category in DOMAIN_CATEGORY_MATCHES[domain]:
+            return DOMAIN_CATEGORY_MATCHES[domain][category]
         
         # Check TLD relevance
-        if tld in tld_relevance and category in tld_relevance[tld]:
-            return tld_relevance[tld][category]
+        tld = domain.split(".")[-1].lower()
+        if tld in TLD_RELEVANCE and category in TLD_RELEVANCE[tld]:
+            return TLD_RELEVANCE[tld][category]
         
         # Default: moderate relevance
         return 0.6
@@ -227,26 +319,23 @@ class MISSScoreCalculator:
         Returns:
             SIGNAL score (0-1)
         """
+        key = (domain, category)
+        signal_score = self._signal_cache.get(key)
+        
+        if signal_score is None:
+            signal_score = self._compute_signal_score(domain, category)
+            self._signal_cache[key] = signal_score
+        
+        return signal_score
+    
+    def _compute_signal_score(self, domain: str, category: str) -> float:
+        """Compute the SIGNAL score for a domain and category."""
         # In a production system, we would scrape the domain and analyze its content
         # Here we'll use predefined scores based on domain category
         
         # Check if we have a custom signal score for this domain
-        domain_signal_scores = {
-            # Tech sites often have good structure
-            "techcrunch.com": 0.88,
-            "wired.com": 0.86,
-            "arstechnica.com": 0.87,
-            
-            # News sites vary in quality
-            "nytimes.com": 0.85,
-            "wsj.com": 0.84,
-            "bbc.com": 0.86,
-            
-            # Add more domain-specific scores as needed
-        }
-        
-        if domain in domain_signal_scores:
-            return domain_signal_scores[domain]
+        if domain in DOMAIN_SIGNAL_SCORES:
+            return DOMAIN_SIGNAL_SCORES[domain]
         
         # Use category default with small random variation
         if category in self.default_signal_scores:
@@ -258,6 +347,28 @@ class MISSScoreCalculator:
         # Default score
         return 0.7
     
+    def invalidate_components(self, domain: Optional[str] = None) -> None:
+        """
+        Drop memoized component scores and cached results.
+        
+        Call this when component inputs change (e.g. signal scores or
+        model weights are updated).
+        
+        Args:
+            domain: Optional domain to invalidate (defaults to all domains)
+        """
+        if domain is None:
+            self._signal_cache.clear()
+            self._relevance_cache.clear()
+            self._result_cache.clear()
+            return
+        
+        for cache in (self._signal_cache, self._relevance_cache):
+            for key in [key for key in cache if key[0] == domain]:
+                del cache[key]
+        
+        self._result_cache.pop(domain, None)
+    
     def calculate_miss_score(self, domain: str, models: Optional[List[str]] = None, 
                            categories: Optional[List[str]] = None) -> Dict:
         """
@@ -273,6 +384,28 @@ class MISSScoreCalculator:
         Returns:
             Dictionary with MISS score and components
         """
+        return self.calculate_miss_scores([domain], models, categories)[0]
+    
+    def calculate_miss_scores(self, domains: List[str], models: Optional[List[str]] = None,
+                              categories: Optional[List[str]] = None,
+                              workers: Optional[int] = 1) -> List[Dict]:
+        """
+        Calculate MISS scores for many domains in one batch.
+        
+        Rank windows for all domains are pulled from the memory tracker in
+        one pass. Domains whose ranks have not changed since their last
+        calculation reuse the cached result; the rest are scored together.
+        Every domain gets a score history entry, saved once per batch.
+        
+        Args:
+            domains: Domain names
+            models: Optional list of models to include
+            categories: Optional list of categories to include
+            workers: Number of worker processes (None = CPU count, 1 = in-process)
+            
+        Returns:
+            List of score dictionaries in the same order as domains
+        """
         # Default models and categories if not provided
         if not models:
             models = list(self.model_weights.keys())
@@ -283,107 +416,151 @@ class MISSScoreCalculator:
         # Filter models to those we have weights for
         models = [m for m in models if m in self.model_weights]
         
-        # Initialize scores
-        total_score = 0.0
-        total_weight = 0.0
-        components = []
+        now = time.time()
+        timestamp = datetime.now().isoformat()
+        selection = (tuple(models), tuple(categories))
         
-        # Get domain ranks from memory tracker
-        for model in models:
-            model_weight = self.model_weights[model]
-            
-            for category in categories:
-                # Get ranks for this domain, model and category
-                ranks = []
-                
-                try:
-                    rank_history = domain_memory_tracker.get_rank_history(domain, model, category)
-                    ranks = [entry["rank"] for entry in rank_history if "rank" in entry]
-                except Exception as e:
-                    logger.warning(f"Error getting rank history for {domain}/{model}/{category}: {e}")
-                
-                # Skip if no ranks found
-                if not ranks:
-                    continue
-                
-                # Calculate component scores
-                citation_confidence = self.calculate_citation_confidence(domain, model, ranks)
-                contextual_relevance = self.calculate_contextual_relevance(domain, model, category)
-                signal_score = self.calculate_signal_score(domain, category)
-                
-                # Calculate component score
-                component_score = model_weight * citation_confidence * contextual_relevance * signal_score
-                
-                # Add to total
-                total_score += component_score
-                total_weight += model_weight
-                
-                # Record component details
-                components.append({
-                    "model": model,
-                    "category": category,
-                    "model_weight": model_weight,
-                    "citation_confidence": citation_confidence,
-                    "contextual_relevance": contextual_relevance,
-                    "signal_score": signal_score,
-                    "component_score": component_score
-                })
+        try:
+            windows = domain_memory_tracker.get_rank_windows(domains, RANK_WINDOW_DAYS)
+        except Exception as e:
+            logger.warning(f"Error getting rank windows: {e}")
+            windows = {}
         
-        # Calculate final MISS score (normalized to 0-100)
-        # If no data found, return 0
-        if total_weight == 0:
-            miss_score = 0
-        else:
-            # Normalize to 0-100 scale
-            miss_score = round((total_score / total_weight) * 100)
+        results = {}
+        stale = []
         
-        # Create result
-        result = {
-            "domain": domain,
-            "miss_score": miss_score,
-            "components": components,
-            "timestamp": datetime.now().isoformat(),
-            "models_included": models,
-            "categories_included": categories
-        }
+        for domain in dict.fromkeys(domains):
+            window = windows.get(domain, {"version": None, "expires": None, "series": {}})
+            cached = self._result_cache.get(domain)
+            
+            if (cached and cached[0] == window["version"] and cached[2] == selection
+                    and (cached[1] is None or now < cached[1])):
+                results[domain] = dict(cached[3], timestamp=timestamp)
+            else:
+                stale.append((domain, window))
+        
+        if stale:
+            computed = self._score_windows(stale, models, categories, timestamp, workers)
+            
+            for domain, window in stale:
+                results[domain] = computed[domain]
+                self._result_cache[domain] = (
+                    window["version"], window["expires"], selection, computed[domain]
+                )
         
         # Update score history
-        self._update_score_history(domain, result)
+        for domain in results:
+            self._update_score_history(domain, results[domain], save=False)
+        
+        if results:
+            self._save_score_history()
+        
+        return [results[domain] for domain in domains]
+    
+    def _score_windows(self, windows: List[Tuple[str, Dict]], models: List[str],
+                       categories: List[str], timestamp: str,
+                       workers: Optional[int] = 1) -> Dict[str, Dict]:
+        """
+        Score a batch of domains from their rank windows.
+        
+        Memoized components are resolved here, then domains are scored in
+        chunks, in a process pool unless workers is 1.
+        
+        Args:
+            windows: (domain, rank window) pairs
+            models: Models to include
+            categories: Categories to include
+            timestamp: Timestamp for the results
+            workers: Number of worker processes (None = CPU count, 1 = in-process)
+            
+        Returns:
+            Dictionary of domain -> score dictionary
+        """
+        chunks = []
         
-        return result
+        for i in range(0, len(windows), SCORE_CHUNK_SIZE):
+            chunk = windows[i:i + SCORE_CHUNK_SIZE]
+            relevance = {}
+            signal = {}
+            
+            for domain, window in chunk:
+                for model, category in window["series"]:
+                    if model in self.model_weights and (domain, category) not in signal:
+                        relevance[(domain, category)] = self.calculate_contextual_relevance(domain, model, category)
+                        signal[(domain, category)] = self.calculate_signal_score(domain, category)
+            
+            chunks.append((chunk, models, categories, timestamp, self.model_weights, relevance, signal))
+        
+        if workers == 1 or len(chunks) <= 1:
+            scored = [_score_window_batch(chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                scored = list(executor.map(_score_window_batch, chunks))
+        
+        results = {}
+        for chunk_results in scored:
+            results.update(chunk_results)
+        
+        return results
     
-    def _update_score_history(self, domain: str, result: Dict) -> None:
+    def _update_score_history(self, domain: str, result: Dict, save: bool = True) -> None:
         """
         Update score history for a domain.
         
+        Appends to the domain's (epoch, score) arrays, advances its drift
+        detector and updates the benchmark aggregates.
+        
         Args:
             domain: Domain name
             result: Score result dictionary
+            save: Whether to save score history immediately
         """
         # Initialize domain history if needed
-        if domain not in self.score_history["domains"]:
-            self.score_history["domains"][domain] = {
-                "weekly_scores": [],
-                "components": []
-            }
-        
-        # Add to weekly scores
-        weekly_entry = {
-            "timestamp": result["timestamp"],
-            "miss_score": result["miss_score"]
-        }
+        history = self.score_history["domains"].get(domain)
+        if history is None:
+            history = _new_domain_history()
+            self.score_history["domains"][domain] = history
         
-        # Keep only last 52 weeks (approximately 1 year)
-        self.score_history["domains"][domain]["weekly_scores"].append(weekly_entry)
-        if len(self.score_history["domains"][domain]["weekly_scores"]) > 52:
-            self.score_history["domains"][domain]["weekly_scores"] = \
-                self.score_history["domains"][domain]["weekly_scores"][-52:]
+        _append_score(history, datetime.fromisoformat(result["timestamp"]).timestamp(),
+                      result["miss_score"])
         
         # Update components (overwrite with latest)
-        self.score_history["domains"][domain]["components"] = result["components"]
+        history["components"] = result["components"]
+        
+        self._index_latest_score(domain, history)
         
         # Save score history
-        self._save_score_history()
+        if save:
+            self._save_score_history()
+    
+    def _index_latest_score(self, domain: str, history: Dict) -> None:
+        """
+        Replace a domain's entry in the benchmark aggregates with its latest score.
+        
+        Args:
+            domain: Domain name
+            history: Columnar domain history
+        """
+        previous = self._benchmark_entries.pop(domain, None)
+        
+        if previous is not None:
+            score, categories = previous
+            for key in (None,) + categories:
+                scores = self._benchmark_scores[key]
+                del scores[bisect_left(scores, score)]
+                self._benchmark_sums[key] -= score
+        
+        if not history["scores"]:
+            return
+        
+        score = history["scores"][-1]
+        categories = tuple({comp["category"] for comp in history["components"]})
+        
+        for key in (None,) + categories:
+            insort(self._benchmark_scores.setdefault(key, []), score)
+            self._benchmark_sums[key] = self._benchmark_sums.get(key, 0) + score
+        
+        self._benchmark_entries[domain] = (score, categories)
     
     def get_score_history(self, domain: str, weeks: int = 12) -> Dict:
         """
@@ -406,7 +583,10 @@ class MISSScoreCalculator:
         domain_history = self.score_history["domains"][domain]
         
         # Limit to requested weeks
-        weekly_scores = domain_history["weekly_scores"][-weeks:]
+        weekly_scores = [
+            {"timestamp": datetime.fromtimestamp(epoch).isoformat(), "miss_score": score}
+            for epoch, score in zip(domain_history["epochs"][-weeks:], domain_history["scores"][-weeks:])
+        ]
         
         return {
             "domain": domain,
@@ -418,6 +598,10 @@ class MISSScoreCalculator:
         """
         Detect significant drift in MISS score.
         
+        Reads the drift state maintained as scores are recorded: the change
+        between the last two scores, the score EWMA and the latest CUSUM
+        change point.
+        
         Args:
             domain: Domain name
             threshold: Threshold for significant drift
@@ -432,9 +616,10 @@ class MISSScoreCalculator:
                 "message": "No history available"
             }
         
-        weekly_scores = self.score_history["domains"][domain]["weekly_scores"]
+        history = self.score_history["domains"][domain]
+        scores = history["scores"]
         
-        if len(weekly_scores) < 2:
+        if len(scores) < 2:
             return {
                 "domain": domain,
                 "drift_detected": False,
@@ -442,8 +627,8 @@ class MISSScoreCalculator:
             }
         
         # Get current and previous scores
-        current_score = weekly_scores[-1]["miss_score"]
-        previous_score = weekly_scores[-2]["miss_score"]
+        current_score = scores[-1]
+        previous_score = scores[-2]
         
         # Calculate drift
         drift = current_score - previous_score
@@ -460,6 +645,9 @@ class MISSScoreCalculator:
             direction = "negative"
             message = f"Decline detected: {drift:.1f} points ({drift_pct:.1f}%)"
         
+        state = history["drift"]
+        change_point = state["change_point_epoch"]
+        
         return {
             "domain": domain,
             "drift_detected": drift_detected,
@@ -468,49 +656,70 @@ class MISSScoreCalculator:
             "drift_pct": drift_pct,
             "current_score": current_score,
             "previous_score": previous_score,
+            "ewma": state["ewma"],
+            "ewma_std": math.sqrt(state["ewm_var"]),
+            "change_point_detected": state["change_point_active"],
+            "change_point_direction": state["change_point_direction"],
+            "change_point_timestamp": datetime.fromtimestamp(change_point).isoformat() if change_point else None,
             "message": message if drift_detected else "No significant drift detected",
             "timestamp": datetime.now().isoformat()
         }
     
-    def calculate_all_domains(self, top_n: int = 50) -> List[Dict]:
+    def get_change_points(self) -> List[Dict]:
+        """
+        Get domains whose latest score completed a change point.
+        
+        Returns:
+            List of dictionaries with domain, direction, EWMA and timestamp
+        """
+        return [
+            {
+                "domain": domain,
+                "direction": history["drift"]["change_point_direction"],
+                "ewma": history["drift"]["ewma"],
+                "timestamp": datetime.fromtimestamp(history["drift"]["change_point_epoch"]).isoformat()
+            }
+            for domain, history in self.score_history["domains"].items()
+            if history["drift"]["change_point_active"]
+        ]
+    
+    def calculate_all_domains(self, top_n: int = 50, workers: Optional[int] = 1) -> List[Dict]:
         """
         Calculate MISS scores for top domains.
         
         Args:
             top_n: Number of top domains to include
+            workers: Number of worker processes (None = CPU count, 1 = in-process)
             
         Returns:
             List of score dictionaries
         """
         # Get top domains from memory tracker
         top_domains = domain_memory_tracker.get_top_domains(limit=top_n)
+        domains = [domain_data["domain"] for domain_data in top_domains]
         
-        results = []
-        
-        for domain_data in top_domains:
-            domain = domain_data["domain"]
-            
-            try:
-                score = self.calculate_miss_score(domain)
-                results.append(score)
-            except Exception as e:
-                logger.error(f"Error calculating MISS score for {domain}: {e}")
-        
-        return results
+        try:
+            return self.calculate_miss_scores(domains, workers=workers)
+        except Exception as e:
+            logger.error(f"Error calculating MISS scores: {e}")
+            return []
     
     def get_score_benchmarks(self, category: Optional[str] = None) -> Dict:
         """
         Get score benchmarks across domains.
         
+        Served from sorted latest-score aggregates maintained per category.
+        
         Args:
             category: Optional category filter
             
         Returns:
             Dictionary with benchmark information
         """
-        domains = list(self.score_history["domains"].keys())
+        key = category or None
+        sorted_scores = self._benchmark_scores.get(key)
         
-        if not domains:
+        if not sorted_scores:
             return {
                 "average": 0,
                 "median": 0,
@@ -519,46 +728,173 @@ class MISSScoreCalculator:
                 "count": 0
             }
         
-        # Get latest scores
-        scores = []
-        
-        for domain in domains:
-            weekly_scores = self.score_history["domains"][domain]["weekly_scores"]
-            
-            if weekly_scores:
-                # Check if category filter applies
-                if category:
-                    # Check if any component matches the category
-                    components = self.score_history["domains"][domain]["components"]
-                    category_match = any(
-                        comp["category"] == category for comp in components
-                    )
-                    
-                    if not category_match:
-                        continue
-                
-                scores.append(weekly_scores[-1]["miss_score"])
-        
-        if not scores:
-            return {
-                "average": 0,
-                "median": 0,
-                "top_quartile": 0,
-                "bottom_quartile": 0,
-                "count": 0
-            }
-        
-        # Sort scores
-        sorted_scores = sorted(scores)
-        
         # Calculate benchmarks
         return {
-            "average": sum(scores) / len(scores),
+            "average": self._benchmark_sums[key] / len(sorted_scores),
             "median": sorted_scores[len(sorted_scores) // 2],
             "top_quartile": sorted_scores[int(len(sorted_scores) * 0.75)],
             "bottom_quartile": sorted_scores[int(len(sorted_scores) * 0.25)],
-            "count": len(scores)
+            "count": len(sorted_scores)
+        }
+
+def _new_domain_history() -> Dict:
+    """Create an empty columnar domain history with initial drift state."""
+    return {
+        "epochs": [],
+        "scores": [],
+        "components": [],
+        "drift": {
+            "ewma": None,
+            "ewm_var": 0.0,
+            "cusum_pos": 0.0,
+            "cusum_neg": 0.0,
+            "change_point_epoch": None,
+            "change_point_direction": None,
+            "change_point_active": False
+        }
+    }
+
+def _append_score(history: Dict, epoch: float, score: float) -> None:
+    """
+    Append a score to a columnar domain history and update its drift state.
+    
+    The drift detector keeps an exponentially weighted mean and variance of
+    the score and a two-sided CUSUM of deviations from that mean. A change
+    point is flagged when either CUSUM exceeds DRIFT_CUSUM_THRESHOLD, after
+    which both sums restart.
+    
+    Args:
+        history: Columnar domain history
+        epoch: Score timestamp in epoch seconds
+        score: MISS score
+    """
+    history["epochs"].append(epoch)
+    history["scores"].append(score)
+    
+    # Keep only the most recent scores
+    if len(history["scores"]) > MAX_HISTORY_SCORES:
+        del history["epochs"][:-MAX_HISTORY_SCORES]
+        del history["scores"][:-MAX_HISTORY_SCORES]
+    
+    state = history["drift"]
+    state["change_point_active"] = False
+    
+    if state["ewma"] is None:
+        state["ewma"] = float(score)
+        return
+    
+    deviation = score - state["ewma"]
+    
+    state["cusum_pos"] = max(0.0, state["cusum_pos"] + deviation - DRIFT_CUSUM_SLACK)
+    state["cusum_neg"] = max(0.0, state["cusum_neg"] - deviation - DRIFT_CUSUM_SLACK)
+    
+    if state["cusum_pos"] > DRIFT_CUSUM_THRESHOLD or state["cusum_neg"] > DRIFT_CUSUM_THRESHOLD:
+        state["change_point_direction"] = "positive" if state["cusum_pos"] > state["cusum_neg"] else "negative"
+        state["change_point_epoch"] = epoch
+        state["change_point_active"] = True
+        state["cusum_pos"] = 0.0
+        state["cusum_neg"] = 0.0
+    
+    state["ewma"] += DRIFT_EWMA_ALPHA * deviation
+    state["ewm_var"] = (1 - DRIFT_EWMA_ALPHA) * (state["ewm_var"] + DRIFT_EWMA_ALPHA * deviation * deviation)
+
+def _score_window_batch(args: Tuple) -> Dict[str, Dict]:
+    """
+    Score a chunk of domains from their rank windows.
+    
+    All (domain, model, category) rank series are concatenated into flat
+    arrays so citation confidence and per-domain totals are computed with
+    vectorized segment sums. Runs in worker processes, so all inputs,
+    including the memoized components, are passed in.
+    
+    Args:
+        args: Tuple of (windows, models, categories, timestamp, model_weights,
+              relevance, signal), where windows is a list of (domain, rank
+              window) pairs and relevance/signal map (domain, category) to
+              component scores
+        
+    Returns:
+        Dictionary of domain -> score dictionary
+    """
+    windows, models, categories, timestamp, model_weights, relevance, signal = args
+    
+    # Collect non-empty series in component order
+    keys = []
+    lengths = []
+    flat_ranks = []
+    
+    for domain_idx, (domain, window) in enumerate(windows):
+        series = window["series"]
+        
+        for model in models:
+            for category in categories:
+                ranks = series.get((model, category))
+                if ranks:
+                    keys.append((domain_idx, model, category))
+                    lengths.append(len(ranks))
+                    flat_ranks.extend(ranks)
+    
+    components_by_domain = [[] for _ in windows]
+    totals = np.zeros(len(windows))
+    weights = np.zeros(len(windows))
+    
+    if keys:
+        counts = np.asarray(lengths, dtype=np.float64)
+        segments = np.repeat(np.arange(len(keys)), lengths)
+        ranks = np.asarray(flat_ranks, dtype=np.float64)
+        
+        # Citation confidence components
+        avg_rank = np.bincount(segments, weights=ranks) / counts
+        normalized_rank = np.clip(1 - (avg_rank - 1) / 19, 0, 1)
+        frequency = np.minimum(1.0, counts / 10)
+        
+        deviations = ranks - avg_rank[segments]
+        std_dev = np.sqrt(np.bincount(segments, weights=deviations * deviations) / counts)
+        consistency = np.where(counts > 1, np.clip(1 - std_dev / 10, 0, 1), 0.5)
+        
+        confidence = normalized_rank * 0.5 + frequency * 0.3 + consistency * 0.2
+        
+        model_weight = np.array([model_weights[model] for _, model, _ in keys])
+        relevance_scores = np.array([relevance[(windows[idx][0], category)] for idx, _, category in keys])
+        signal_scores = np.array([signal[(windows[idx][0], category)] for idx, _, category in keys])
+        
+        component_scores = model_weight * confidence * relevance_scores * signal_scores
+        
+        domain_idx = np.array([idx for idx, _, _ in keys])
+        totals = np.bincount(domain_idx, weights=component_scores, minlength=len(windows))
+        weights = np.bincount(domain_idx, weights=model_weight, minlength=len(windows))
+        
+        for i, (idx, model, category) in enumerate(keys):
+            components_by_domain[idx].append({
+                "model": model,
+                "category": category,
+                "model_weight": float(model_weight[i]),
+                "citation_confidence": float(confidence[i]),
+                "contextual_relevance": float(relevance_scores[i]),
+                "signal_score": float(signal_scores[i]),
+                "component_score": float(component_scores[i])
+            })
+    
+    results = {}
+    
+    for idx, (domain, _) in enumerate(windows):
+        # Calculate final MISS score (normalized to 0-100)
+        # If no data found, return 0
+        if weights[idx] == 0:
+            miss_score = 0
+        else:
+            miss_score = round((totals[idx] / weights[idx]) * 100)
+        
+        results[domain] = {
+            "domain": domain,
+            "miss_score": miss_score,
+            "components": components_by_domain[idx],
+            "timestamp": timestamp,
+            "models_included": models,
+            "categories_included": categories
         }
+    
+    return results
 
 # Singleton instance
 _calculator = None
@@ -592,6 +928,23 @@ def calculate_miss_score(domain: str, models: Optional[List[str]] = None,
     """
     return get_calculator().calculate_miss_score(domain, models, categories)
 
+def calculate_miss_scores(domains: List[str], models: Optional[List[str]] = None,
+                          categories: Optional[List[str]] = None,
+                          workers: Optional[int] = 1) -> List[Dict]:
+    """
+    Calculate MISS scores for many domains in one batch.
+    
+    Args:
+        domains: Domain names
+        models: Optional list of models to include
+        categories: Optional list of categories to include
+        workers: Number of worker processes (None = CPU count, 1 = in-process)
+        
+    Returns:
+        List of score dictionaries in the same order as domains
+    """
+    return get_calculator().calculate_miss_scores(domains, models, categories, workers)
+
 def get_score_history(domain: str, weeks: int = 12) -> Dict:
     """
     Get score history for a domain.
@@ -618,17 +971,27 @@ def detect_score_drift(domain: str, threshold: float = 5.0) -> Dict:
     """
     return get_calculator().detect_score_drift(domain, threshold)
 
-def calculate_all_domains(top_n: int = 50) -> List[Dict]:
+def calculate_all_domains(top_n: int = 50, workers: Optional[int] = 1) -> List[Dict]:
     """
     Calculate MISS scores for top domains.
     
     Args:
         top_n: Number of top domains to include
+        workers: Number of worker processes (None = CPU count, 1 = in-process)
         
     Returns:
         List of score dictionaries
     """
-    return get_calculator().calculate_all_domains(top_n)
+    return get_calculator().calculate_all_domains(top_n, workers)
+
+def get_change_points() -> List[Dict]:
+    """
+    Get domains whose latest score completed a change point.
+    
+    Returns:
+        List of dictionaries with domain, direction, EWMA and timestamp
+    """
+    return get_calculator().get_change_points()
 
 def get_score_benchmarks(category: Optional[str] = None) -> Dict:
     """
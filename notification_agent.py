@@ -8,10 +8,17 @@ significant changes in their ranking across LLMs.
 
 import os
 import json
+import queue
+import smtplib
 import logging
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union
+from email.message import EmailMessage
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from requests.adapters import HTTPAdapter
 import domain_memory_tracker
 
 # Setup logging
@@ -21,6 +28,12 @@ logger = logging.getLogger(__name__)
 # Constants
 MAX_ALERTS_PER_BATCH = 10
 NOTIFICATION_COOLDOWN_HOURS = 24  # Don't send repeated alerts for same domain within this period
+DELIVERY_WORKERS = 8  # Concurrent digest deliveries
+DELIVERY_MAX_ATTEMPTS = 3  # Attempts per digest before giving up
+DELIVERY_BACKOFF_SECONDS = 0.5  # Base delay between attempts, doubled each retry
+DELIVERY_TIMEOUT_SECONDS = 10  # HTTP and SMTP socket timeout
+SMTP_POOL_SIZE = 4  # Idle SMTP connections kept open
+SMTP_PASSWORD_ENV = "LLMRANK_SMTP_PASSWORD"  # SMTP password source when not passed to configure_smtp
 
 # File paths
 DATA_DIR = "data/notifications"
@@ -42,6 +55,84 @@ DEFAULT_EMOJI_MAP = {
 }
 
 
+class SMTPConnectionPool:
+    """
+    Small pool of reusable SMTP connections.
+    
+    Connections are checked with NOOP before reuse and replaced if the
+    server has closed them.
+    """
+    
+    def __init__(self, host: str, port: int, username: Optional[str] = None,
+                 password: Optional[str] = None, use_tls: bool = False,
+                 size: int = SMTP_POOL_SIZE):
+        """Initialize the pool. Connections are opened lazily."""
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.idle = queue.LifoQueue(maxsize=size)
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open a new SMTP connection."""
+        conn = smtplib.SMTP(self.host, self.port, timeout=DELIVERY_TIMEOUT_SECONDS)
+        if self.use_tls:
+            conn.starttls()
+        if self.username:
+            conn.login(self.username, self.password or "")
+        return conn
+    
+    def _acquire(self) -> smtplib.SMTP:
+        """Get a live connection from the pool or open a new one."""
+        while True:
+            try:
+                conn = self.idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            
+            try:
+                if conn.noop()[0] == 250:
+                    return conn
+            except smtplib.SMTPException:
+                pass
+            except OSError:
+                pass
+            self._close(conn)
+    
+    def _release(self, conn: smtplib.SMTP):
+        """Return a connection to the pool, closing it if the pool is full."""
+        try:
+            self.idle.put_nowait(conn)
+        except queue.Full:
+            self._close(conn)
+    
+    def _close(self, conn: smtplib.SMTP):
+        """Close a connection, ignoring errors."""
+        try:
+            conn.quit()
+        except Exception:
+            conn.close()
+    
+    def send(self, message: EmailMessage):
+        """Send a message over a pooled connection."""
+        conn = self._acquire()
+        try:
+            conn.send_message(message)
+        except Exception:
+            self._close(conn)
+            raise
+        self._release(conn)
+    
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                self._close(self.idle.get_nowait())
+            except queue.Empty:
+                return
+
+
 class NotificationAgent:
     """
     Handles notifications for significant domain ranking changes across
@@ -64,9 +155,22 @@ class NotificationAgent:
         }
         
         self.notification_history = []  # List of sent notifications
+        self.cooldown_index = {}  # domain -> timestamp of last notification
+        
+        # Delivery resources, reused across checks
+        self.http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=DELIVERY_WORKERS, pool_maxsize=DELIVERY_WORKERS)
+        self.http_session.mount("http://", adapter)
+        self.http_session.mount("https://", adapter)
+        self.smtp_pool = None
+        self.smtp_lock = threading.Lock()
+        self.smtp_password = None  # Kept in memory only, never persisted
         
         # Load existing data if available
         self._load_data()
+        
+        for notification in self.notification_history:
+            self._update_cooldown(notification["domain"], notification["timestamp"])
     
     def _load_data(self):
         """Load existing data from files."""
@@ -138,6 +242,47 @@ class NotificationAgent:
         
         return True
     
+    def configure_smtp(self, host: str, port: int = 25, sender: str = "alerts@llmpagerank.com",
+                       username: Optional[str] = None, password: Optional[str] = None,
+                       use_tls: bool = False):
+        """
+        Configure the SMTP server used for email notifications.
+        
+        Without SMTP configuration, email notifications are only logged.
+        A local stub server (e.g. on localhost:1025) can be used for testing.
+        The password is kept in memory only; without it, LLMRANK_SMTP_PASSWORD
+        is used.
+        
+        Args:
+            host: SMTP host
+            port: SMTP port
+            sender: From address
+            username: Optional login username
+            password: Optional login password (not persisted)
+            use_tls: Whether to upgrade the connection with STARTTLS
+            
+        Returns:
+            Success flag
+        """
+        self.notification_config["smtp"] = {
+            "host": host,
+            "port": port,
+            "sender": sender,
+            "username": username,
+            "use_tls": use_tls
+        }
+        
+        with self.smtp_lock:
+            self.smtp_password = password
+            if self.smtp_pool:
+                self.smtp_pool.close()
+            self.smtp_pool = None
+        
+        self._save_data()
+        logger.info(f"Configured SMTP server {host}:{port}")
+        
+        return True
+    
     def set_notification_threshold(self, threshold: int):
         """
         Set the minimum delta threshold for triggering notifications.
@@ -292,47 +437,80 @@ class NotificationAgent:
         
         return message
     
-    def _send_slack_notification(self, alert: Dict) -> bool:
+    def _format_slack_digest(self, alerts: List[Dict]) -> Dict:
         """
-        Send a Slack notification for an alert.
+        Format several alerts as one Slack message with an attachment per alert.
         
         Args:
-            alert: Alert dictionary
+            alerts: List of alert dictionaries
             
         Returns:
-            Success flag
+            Formatted Slack message dictionary
         """
-        domain = alert["domain"]
+        if len(alerts) == 1:
+            return self._format_slack_message(alerts[0])
         
-        # Get webhook URL for this domain or fall back to default
-        webhook_url = self.notification_config["slack_webhooks"].get(
-            domain, 
+        return {
+            "text": f"*{len(alerts)} domain rank changes detected*",
+            "attachments": [
+                self._format_slack_message(alert)["attachments"][0]
+                for alert in alerts
+            ]
+        }
+    
+    def _get_slack_webhook(self, domain: str) -> Optional[str]:
+        """Get the webhook URL for a domain or fall back to the default."""
+        return self.notification_config["slack_webhooks"].get(
+            domain,
             self.notification_config["slack_webhooks"].get("default")
         )
+    
+    def _post_slack_message(self, webhook_url: str, message: Dict):
+        """
+        Post a message to a Slack webhook over the shared HTTP session.
         
-        if not webhook_url:
-            logger.warning(f"No Slack webhook configured for {domain}")
-            return False
-        
-        # Format message
-        message = self._format_slack_message(alert)
+        Raises:
+            requests.RequestException on connection errors or non-200 responses
+        """
+        response = self.http_session.post(
+            webhook_url,
+            json=message,
+            headers={"Content-Type": "application/json"},
+            timeout=DELIVERY_TIMEOUT_SECONDS
+        )
         
-        try:
-            response = requests.post(
-                webhook_url,
-                json=message,
-                headers={"Content-Type": "application/json"}
+        if response.status_code != 200:
+            raise requests.HTTPError(
+                f"Slack webhook returned {response.status_code}: {response.text}",
+                response=response
             )
+    
+    def _deliver_with_retries(self, send: Callable[[], None], description: str) -> bool:
+        """
+        Run a delivery function, retrying with exponential backoff.
+        
+        Args:
+            send: Function that raises on failure
+            description: Description used in log messages
             
-            if response.status_code == 200:
-                logger.info(f"Sent Slack notification for {domain}")
+        Returns:
+            Success flag
+        """
+        for attempt in range(1, DELIVERY_MAX_ATTEMPTS + 1):
+            try:
+                send()
+                logger.info(f"Sent {description}")
                 return True
-            else:
-                logger.error(f"Failed to send Slack notification: {response.text}")
-                return False
-        except Exception as e:
-            logger.error(f"Error sending Slack notification: {e}")
-            return False
+            except Exception as e:
+                if attempt == DELIVERY_MAX_ATTEMPTS:
+                    logger.error(f"Failed to send {description} after {attempt} attempts: {e}")
+                    return False
+                
+                delay = DELIVERY_BACKOFF_SECONDS * (2 ** (attempt - 1))
+                logger.warning(f"Error sending {description} (attempt {attempt}), retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+        
+        return False
     
     def _format_email_message(self, alert: Dict) -> Dict:
         """
@@ -378,41 +556,165 @@ class NotificationAgent:
             "body": body
         }
     
-    def _send_email_notification(self, alert: Dict) -> bool:
+    def _format_email_digest(self, alerts: List[Dict]) -> Dict:
         """
-        Send an email notification for an alert.
+        Format several alerts as one email message.
         
         Args:
-            alert: Alert dictionary
+            alerts: List of alert dictionaries
             
         Returns:
-            Success flag
+            Formatted email message dictionary
         """
-        # NOTE: In a production system, this would use an email API service
-        # For the prototype, we'll just log the email content
+        if len(alerts) == 1:
+            return self._format_email_message(alerts[0])
         
-        domain = alert["domain"]
+        bodies = [self._format_email_message(alert)["body"] for alert in alerts]
         
-        # Get email recipients for this domain or fall back to default
-        recipients = self.notification_config["email_recipients"].get(
-            domain, 
+        return {
+            "subject": f"LLMPageRank Alert Digest: {len(alerts)} rank changes",
+            "body": "\n<hr>\n".join(bodies)
+        }
+    
+    def _get_email_recipients(self, domain: str) -> List[str]:
+        """Get email recipients for a domain or fall back to the default."""
+        return self.notification_config["email_recipients"].get(
+            domain,
             self.notification_config["email_recipients"].get("default", [])
         )
+    
+    def _get_smtp_pool(self) -> Optional[SMTPConnectionPool]:
+        """Get the shared SMTP pool, creating it from config on first use."""
+        smtp_config = self.notification_config.get("smtp")
+        if not smtp_config:
+            return None
+        
+        with self.smtp_lock:
+            if self.smtp_pool is None:
+                self.smtp_pool = SMTPConnectionPool(
+                    smtp_config["host"],
+                    smtp_config.get("port", 25),
+                    smtp_config.get("username"),
+                    self.smtp_password or os.environ.get(SMTP_PASSWORD_ENV),
+                    smtp_config.get("use_tls", False)
+                )
+            return self.smtp_pool
+    
+    def _send_email(self, recipients: List[str], message: Dict):
+        """
+        Send an email message through the SMTP pool.
+        
+        Without SMTP configuration the message is only logged.
+        
+        Raises:
+            smtplib.SMTPException or OSError on delivery failure
+        """
+        pool = self._get_smtp_pool()
+        
+        if pool is None:
+            # No SMTP server configured; log the email content
+            logger.info(f"Would send email notification to {recipients}:")
+            logger.info(f"Subject: {message['subject']}")
+            logger.info(f"Body: {message['body']}")
+            return
+        
+        email = EmailMessage()
+        email["Subject"] = message["subject"]
+        email["From"] = self.notification_config["smtp"].get("sender", "alerts@llmpagerank.com")
+        email["To"] = ", ".join(recipients)
+        email.set_content(message["body"], subtype="html")
+        
+        pool.send(email)
+    
+    def _build_digests(self, alerts: List[Dict]) -> List[Tuple[str, Union[str, Tuple[str, ...]], List[Dict]]]:
+        """
+        Group alerts into one digest per channel and destination.
+        
+        Args:
+            alerts: List of alert dictionaries
+            
+        Returns:
+            List of (channel, destination, alerts) tuples
+        """
+        channels_enabled = self.notification_config["channels_enabled"]
+        digests = {}
+        
+        for alert in alerts:
+            domain = alert["domain"]
+            
+            if channels_enabled.get("slack", False):
+                webhook_url = self._get_slack_webhook(domain)
+                if webhook_url:
+                    digests.setdefault(("slack", webhook_url), []).append(alert)
+                else:
+                    logger.warning(f"No Slack webhook configured for {domain}")
+            
+            if channels_enabled.get("email", False):
+                recipients = tuple(self._get_email_recipients(domain))
+                if recipients:
+                    digests.setdefault(("email", recipients), []).append(alert)
+                else:
+                    logger.warning(f"No email recipients configured for {domain}")
+        
+        return [(channel, destination, grouped) for (channel, destination), grouped in digests.items()]
+    
+    def _send_digest(self, channel: str, destination: Union[str, Tuple[str, ...]],
+                     alerts: List[Dict]) -> bool:
+        """
+        Deliver one digest with retries.
+        
+        Args:
+            channel: "slack" or "email"
+            destination: Webhook URL or tuple of email recipients
+            alerts: Alerts included in the digest
+            
+        Returns:
+            Success flag
+        """
+        if channel == "slack":
+            message = self._format_slack_digest(alerts)
+            return self._deliver_with_retries(
+                lambda: self._post_slack_message(destination, message),
+                f"Slack digest of {len(alerts)} alerts"
+            )
+        
+        message = self._format_email_digest(alerts)
+        return self._deliver_with_retries(
+            lambda: self._send_email(list(destination), message),
+            f"email digest of {len(alerts)} alerts to {list(destination)}"
+        )
+    
+    def _deliver_alerts(self, alerts: List[Dict]) -> List[Dict]:
+        """
+        Deliver alerts as per-destination digests sent concurrently.
         
-        if not recipients:
-            logger.warning(f"No email recipients configured for {domain}")
-            return False
+        Args:
+            alerts: List of alert dictionaries
+            
+        Returns:
+            Alerts delivered through at least one channel
+        """
+        if not alerts:
+            return []
         
-        # Format message
-        message = self._format_email_message(alert)
+        digests = self._build_digests(alerts)
+        delivered_ids = set()
         
-        # Log email content
-        logger.info(f"Would send email notification for {domain} to {recipients}:")
-        logger.info(f"Subject: {message['subject']}")
-        logger.info(f"Body: {message['body']}")
+        if digests:
+            with ThreadPoolExecutor(max_workers=min(DELIVERY_WORKERS, len(digests))) as executor:
+                outcomes = list(executor.map(lambda digest: self._send_digest(*digest), digests))
+            
+            for (_, _, grouped), success in zip(digests, outcomes):
+                if success:
+                    delivered_ids.update(id(alert) for alert in grouped)
         
-        # In a real implementation, this would use an email API service
-        return True
+        # Dashboard and API notifications are always marked as successful
+        # as they don't involve external services
+        channels_enabled = self.notification_config["channels_enabled"]
+        if channels_enabled.get("dashboard", True) or channels_enabled.get("api", True):
+            return list(alerts)
+        
+        return [alert for alert in alerts if id(alert) in delivered_ids]
     
     def check_for_alerts(self) -> int:
         """
@@ -422,12 +724,7 @@ class NotificationAgent:
             Number of notifications sent
         """
         # Get unnotified alerts
-        alerts = domain_memory_tracker.get_significant_deltas(days=1)
-        
-        unnotified_alerts = [
-            alert for alert in alerts 
-            if not alert.get("notified", False)
-        ]
+        unnotified_alerts = domain_memory_tracker.get_unnotified_alerts(days=1)
         
         if not unnotified_alerts:
             logger.info("No new alerts to notify")
@@ -452,21 +749,18 @@ class NotificationAgent:
         # Limit batch size
         alerts_to_notify = cooldown_filtered_alerts[:MAX_ALERTS_PER_BATCH]
         
-        # Send notifications
-        sent_count = 0
-        alert_ids = []
+        # Send notifications as digests
+        delivered = self._deliver_alerts(alerts_to_notify)
         
-        for alert in alerts_to_notify:
-            success = self._send_notification(alert)
-            
-            if success:
-                # Add to notification history
-                self._record_notification(alert)
-                
-                # Mark as notified
-                alert_ids.append(alert["timestamp"])
-                
-                sent_count += 1
+        # Add to notification history and mark as notified
+        for alert in delivered:
+            self._record_notification(alert, save=False)
+        
+        if delivered:
+            self._save_data()
+        
+        sent_count = len(delivered)
+        alert_ids = [alert["alert_id"] for alert in delivered]
         
         # Update alerts as notified
         if alert_ids:
@@ -490,22 +784,22 @@ class NotificationAgent:
         cooldown_time = datetime.now() - timedelta(hours=NOTIFICATION_COOLDOWN_HOURS)
         cooldown_timestamp = cooldown_time.isoformat()
         
-        # Get domains notified recently
-        recently_notified_domains = set()
-        
-        for notification in self.notification_history:
-            if notification["timestamp"] >= cooldown_timestamp:
-                recently_notified_domains.add(notification["domain"])
-        
-        # Filter alerts
+        # Filter alerts using the per-domain cooldown index
         return [
             alert for alert in alerts
-            if alert["domain"] not in recently_notified_domains
+            if self.cooldown_index.get(alert["domain"], "") < cooldown_timestamp
         ]
     
+    def _update_cooldown(self, domain: str, timestamp: str):
+        """Record the latest notification time for a domain."""
+        if timestamp > self.cooldown_index.get(domain, ""):
+            self.cooldown_index[domain] = timestamp
+    
     def _send_notification(self, alert: Dict) -> bool:
         """
-        Send a notification for an alert through all enabled channels.
+        Send a notification for a single alert through all enabled channels.
+        
+        Delivered as a one-alert digest, the same path as check_for_alerts.
         
         Args:
             alert: Alert dictionary
@@ -513,31 +807,15 @@ class NotificationAgent:
         Returns:
             Success flag (True if sent through at least one channel)
         """
-        channels_enabled = self.notification_config["channels_enabled"]
-        success = False
-        
-        # Send through enabled channels
-        if channels_enabled.get("slack", False):
-            slack_success = self._send_slack_notification(alert)
-            success = success or slack_success
-        
-        if channels_enabled.get("email", False):
-            email_success = self._send_email_notification(alert)
-            success = success or email_success
-        
-        # Dashboard and API notifications are always marked as successful
-        # as they don't involve external services
-        if channels_enabled.get("dashboard", True) or channels_enabled.get("api", True):
-            success = True
-        
-        return success
+        return bool(self._deliver_alerts([alert]))
     
-    def _record_notification(self, alert: Dict):
+    def _record_notification(self, alert: Dict, save: bool = True):
         """
         Record a sent notification in history.
         
         Args:
             alert: Alert dictionary
+            save: Whether to save history immediately
         """
         notification = {
             "timestamp": datetime.now().isoformat(),
@@ -550,12 +828,14 @@ class NotificationAgent:
         }
         
         self.notification_history.append(notification)
+        self._update_cooldown(notification["domain"], notification["timestamp"])
         
         # Trim history (keep last 1000)
         if len(self.notification_history) > 1000:
             self.notification_history = self.notification_history[-1000:]
-            
-        self._save_data()
+        
+        if save:
+            self._save_data()
     
     def get_notification_history(self, domain: Optional[str] = None, 
                               days: int = 7, limit: int = 100) -> List[Dict]:
@@ -630,6 +910,25 @@ def configure_email(email_addresses: List[str], domain: Optional[str] = "default
     """
     return get_agent().configure_email(email_addresses, domain)
 
+def configure_smtp(host: str, port: int = 25, sender: str = "alerts@llmpagerank.com",
+                   username: Optional[str] = None, password: Optional[str] = None,
+                   use_tls: bool = False) -> bool:
+    """
+    Configure the SMTP server used for email notifications.
+    
+    Args:
+        host: SMTP host
+        port: SMTP port
+        sender: From address
+        username: Optional login username
+        password: Optional login password (not persisted)
+        use_tls: Whether to upgrade the connection with STARTTLS
+        
+    Returns:
+        Success flag
+    """
+    return get_agent().configure_smtp(host, port, sender, username, password, use_tls)
+
 def set_notification_threshold(threshold: int) -> bool:
     """
     Set the minimum delta threshold for triggering notifications.
@@ -0,0 +1,532 @@
+"""
+Request Profiler Module
+
+This module provides opt-in request-path profiling for the LLMPageRank FastAPI
+services:
+- Per-route latency histograms keyed by route template
+- 1-in-N statistical profiling: while a sampled request is in flight, a
+  background thread samples the Python stacks of all busy threads
+- Aggregated hot-function tables and collapsed stacks (flamegraph.pl format),
+  attributed to the route whose endpoint is on the stack
+- Admin endpoints to read the profile and toggle profiling at runtime
+
+Profiling is off by default. Set LLMRANK_PROFILING=1 to enable it at startup,
+or enable it on a running server with POST /admin/profile/config. The admin
+endpoints require LLMRANK_PROFILER_TOKEN to be set and sent as X-Admin-Token.
+
+Blocking file I/O shows up as self time of the Python function that issued it,
+since the sampler only sees Python frames.
+"""
+
+import inspect
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from starlette.routing import Match
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Constants
+PROFILING_ENABLED = os.environ.get("LLMRANK_PROFILING", "0") == "1"
+PROFILE_SAMPLE_RATE = int(os.environ.get("LLMRANK_PROFILE_SAMPLE_RATE", "100"))  # Profile 1 in N requests
+PROFILER_TOKEN = os.environ.get("LLMRANK_PROFILER_TOKEN")
+SAMPLE_INTERVAL_SECONDS = 0.005
+MAX_STACK_DEPTH = 64
+MAX_DISTINCT_STACKS = 20000
+HOT_FUNCTION_LIMIT = 50
+LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+UNMATCHED_ROUTE = "(unmatched)"
+UNATTRIBUTED_ROUTE = "(unattributed)"
+
+# Leaf frames of threads that are waiting rather than working (event loop
+# selectors, idle thread-pool workers, the main thread blocked in asyncio.run)
+IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+    ("runners.py", "run"),
+}
+
+
+class RouteHistogram:
+    """Latency histogram for one route."""
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_SECONDS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, latency: float, error: bool = False) -> None:
+        """Record one request latency in seconds."""
+        self.buckets[bisect_left(LATENCY_BUCKETS_SECONDS, latency)] += 1
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+        if error:
+            self.errors += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket containing it."""
+        if not self.count:
+            return None
+
+        target = q * self.count
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS_SECONDS, self.buckets):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+
+        return self.max
+
+    def to_dict(self) -> Dict:
+        """Summarize the histogram."""
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(LATENCY_BUCKETS_SECONDS, self.buckets):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_seconds": self.total / self.count if self.count else 0.0,
+            "max_seconds": self.max,
+            "p50_seconds": self.quantile(0.5),
+            "p95_seconds": self.quantile(0.95),
+            "p99_seconds": self.quantile(0.99),
+            "buckets": buckets
+        }
+
+
+class RequestProfiler:
+    """
+    Per-route latency histograms plus a 1-in-N sampling stack profiler.
+    """
+
+    def __init__(self, enabled: bool = PROFILING_ENABLED, sample_rate: int = PROFILE_SAMPLE_RATE,
+                 interval: float = SAMPLE_INTERVAL_SECONDS):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled: Whether to record anything
+            sample_rate: Profile one in this many requests
+            interval: Seconds between stack samples
+        """
+        self.enabled = enabled
+        self.sample_rate = max(1, sample_rate)
+        self.interval = interval
+
+        self._lock = threading.Lock()
+        self._histograms = defaultdict(RouteHistogram)
+        self._stacks = Counter()  # (route, collapsed stack) -> samples
+        self._labels = {}  # code object -> frame label
+        self._endpoint_routes = {}  # endpoint code object -> route
+        self._route_count = -1
+        self._request_counter = itertools.count(1)
+        self._active = 0
+        self._active_event = threading.Event()
+        self._sampler = None
+        self._started_at = time.time()
+
+        self.requests_profiled = 0
+        self.samples = 0
+        self.dropped_samples = 0
+
+    def configure(self, enabled: Optional[bool] = None, sample_rate: Optional[int] = None) -> Dict:
+        """
+        Change profiling settings at runtime.
+
+        Args:
+            enabled: Enable or disable profiling
+            sample_rate: Profile one in this many requests
+
+        Returns:
+            Current settings
+        """
+        if enabled is not None:
+            self.enabled = enabled
+        if sample_rate is not None:
+            self.sample_rate = max(1, sample_rate)
+
+        logger.info(f"Request profiler {'enabled' if self.enabled else 'disabled'} (1 in {self.sample_rate} requests)")
+
+        return {"enabled": self.enabled, "sample_rate": self.sample_rate}
+
+    def reset(self) -> None:
+        """Drop all recorded histograms and samples."""
+        with self._lock:
+            self._histograms.clear()
+            self._stacks.clear()
+            self.requests_profiled = 0
+            self.samples = 0
+            self.dropped_samples = 0
+            self._started_at = time.time()
+
+    def should_sample(self) -> bool:
+        """Decide whether the next request is profiled."""
+        return next(self._request_counter) % self.sample_rate == 0
+
+    def observe(self, route: str, latency: float, error: bool = False) -> None:
+        """
+        Record a request latency.
+
+        Args:
+            route: Route label, e.g. "GET /domains/{domain}"
+            latency: Latency in seconds
+            error: Whether the request failed
+        """
+        with self._lock:
+            self._histograms[route].observe(latency, error)
+
+    def begin_sample(self) -> None:
+        """Mark a profiled request as in flight, starting the sampler if needed."""
+        with self._lock:
+            self._active += 1
+            self.requests_profiled += 1
+            if self._sampler is None:
+                self._sampler = threading.Thread(target=self._sample_loop, name="request-profiler",
+                                                 daemon=True)
+                self._sampler.start()
+            self._active_event.set()
+
+    def end_sample(self) -> None:
+        """Mark a profiled request as finished."""
+        with self._lock:
+            self._active -= 1
+            if self._active <= 0:
+                self._active = 0
+                self._active_event.clear()
+
+    def register_routes(self, app: FastAPI) -> None:
+        """
+        Map endpoint code objects to route labels so stack samples can be
+        attributed to routes. Cheap when the route table has not changed.
+
+        Args:
+            app: FastAPI application
+        """
+        if len(app.routes) == self._route_count:
+            return
+
+        endpoint_routes = {}
+        for route in app.routes:
+            endpoint = getattr(route, "endpoint", None)
+            code = getattr(inspect.unwrap(endpoint), "__code__", None) if endpoint else None
+            if code is not None:
+                endpoint_routes[code] = route_label(route)
+
+        self._endpoint_routes = endpoint_routes
+        self._route_count = len(app.routes)
+
+    def _sample_loop(self) -> None:
+        """Sample busy thread stacks while profiled requests are in flight."""
+        own_ident = threading.get_ident()
+
+        while True:
+            self._active_event.wait()
+
+            for ident, frame in sys._current_frames().items():
+                if ident != own_ident:
+                    self._record_stack(frame)
+
+            time.sleep(self.interval)
+
+    def _label(self, code) -> str:
+        """Format a frame label as "function (file:line)"."""
+        label = self._labels.get(code)
+
+        if label is None:
+            filename = code.co_filename
+            if filename.startswith(os.getcwd()):
+                filename = os.path.relpath(filename)
+            else:
+                filename = os.path.join(*filename.split(os.sep)[-2:])
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+            self._labels[code] = label
+
+        return label
+
+    def _record_stack(self, frame) -> None:
+        """Add one stack sample unless the thread is idle."""
+        leaf = frame.f_code
+        if (os.path.basename(leaf.co_filename), leaf.co_name) in IDLE_FRAMES:
+            return
+
+        codes = []
+        route = None
+        while frame is not None and len(codes) < MAX_STACK_DEPTH:
+            code = frame.f_code
+            codes.append(code)
+            if route is None:
+                route = self._endpoint_routes.get(code)
+            frame = frame.f_back
+
+        key = (route or UNATTRIBUTED_ROUTE, ";".join(self._label(code) for code in reversed(codes)))
+
+        with self._lock:
+            self.samples += 1
+            if key in self._stacks or len(self._stacks) < MAX_DISTINCT_STACKS:
+                self._stacks[key] += 1
+            else:
+                self.dropped_samples += 1
+
+    def collapsed_stacks(self, route: Optional[str] = None) -> List[Tuple[str, int]]:
+        """
+        Get collapsed stacks, heaviest first.
+
+        Args:
+            route: Only include samples attributed to this route
+
+        Returns:
+            List of (stack, samples); stacks are prefixed with their route
+        """
+        with self._lock:
+            stacks = list(self._stacks.items())
+
+        return sorted(
+            ((f"{stack_route};{stack}", count) for (stack_route, stack), count in stacks
+             if route is None or stack_route == route),
+            key=lambda item: item[1],
+            reverse=True
+        )
+
+    def hot_functions(self, route: Optional[str] = None, limit: int = HOT_FUNCTION_LIMIT) -> Dict:
+        """
+        Aggregate samples into hot-function tables.
+
+        Args:
+            route: Only include samples attributed to this route
+            limit: Maximum rows per table
+
+        Returns:
+            Dictionary with "self" (samples where the function is the leaf) and
+            "total" (samples where the function is anywhere on the stack) tables
+        """
+        with self._lock:
+            stacks = [(stack, count) for (stack_route, stack), count in self._stacks.items()
+                      if route is None or stack_route == route]
+
+        self_counts = Counter()
+        total_counts = Counter()
+        sample_total = 0
+
+        for stack, count in stacks:
+            frames = stack.split(";")
+            sample_total += count
+            self_counts[frames[-1]] += count
+            for label in set(frames):
+                total_counts[label] += count
+
+        def table(counts: Counter) -> List[Dict]:
+            return [
+                {"function": label, "samples": count,
+                 "percent": round(count / sample_total * 100, 2) if sample_total else 0.0}
+                for label, count in counts.most_common(limit)
+            ]
+
+        return {"samples": sample_total, "self": table(self_counts), "total": table(total_counts)}
+
+    def report(self, route: Optional[str] = None, limit: int = HOT_FUNCTION_LIMIT) -> Dict:
+        """
+        Get the full profile.
+
+        Args:
+            route: Only include samples attributed to this route
+            limit: Maximum rows per hot-function table
+
+        Returns:
+            Settings, per-route latency histograms and hot-function tables
+        """
+        with self._lock:
+            routes = {name: histogram.to_dict() for name, histogram in self._histograms.items()
+                      if route is None or name == route}
+            sample_routes = Counter()
+            for (stack_route, _), count in self._stacks.items():
+                sample_routes[stack_route] += count
+            summary = {
+                "enabled": self.enabled,
+                "sample_rate": self.sample_rate,
+                "interval_seconds": self.interval,
+                "since": self._started_at,
+                "requests_profiled": self.requests_profiled,
+                "samples": self.samples,
+                "dropped_samples": self.dropped_samples
+            }
+
+        summary["routes"] = routes
+        summary["samples_by_route"] = dict(sample_routes.most_common())
+        summary["hot_functions"] = self.hot_functions(route, limit)
+
+        return summary
+
+
+def route_label(route) -> str:
+    """Format a route as "METHODS /path/{template}"."""
+    methods = ",".join(sorted(getattr(route, "methods", None) or [])) or "ANY"
+    return f"{methods} {getattr(route, 'path', UNMATCHED_ROUTE)}"
+
+
+def match_route_path(app: FastAPI, scope: Dict) -> Optional[str]:
+    """Find the route template matching a request scope."""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+
+    for route in app.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+
+    return None
+
+
+class ProfilerMiddleware:
+    """
+    ASGI middleware feeding a RequestProfiler. Adds no work to requests while
+    profiling is disabled.
+    """
+
+    def __init__(self, app, profiler: "RequestProfiler"):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        profiler = self.profiler
+
+        if scope["type"] != "http" or not profiler.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        fastapi_app = scope.get("app")
+        if fastapi_app is not None:
+            profiler.register_routes(fastapi_app)
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        sampled = profiler.should_sample()
+        if sampled:
+            profiler.begin_sample()
+
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            latency = time.perf_counter() - start_time
+            if sampled:
+                profiler.end_sample()
+            path = match_route_path(fastapi_app, scope) if fastapi_app is not None else None
+            route = f"{scope['method']} {path}" if path is not None else UNMATCHED_ROUTE
+            profiler.observe(route, latency, status["code"] >= 500)
+
+
+def verify_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    Check the admin token header.
+
+    Raises:
+        HTTPException: If no token is configured or the header does not match
+    """
+    if not PROFILER_TOKEN:
+        raise HTTPException(status_code=403, detail="Profiler admin token not configured")
+
+    if x_admin_token != PROFILER_TOKEN:
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+def create_admin_router(profiler: RequestProfiler) -> APIRouter:
+    """
+    Create the profiler admin endpoints.
+
+    Args:
+        profiler: Profiler to expose
+
+    Returns:
+        Router mounted at /admin/profile
+    """
+    router = APIRouter(prefix="/admin/profile", tags=["admin"],
+                       dependencies=[Depends(verify_admin_token)])
+
+    @router.get("")
+    async def get_profile(route: Optional[str] = None, limit: int = HOT_FUNCTION_LIMIT):
+        """Get per-route latency histograms and hot-function tables."""
+        return profiler.report(route, limit)
+
+    @router.get("/collapsed", response_class=PlainTextResponse)
+    async def get_collapsed_stacks(route: Optional[str] = None):
+        """Get collapsed stacks, one "frame;frame;... samples" line per stack."""
+        return "\n".join(f"{stack} {count}" for stack, count in profiler.collapsed_stacks(route)) + "\n"
+
+    @router.post("/config")
+    async def configure_profiler(enabled: Optional[bool] = None, sample_rate: Optional[int] = None):
+        """Enable or disable profiling, or change the sample rate."""
+        return profiler.configure(enabled, sample_rate)
+
+    @router.post("/reset")
+    async def reset_profile():
+        """Drop recorded histograms and samples."""
+        profiler.reset()
+        return {"status": "reset"}
+
+    return router
+
+
+# Singleton instance shared by all apps in the process
+_profiler = None
+
+
+def get_profiler() -> RequestProfiler:
+    """
+    Get the request profiler instance.
+
+    Returns:
+        Request profiler instance
+    """
+    global _profiler
+
+    if _profiler is None:
+        _profiler = RequestProfiler()
+
+    return _profiler
+
+
+def install_profiler(app: FastAPI, profiler: Optional[RequestProfiler] = None) -> RequestProfiler:
+    """
+    Add the profiler middleware and admin endpoints to an app.
+
+    Args:
+        app: FastAPI application
+        profiler: Profiler to use (defaults to the shared instance)
+
+    Returns:
+        The installed profiler
+    """
+    profiler = profiler or get_profiler()
+
+    app.add_middleware(ProfilerMiddleware, profiler=profiler)
+    app.include_router(create_admin_router(profiler))
+
+    return profiler
@@ -20,6 +20,8 @@ from typing import Dict, List, Optional, Any
 import agents.index_scan as index_scan
 import agents.surface_seed as surface_seed
 import agents.drift_pulse as drift_pulse
+import miss_score_calculator
+import memory_vulnerability_score as mvs
 
 # Configure logging
 logging.basicConfig(
@@ -134,12 +136,61 @@ def run_drift_pulse():
             "error": str(e)
         }
 
-def run_full_indexwide_scan(wait_period: int = 0):
+def run_scoring(workers: int = 1, top_n: int = 1000):
+    """
+    Recalculate MISS and Memory Vulnerability scores.
+    
+    Args:
+        workers: Number of worker processes (0 = CPU count)
+        top_n: Number of top domains to calculate MISS scores for
+    """
+    logger.info("==================== STARTING SCORING ====================")
+    start_time = datetime.datetime.now()
+    workers = workers or None
+    
+    try:
+        miss_scores = miss_score_calculator.calculate_all_domains(top_n, workers=workers)
+        brand_scores = mvs.calculate_all_category_scores(workers=workers)
+        
+        summary = {
+            "domains_scored": len(miss_scores),
+            "brand_scores_updated": len(brand_scores),
+            "workers": workers or os.cpu_count()
+        }
+        logger.info(f"Scoring completed: {summary['domains_scored']} domains, "
+                    f"{summary['brand_scores_updated']} brand scores")
+        
+        end_time = datetime.datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        return {
+            "status": "success",
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "duration_seconds": duration,
+            "summary": summary
+        }
+    except Exception as e:
+        logger.error(f"Error running scoring: {e}")
+        
+        end_time = datetime.datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        return {
+            "status": "error",
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "duration_seconds": duration,
+            "error": str(e)
+        }
+
+def run_full_indexwide_scan(wait_period: int = 0, workers: int = 1):
     """
     Run the full indexwide scan process.
     
     Args:
         wait_period: Time to wait between agents (in seconds)
+        workers: Number of worker processes for scoring (0 = CPU count)
         
     Returns:
         Execution summary
@@ -164,6 +215,9 @@ def run_full_indexwide_scan(wait_period: int = 0):
     # Run DriftPulse-C1
     drift_pulse_result = run_drift_pulse()
     
+    # Recalculate scores
+    scoring_result = run_scoring(workers)
+    
     # Calculate overall statistics
     overall_end_time = datetime.datetime.now()
     overall_duration = (overall_end_time - overall_start_time).total_seconds()
@@ -176,6 +230,7 @@ def run_full_indexwide_scan(wait_period: int = 0):
         "index_scan_result": index_scan_result,
         "surface_seed_result": surface_seed_result,
         "drift_pulse_result": drift_pulse_result,
+        "scoring_result": scoring_result,
         "wait_period_seconds": wait_period
     }
     
@@ -195,6 +250,8 @@ def main():
     parser.add_argument("--index-scan-only", action="store_true", help="Run only the IndexScan agent")
     parser.add_argument("--surface-seed-only", action="store_true", help="Run only the SurfaceSeed agent")
     parser.add_argument("--drift-pulse-only", action="store_true", help="Run only the DriftPulse agent")
+    parser.add_argument("--scoring-only", action="store_true", help="Run only MISS and MVS scoring")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for scoring (0 = CPU count)")
     
     args = parser.parse_args()
     
@@ -204,8 +261,10 @@ def main():
         run_surface_seed()
     elif args.drift_pulse_only:
         run_drift_pulse()
+    elif args.scoring_only:
+        run_scoring(args.workers)
     else:
-        run_full_indexwide_scan(wait_period=args.wait)
+        run_full_indexwide_scan(wait_period=args.wait, workers=args.workers)
     
     logger.info("Process completed")
 
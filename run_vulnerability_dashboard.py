@@ -6,6 +6,7 @@ scores across competitive categories and brands.
 """
 
 import os
+import argparse
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -18,6 +19,20 @@ from typing import Dict, List, Optional, Any
 # Import memory vulnerability score functionality
 import memory_vulnerability_score as mvs
 
+def parse_args():
+    """
+    Parse dashboard options passed after `--` on the streamlit command line,
+    e.g. `streamlit run run_vulnerability_dashboard.py -- --workers 8`.
+    """
+    parser = argparse.ArgumentParser(description="Run the Memory Vulnerability Dashboard")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for brand scoring (0 = CPU count)")
+    args, _ = parser.parse_known_args()
+    return args
+
+ARGS = parse_args()
+SCORING_WORKERS = ARGS.workers or None
+
 # Set page configuration
 st.set_page_config(
     page_title="LLMPageRank Memory Vulnerability Dashboard",
@@ -487,7 +502,7 @@ def analysis_tab():
         if st.button("Run Analysis"):
             with st.spinner(f"Analyzing {len(brands)} brands in {selected_category}..."):
                 # Calculate scores for all brands
-                results = mvs.calculate_all_brand_scores(selected_category)
+                results = mvs.calculate_all_brand_scores(selected_category, workers=SCORING_WORKERS)
                 
                 # Update category vulnerability
                 brand_scores = [r.get("category_scores", {}).get(selected_category, 0) for r in results]
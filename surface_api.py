@@ -11,10 +11,13 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException, Depends, Body, Query, Path
+from fastapi import FastAPI, HTTPException, Depends, Body, Query, Path, Request
 from pydantic import BaseModel, Field
 import uvicorn
 
+from fast_response import ORJSONResponse, SnapshotCache
+from request_profiler import install_profiler
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -31,9 +34,16 @@ CLAIMS_PATH = os.path.join(SURFACE_DATA_DIR, "claims.json")
 app = FastAPI(
     title="LLMPageRank EchoLayer API",
     description="API for the EchoLayer architecture of LLMPageRank",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Opt-in request profiling (see request_profiler.py)
+install_profiler(app)
+
+# Pre-serialized surface listings, rebuilt when the surfaces file changes
+SURFACE_RESPONSE_CACHE = SnapshotCache()
+
 # Pydantic models for request/response validation
 class BrandData(BaseModel):
     name: str = Field(..., description="Brand name")
@@ -223,11 +233,30 @@ async def root():
         "description": "API for the EchoLayer architecture of LLMPageRank"
     }
 
+def surfaces_version():
+    """Get a version token for the surfaces file (its modification time)."""
+    try:
+        return os.stat(BRAND_SURFACES_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+def build_surface_listing():
+    """Build the /surface listing, keeping only SurfaceResponse fields of each surface."""
+    fields = SurfaceResponse.model_fields
+    return [
+        {key: value for key, value in surface.items() if key in fields}
+        for surface in load_surfaces().values()
+    ]
+
 @app.get("/surface", response_model=List[SurfaceResponse])
-async def get_all_surfaces():
+async def get_all_surfaces(request: Request):
     """Get all brand surfaces."""
-    surfaces = load_surfaces()
-    return list(surfaces.values())
+    # Surfaces are written by this service, so the cached body skips
+    # response-model validation of the full list; the builder applies the
+    # model's field filtering itself
+    return SURFACE_RESPONSE_CACHE.respond(
+        request, "surfaces", surfaces_version(), build_surface_listing
+    )
 
 @app.get("/surface/{slug}", response_model=SurfaceResponse)
 async def get_surface(slug: str = Path(..., description="Brand slug")):
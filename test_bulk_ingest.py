@@ -0,0 +1,171 @@
+"""
+Test script for bulk (COPY) insight ingest
+
+Exercises DatabasePool.copy_upsert and the 202 -> job status flow of
+/api/insights/bulk against a real PostgreSQL. The tests are skipped unless
+LLMRANK_TEST_POSTGRES_DSN points at a disposable database; they drop and
+recreate its insights table.
+
+Run with pytest or directly:
+    LLMRANK_TEST_POSTGRES_DSN=postgresql://... python test_bulk_ingest.py
+"""
+
+import asyncio
+import os
+
+import pytest
+
+TEST_DSN = os.environ.get("LLMRANK_TEST_POSTGRES_DSN")
+
+pytestmark = pytest.mark.skipif(not TEST_DSN, reason="LLMRANK_TEST_POSTGRES_DSN not set")
+
+INSIGHTS_TABLE = """
+    CREATE TABLE insights (
+        id TEXT PRIMARY KEY,
+        domain TEXT NOT NULL,
+        content TEXT,
+        quality_score DOUBLE PRECISION,
+        timestamp BIGINT,
+        category TEXT,
+        agent_name TEXT,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    )
+"""
+
+
+async def reset_insights(conn):
+    """Recreate an empty insights table."""
+    await conn.execute("DROP TABLE IF EXISTS insights")
+    await conn.execute(INSIGHTS_TABLE)
+
+
+def make_insights(count, domains=10):
+    """Create count insights spread over a few domains."""
+    return [
+        {
+            "id": f"insight-{i}",
+            "domain": f"domain{i % domains}.com",
+            "content": f"Insight number {i} about the domain",
+            "quality_score": 0.5
+        }
+        for i in range(count)
+    ]
+
+
+def test_copy_upsert_dedupes_and_updates():
+    """copy_upsert inserts new rows, updates conflicts and reports the row count."""
+    import asyncpg
+    from high_performance_api_engine import (
+        DatabasePool, INSIGHT_COLUMNS, INSIGHT_UPDATE_COLUMNS, prepare_insight_records
+    )
+
+    async def run():
+        conn = await asyncpg.connect(TEST_DSN)
+        db_pool = DatabasePool()
+        await db_pool.init_pool(TEST_DSN)
+
+        try:
+            await reset_insights(conn)
+            await conn.execute(
+                "INSERT INTO insights (id, domain, content, quality_score, timestamp) "
+                "VALUES ('insight-0', 'domain0.com', 'Stale content', 0.1, 1)"
+            )
+
+            insights = make_insights(100)
+            insights.append({"id": "insight-1", "domain": "domain1.com",
+                             "content": "Latest duplicate", "quality_score": 0.9})
+            insights.append({"domain": "domain2.com", "content": "Insight without id"})
+
+            # Duplicate ids collapse to the last occurrence; missing ids are generated
+            records = prepare_insight_records(insights)
+            assert len(records) == 101
+
+            written = await db_pool.copy_upsert(
+                "insights", INSIGHT_COLUMNS, records, "id", INSIGHT_UPDATE_COLUMNS
+            )
+            assert written == 101
+            assert await conn.fetchval("SELECT count(*) FROM insights") == 101
+
+            # Existing row updated, duplicate resolved to the last occurrence
+            row = await conn.fetchrow("SELECT content, quality_score FROM insights WHERE id = 'insight-0'")
+            assert row["content"] == "Insight number 0 about the domain"
+            assert row["quality_score"] == 0.5
+
+            row = await conn.fetchrow("SELECT content, quality_score FROM insights WHERE id = 'insight-1'")
+            assert row["content"] == "Latest duplicate"
+            assert row["quality_score"] == 0.9
+
+            # Re-ingesting the same batch updates in place
+            written = await db_pool.copy_upsert(
+                "insights", INSIGHT_COLUMNS, records, "id", INSIGHT_UPDATE_COLUMNS
+            )
+            assert written == 101
+            assert await conn.fetchval("SELECT count(*) FROM insights") == 101
+        finally:
+            await db_pool.pool.close()
+            await conn.close()
+
+    asyncio.run(run())
+
+
+def test_bulk_endpoint_job_status():
+    """POST /api/insights/bulk returns 202 and the job can be polled to completion."""
+    import asyncpg
+    import httpx
+    from high_performance_api_engine import HighPerformanceAPI
+
+    async def run():
+        conn = await asyncpg.connect(TEST_DSN)
+        engine = HighPerformanceAPI()
+        await engine.db_pool.init_pool(TEST_DSN)
+        app = engine.create_app()
+        engine.bulk_ingestor.start()
+
+        try:
+            await reset_insights(conn)
+
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/api/insights/bulk", json={"insights": make_insights(500)})
+                assert response.status_code == 202
+
+                accepted = response.json()
+                assert accepted["status"] == "accepted"
+                assert accepted["received"] == 500
+
+                for _ in range(200):
+                    job = (await client.get(accepted["status_url"])).json()
+                    if job["status"] not in ("queued", "running"):
+                        break
+                    await asyncio.sleep(0.05)
+
+                assert job["status"] == "completed", job
+                assert job["processed"] == 500
+                assert job["domains"] == 10
+
+                missing = await client.get("/api/insights/bulk/unknown-job")
+                assert missing.status_code == 404
+
+            assert await conn.fetchval("SELECT count(*) FROM insights") == 500
+        finally:
+            await engine.bulk_ingestor.stop()
+            await engine.db_pool.pool.close()
+            await conn.close()
+
+    asyncio.run(run())
+
+
+def run_all_tests():
+    """Run all tests."""
+    if not TEST_DSN:
+        print("LLMRANK_TEST_POSTGRES_DSN not set; skipping bulk ingest tests")
+        return
+
+    test_copy_upsert_dedupes_and_updates()
+    test_bulk_endpoint_job_status()
+
+    print("\n=== All Bulk Ingest Tests Passed ===\n")
+
+
+if __name__ == "__main__":
+    run_all_tests()
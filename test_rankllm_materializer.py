@@ -0,0 +1,98 @@
+"""
+Test script for the RankLLM leaderboard materializer
+
+Checks that rebuilding the leaderboard from unchanged inputs publishes no
+new version, that invalidating a domain does, that deltas have their own
+ETag, and that reads never rebuild an existing snapshot on the request path.
+
+Run with pytest or directly:
+    python test_rankllm_materializer.py
+"""
+
+import os
+import tempfile
+
+import mcp_dispatcher
+from mcp_dispatcher import RankLLMMaterializer
+
+
+def make_materializer():
+    """Create a materializer backed by the dispatcher's builder and a temp snapshot."""
+    dispatcher = mcp_dispatcher.get_mcp_dispatcher()
+    snapshot_path = os.path.join(tempfile.mkdtemp(), "leaderboard_snapshot.json")
+    return dispatcher, RankLLMMaterializer(dispatcher._load_rankllm_data, snapshot_path)
+
+
+def test_unchanged_input_keeps_version():
+    """Rebuilding from unchanged inputs keeps the version and ETag."""
+    dispatcher, materializer = make_materializer()
+
+    assert materializer.refresh(force=True)
+    version, etag = materializer.version, materializer.etag
+
+    # Expire cached domain contexts; the rebuilt entries must not change
+    dispatcher._domain_data_cache.clear()
+
+    assert not materializer.refresh(force=True)
+    assert materializer.version == version
+    assert materializer.etag == etag
+    assert materializer.delta(version)["entries"] == []
+
+
+def test_invalidated_domain_publishes_version():
+    """Invalidating a leaderboard domain publishes a version that includes it."""
+    dispatcher, materializer = make_materializer()
+    materializer.refresh(force=True)
+    version = materializer.version
+
+    dispatcher.invalidate_domain("stripe.com")
+
+    assert materializer.refresh(force=True)
+    assert materializer.version == version + 1
+
+    delta = materializer.delta(version)
+    assert not delta["full"]
+    assert "stripe.com" in [entry["domain"] for entry in delta["entries"]]
+
+
+def test_delta_etag_differs_from_snapshot():
+    """Deltas carry their own stable ETag, distinct from the snapshot's."""
+    _, materializer = make_materializer()
+    materializer.refresh(force=True)
+    version = materializer.version
+
+    delta = materializer.delta(version - 1)
+    assert delta["etag"] != materializer.etag
+    assert delta["etag"] == materializer.delta(version - 1)["etag"]
+    assert delta["etag"] != materializer.delta(version)["etag"]
+
+
+def test_get_serves_stale_snapshot():
+    """Reads serve the current snapshot and leave rebuilds to the refresher."""
+    _, materializer = make_materializer()
+
+    built = []
+    builder = materializer.builder
+    materializer.builder = lambda: built.append(1) or builder()
+
+    # No snapshot yet: the first read builds synchronously
+    first = materializer.get()
+    assert len(built) == 1
+
+    materializer.mark_dirty()
+    assert materializer.get()["etag"] == first["etag"]
+    assert len(built) == 1
+
+
+def run_all_tests():
+    """Run all tests."""
+    test_unchanged_input_keeps_version()
+    test_invalidated_domain_publishes_version()
+    test_delta_etag_differs_from_snapshot()
+    test_get_serves_stale_snapshot()
+
+    print("\n=== All RankLLM Materializer Tests Passed ===\n")
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -3,7 +3,7 @@ Unified LLMRank.io API Server
 Single, clear endpoint with access to ALL domains from your crawling blitz
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Security
+from fastapi import FastAPI, HTTPException, Depends, Security, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 import json
@@ -15,13 +15,17 @@ from pydantic import BaseModel
 import sqlite3
 import psycopg2
 
+from fast_response import ORJSONResponse, SnapshotCache
+from request_profiler import install_profiler
+
 # Initialize FastAPI app
 app = FastAPI(
     title="LLMRank.io Unified API",
     description="Complete access to ALL your competitive intelligence domains",
     version="3.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware - FULL access for frontend
@@ -33,12 +37,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Opt-in request profiling (see request_profiler.py)
+install_profiler(app)
+
 # Security
 security = HTTPBearer(auto_error=False)
 
 # Valid API key
 VALID_API_KEY = "mcp_81b5be8a0aeb934314741b4c3f4b9436"
 
+# Listing responses are served from pre-serialized snapshots for this long
+SNAPSHOT_TTL_SECONDS = 30
+RESPONSE_CACHE = SnapshotCache(ttl=SNAPSHOT_TTL_SECONDS)
+
 def verify_api_key(credentials: HTTPAuthorizationCredentials = Security(security)) -> bool:
     """Verify API key for access."""
     if not credentials:
@@ -156,28 +167,33 @@ async def root():
 
 @app.get("/domains")
 async def get_all_domains(
+    request: Request,
     limit: int = 500,
     category: Optional[str] = None,
     authenticated: bool = Depends(verify_api_key)
 ):
     """Get ALL domains from your crawling blitz - no more 41 domain limit!"""
     
-    domains = get_all_domains_from_database()
-    
-    # Filter by category if specified
-    if category:
-        domains = [d for d in domains if d['category'].lower() == category.lower()]
+    def build():
+        domains = get_all_domains_from_database()
+        
+        # Filter by category if specified
+        if category:
+            domains = [d for d in domains if d['category'].lower() == category.lower()]
+        
+        # Apply limit
+        domains = domains[:limit]
+        
+        return {
+            "total_domains": len(domains),
+            "limit": limit,
+            "category_filter": category,
+            "domains": domains,
+            "message": f"Access to {len(domains)} domains from your crawling blitz"
+        }
     
-    # Apply limit
-    domains = domains[:limit]
-    
-    return {
-        "total_domains": len(domains),
-        "limit": limit,
-        "category_filter": category,
-        "domains": domains,
-        "message": f"Access to {len(domains)} domains from your crawling blitz"
-    }
+    key = ("domains", limit, category.lower() if category else None)
+    return RESPONSE_CACHE.get(key, None, build).response(request)
 
 @app.get("/domain/{domain}")
 async def get_domain_details(
@@ -214,9 +230,12 @@ async def get_domain_details(
     return response
 
 @app.get("/categories")
-async def get_categories(authenticated: bool = Depends(verify_api_key)):
+async def get_categories(request: Request, authenticated: bool = Depends(verify_api_key)):
     """Get category overview with domain counts."""
-    
+    return RESPONSE_CACHE.get("categories", None, build_category_overview).response(request)
+
+def build_category_overview() -> List[Dict]:
+    """Build the category overview from the domain database."""
     domains = get_all_domains_from_database()
     categories = {}
     